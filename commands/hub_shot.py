@@ -1,13 +1,28 @@
 import math
+import weakref
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
 import ntcore
+import numpy as np
 from commands2 import Command, cmd
 from ntcore import NetworkTableInstance
 from pathplannerlib.controller import PPHolonomicDriveController
-from wpilib import DriverStation, Timer
+from wpilib import DataLogManager, DriverStation, Timer, getDeployDirectory
 from wpimath.geometry import Pose2d, Rotation2d, Translation2d
 
+from modules.feed_cadence import DipBoost, FeedCadence
+from modules.nt_batch import BatchedPublisher
+from modules.shot_map import MONOTONE, ShotMap
+from modules.shot_zone import ShotZoneMap
+from subsystems.hood import MAX_ROTATIONS as HOOD_MAX_TURNS
+from subsystems.hood import MIN_ROTATIONS as HOOD_MIN_TURNS
+from subsystems.shooter import MAX_RPM as SHOOTER_MAX_RPM
+
 # Field dimensions: 651.22 × 317.69 inches
 FIELD_LENGTH_M = 651.22 * 0.0254  # 16.541 m
+FIELD_WIDTH_M = 317.69 * 0.0254  # 8.069 m
 HUB_X_M = 182.11 * 0.0254  # 4.626 m from alliance wall
 HUB_Y_M = 158.84 * 0.0254  # 4.035 m — centered widthwise
 
@@ -20,26 +35,52 @@ _FLYWHEEL_CIRCUMFERENCE = math.pi * _FLYWHEEL_DIAMETER_M
 _GEAR_RATIO = 1.3  # motor:flywheel
 _SLIP_FACTOR = 0.1  # TUNE via NT "Shoot/Slip Factor"
 _LOOKAHEAD_S = 0.05  # 50ms pose prediction to compensate for control loop latency
-_ITERATIONS = 2  # converge virtual distance ↔ RPM
-
-
-def _linreg(xs: list[float], ys: list[float]) -> tuple[float, float]:
-    """Least-squares linear regression. Returns (slope, intercept)."""
-    n = len(xs)
-    sx = sum(xs)
-    sy = sum(ys)
-    sxx = sum(x * x for x in xs)
-    sxy = sum(x * y for x, y in zip(xs, ys))
-    slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
-    intercept = (sy - slope * sx) / n
-    return slope, intercept
+_ITERATIONS = 2  # fixed-point steps for SOLVER_FIXED
+_HALF_TURN = Rotation2d(math.pi)  # Blue-to-red operator perspective
+
+# Lookup grid over (raw distance, radial closing speed, tangential speed) — see BallisticsGrid
+_GRID_MIN_DISTANCE_M = 0.5
+_GRID_MAX_DISTANCE_M = 9.0
+_GRID_DISTANCE_STEP_M = 0.25
+_GRID_MAX_CLOSING_SPEED = 5.0  # m/s, both directions (+ = toward hub)
+_GRID_MAX_TANGENTIAL_SPEED = 5.0  # m/s, either side (the solution only depends on its magnitude)
+_GRID_SPEED_STEP = 0.25
+_GRID_SHOT_STEP_M = 0.01  # shot map resampled for O(1) lookups, linear between samples
+_GRID_SHOT_MAX_DISTANCE_M = 12.0  # virtual distances past this use SHOT_MAP.evaluate()
+_GRID_TOLERANCE_S = 1e-2  # TUNE — residual an interpolated flight time may keep (~2 cm of lead at 2 m/s)
+
+# Moving-shot solver — NT "VirtualGoal/Solver" picks one
+SOLVER_GRID = "grid"  # interpolated grid flight time, Newton-refined only where it misses the tolerance
+SOLVER_NEWTON = "newton"  # Newton from a fixed-point seed
+SOLVER_FIXED = "fixed"  # legacy: _ITERATIONS fixed-point steps, no convergence check
+_SOLVER_TOLERANCE_S = 1e-4  # flight-time residual
+_SOLVER_MAX_EVALUATIONS = 8  # ballistics evaluations per solve
+
+# Shot map — TuneShot appends calibration points here; picked up without a restart
+SHOT_LOG_PATH = Path("/home/lvuser/shot_tuning.csv")
+SHOT_MAP_INTERPOLATION = MONOTONE  # or LINEAR
+_SHOT_MAP_CHECK_LOOPS = 50  # ~1 s between CSV mtime checks
+
+# Shot zones — field cells a stationary shot can be made from (tools/shot_heatmap.py)
+SHOT_ZONE_PATH = Path(getDeployDirectory()) / "shot_zones.bin"
+SHOT_ZONE_RESOLUTION_M = 0.1
+_ZONE_EXTRAPOLATION_M = 0.5  # TUNE — trust the shot map this far past the outermost calibration point
+_ZONE_HOOD_TOLERANCE = 1e-3  # turns — interpolation noise at the hood soft limits
+
+# Ready-to-fire gating — HubShot feeds once every check holds for READY_CONFIRM_LOOPS loops
+READY_RPM_TOLERANCE = 75.0  # shooter RPM  # TUNE
+READY_KICKER_TOLERANCE = 150.0  # kicker RPM, closed-loop mode  # TUNE
+READY_KICKER_MIN_RPM = 3000.0  # kicker RPM, full duty-cycle mode  # TUNE
+READY_HOOD_TOLERANCE = 0.1  # hood motor turns  # TUNE
+READY_HEADING_TOLERANCE_RAD = math.radians(3.0)  # TUNE
+READY_CONFIRM_LOOPS = 3  # ~60 ms at 20 ms loop
 
 
 def _rpm_to_exit_velocity(rpm: float, slip: float) -> float:
     return rpm * _GEAR_RATIO * _FLYWHEEL_CIRCUMFERENCE / 60.0 * slip
 
 
-# ── Ballistics (linear regression from calibration data) ──────────────
+# ── Ballistics (interpolated shot map from calibration data) ───────────
 
 # Calibration data: (distance_meters, hood_motor_turns, shooter_rpm)
 SHOT_TABLE: list[tuple[float, float, int]] = [
@@ -49,14 +90,381 @@ SHOT_TABLE: list[tuple[float, float, int]] = [
     (5.26, 1.0, 2840),
 ]
 
-_dists = [d for d, _, _ in SHOT_TABLE]
-_RPM_SLOPE, _RPM_INTERCEPT = _linreg(_dists, [r for _, _, r in SHOT_TABLE])
-_HOOD_SLOPE, _HOOD_INTERCEPT = _linreg(_dists, [h for _, h, _ in SHOT_TABLE])
+SHOT_MAP = ShotMap(SHOT_TABLE, SHOT_MAP_INTERPOLATION, SHOT_LOG_PATH)
 
 
 def compute_ballistics(distance: float) -> tuple[float, float]:
     """Returns (shooter_rpm, hood_turns) for a given distance."""
-    return _RPM_SLOPE * distance + _RPM_INTERCEPT, _HOOD_SLOPE * distance + _HOOD_INTERCEPT
+    return SHOT_MAP.evaluate(distance)
+
+
+def max_shot_distance() -> float:
+    """Farthest distance the shot map is trusted to (same limit as the shot zones)."""
+    return SHOT_MAP.points[-1][0] + _ZONE_EXTRAPOLATION_M
+
+
+def limit_shot(distance: float) -> tuple[float, float, float]:
+    """(distance, rpm, hood_turns) clamped to the shot map range and the shooter's top speed."""
+    distance = min(distance, max_shot_distance())
+    rpm, hood = compute_ballistics(distance)
+    return distance, min(rpm, SHOOTER_MAX_RPM), hood
+
+
+def solve_flight_time(
+    dx: float, dy: float, field_vx: float, field_vy: float, slip: float, seed: float | None = None
+) -> tuple[float, float, float, float, int, float]:
+    """Newton solve of the time-of-flight equation for a moving shot.
+
+    (dx, dy) is the hub relative to the (predicted) robot, (field_vx, field_vy) the field
+    velocity. Finds t with t = D / exit_velocity(rpm(|d - v·t|)), starting from seed
+    (one fixed-point step from the raw distance if None) until |residual| < _SOLVER_TOLERANCE_S.
+
+    If the solve has not converged after _SOLVER_MAX_EVALUATIONS, falls back to the legacy
+    estimate — _ITERATIONS fixed-point steps from the raw distance — so the shot still leads;
+    the returned evaluations then exceed _SOLVER_MAX_EVALUATIONS and the residual is still the
+    Newton residual. Distance and RPM are clamped with limit_shot().
+
+    Returns (flight_time, virtual_distance, rpm, hood_turns, evaluations, residual_s).
+    """
+    raw_distance = math.hypot(dx, dy)
+    ev_per_rpm = _rpm_to_exit_velocity(1.0, slip)
+    v_dot_d = dx * field_vx + dy * field_vy
+    v_sq = field_vx * field_vx + field_vy * field_vy
+
+    evaluations = 0
+    if seed is None:
+        rpm, _ = compute_ballistics(raw_distance)
+        seed = raw_distance / (ev_per_rpm * rpm)
+        evaluations += 1
+
+    t = seed
+    while True:
+        ex = dx - field_vx * t
+        ey = dy - field_vy * t
+        distance = math.hypot(ex, ey)
+        rpm, hood = compute_ballistics(distance)
+        evaluations += 1
+        exit_velocity = ev_per_rpm * rpm
+        residual = t - raw_distance / exit_velocity
+        if abs(residual) < _SOLVER_TOLERANCE_S:
+            if distance > max_shot_distance() or rpm > SHOOTER_MAX_RPM:
+                distance, rpm, hood = limit_shot(distance)
+            return t, distance, rpm, hood, evaluations, residual
+        if evaluations >= _SOLVER_MAX_EVALUATIONS:
+            t = 0.0
+            for _ in range(_ITERATIONS):
+                rpm, _ = compute_ballistics(math.hypot(dx - field_vx * t, dy - field_vy * t))
+                t = raw_distance / (ev_per_rpm * rpm)
+            distance = math.hypot(dx - field_vx * t, dy - field_vy * t)
+            return (t, *limit_shot(distance), evaluations + _ITERATIONS + 1, residual)
+
+        # f(t) = t·ev(rpm(s(t))) - D,  f'(t) = ev + t·ev'·rpm'(s)·s'(t)
+        ds_dt = (t * v_sq - v_dot_d) / distance if distance > 1e-6 else 0.0
+        f_prime = exit_velocity + t * ev_per_rpm * SHOT_MAP.rpm_slope(distance) * ds_dt
+        if f_prime > 1e-6:
+            t -= (t * exit_velocity - raw_distance) / f_prime
+        else:
+            t = raw_distance / exit_velocity  # fixed-point step
+
+
+def _solve_flight_time_many(dx, dy, field_vx, field_vy, slip: float):
+    """Vectorized solve_flight_time() without its fallback and limits.
+
+    Returns (flight_time, distance, rpm, hood_turns, converged) arrays; elements that did not
+    converge within _SOLVER_MAX_EVALUATIONS hold their last iterate.
+    """
+    raw_distance = np.hypot(dx, dy)
+    ev_per_rpm = _rpm_to_exit_velocity(1.0, slip)
+    rpm, hood = SHOT_MAP.evaluate_many(raw_distance)
+    distance = raw_distance.copy()
+    converged = np.zeros(raw_distance.shape, dtype=bool)
+
+    # Newton on the still-unconverged subset; converged elements keep their last evaluation
+    active = np.arange(raw_distance.size)
+    flight_time = raw_distance / (ev_per_rpm * rpm)
+    evaluations = 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while active.size:
+            t = flight_time[active]
+            adx, ady, avx, avy = dx[active], dy[active], field_vx[active], field_vy[active]
+            d = np.hypot(adx - avx * t, ady - avy * t)
+            r, h = SHOT_MAP.evaluate_many(d)
+            evaluations += 1
+            distance[active], rpm[active], hood[active] = d, r, h
+            exit_velocity = ev_per_rpm * r
+            residual = t - raw_distance[active] / exit_velocity
+            step = np.abs(residual) >= _SOLVER_TOLERANCE_S
+            converged[active[~step]] = True
+            if evaluations >= _SOLVER_MAX_EVALUATIONS:
+                break
+            active, t, d, r, exit_velocity = active[step], t[step], d[step], r[step], exit_velocity[step]
+            adx, ady, avx, avy = adx[step], ady[step], avx[step], avy[step]
+
+            v_dot_d = adx * avx + ady * avy
+            v_sq = avx * avx + avy * avy
+            ds_dt = np.where(d > 1e-6, (t * v_sq - v_dot_d) / d, 0.0)
+            f_prime = exit_velocity + t * ev_per_rpm * SHOT_MAP.rpm_slope_many(d) * ds_dt
+            raw = raw_distance[active]
+            flight_time[active] = np.where(f_prime > 1e-6, t - (t * exit_velocity - raw) / f_prime, raw / exit_velocity)
+    return flight_time, distance, rpm, hood, converged
+
+
+@dataclass
+class BallisticsBatch:
+    """Results of solve_virtual_goal_batch(), shaped like the broadcast inputs."""
+
+    aim: np.ndarray  # field-absolute aim angle (rad)
+    angular_ff: np.ndarray  # heading rate feedforward (rad/s)
+    rpm: np.ndarray
+    hood_turns: np.ndarray
+    flight_time: np.ndarray
+    virtual_distance: np.ndarray
+
+
+def solve_virtual_goal_batch(
+    x,
+    y,
+    field_vx,
+    field_vy,
+    hub: Translation2d = BLUE_HUB,
+    slip: float = _SLIP_FACTOR,
+    lookahead_s: float = _LOOKAHEAD_S,
+) -> BallisticsBatch:
+    """Virtual-goal solution for many robot positions and field velocities at once.
+
+    Pure function of its arguments (no drivetrain, no NT) for auto planning and shot-zone
+    plots. Inputs broadcast against each other. Runs the same lookahead, Newton steps, stopping
+    rule, fallback and limits as VirtualGoal with SOLVER_NEWTON, so each element matches the
+    scalar path.
+    """
+    x, y, vx, vy = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (x, y, field_vx, field_vy)))
+    shape = x.shape
+    x, y, vx, vy = x.ravel(), y.ravel(), vx.ravel(), vy.ravel()
+
+    pred_x = x + vx * lookahead_s
+    pred_y = y + vy * lookahead_s
+    dx = hub.X() - pred_x
+    dy = hub.Y() - pred_y
+    raw_distance = np.hypot(dx, dy)
+
+    # Too close to the hub: aim straight at it, no lead (same as VirtualGoal)
+    rpm, hood = SHOT_MAP.evaluate_many(raw_distance)
+    flight_time = np.zeros_like(raw_distance)
+    distance = raw_distance.copy()
+
+    moving = np.flatnonzero(raw_distance >= 0.5)
+    t, d, r, h, converged = _solve_flight_time_many(dx[moving], dy[moving], vx[moving], vy[moving], slip)
+    flight_time[moving], distance[moving], rpm[moving], hood[moving] = t, d, r, h
+
+    # Not converged: fixed-point estimate, as in solve_flight_time()
+    failed = moving[~converged]
+    if failed.size:
+        fdx, fdy, fvx, fvy = dx[failed], dy[failed], vx[failed], vy[failed]
+        t = np.zeros(failed.size)
+        for _ in range(_ITERATIONS):
+            r, _ = SHOT_MAP.evaluate_many(np.hypot(fdx - fvx * t, fdy - fvy * t))
+            t = raw_distance[failed] / (_rpm_to_exit_velocity(1.0, slip) * r)
+        flight_time[failed] = t
+        distance[failed] = np.hypot(fdx - fvx * t, fdy - fvy * t)
+        rpm[failed], hood[failed] = SHOT_MAP.evaluate_many(distance[failed])
+
+    vdx = dx - vx * flight_time
+    vdy = dy - vy * flight_time
+    with np.errstate(divide="ignore", invalid="ignore"):
+        angular_ff = np.where(raw_distance >= 0.5, (vdx * vy - vdy * vx) / (vdx * vdx + vdy * vdy), 0.0)
+
+    # Clamp to what the shooter can do (limit_shot())
+    far = distance > max_shot_distance()
+    if far.any():
+        distance[far] = max_shot_distance()
+        rpm[far], hood[far] = SHOT_MAP.evaluate_many(distance[far])
+    np.minimum(rpm, SHOOTER_MAX_RPM, out=rpm)
+
+    return BallisticsBatch(
+        aim=np.arctan2(vdy, vdx).reshape(shape),
+        angular_ff=angular_ff.reshape(shape),
+        rpm=rpm.reshape(shape),
+        hood_turns=hood.reshape(shape),
+        flight_time=flight_time.reshape(shape),
+        virtual_distance=distance.reshape(shape),
+    )
+
+
+# ── Shot zones ────────────────────────────────────────────────────────
+
+
+def shot_feasible_many(distances) -> np.ndarray:
+    """Stationary-shot feasibility per distance to the hub.
+
+    Feasible when the distance is within the calibrated range (plus _ZONE_EXTRAPOLATION_M)
+    and the shot map's RPM and hood targets are inside the shooter and hood limits.
+    """
+    distances = np.asarray(distances, dtype=float)
+    rpm, hood = SHOT_MAP.evaluate_many(distances)
+    points = SHOT_MAP.points
+    return (
+        (distances >= max(points[0][0] - _ZONE_EXTRAPOLATION_M, 0.5))
+        & (distances <= points[-1][0] + _ZONE_EXTRAPOLATION_M)
+        & (rpm > 0.0)
+        & (rpm <= SHOOTER_MAX_RPM)
+        & (hood >= HOOD_MIN_TURNS - _ZONE_HOOD_TOLERANCE)
+        & (hood <= HOOD_MAX_TURNS + _ZONE_HOOD_TOLERANCE)
+    )
+
+
+def shot_zone_signature() -> int:
+    """CRC of everything a shot zone map depends on, to spot a stale deployed file."""
+    inputs = (
+        SHOT_MAP.points,
+        SHOT_MAP_INTERPOLATION,
+        _ZONE_EXTRAPOLATION_M,
+        SHOOTER_MAX_RPM,
+        HOOD_MIN_TURNS,
+        HOOD_MAX_TURNS,
+    )
+    return zlib.crc32(repr(inputs).encode())
+
+
+def build_shot_zones(resolution: float = SHOT_ZONE_RESOLUTION_M) -> ShotZoneMap:
+    """Rasterize the field (cell centers) into shootable cells for each alliance hub."""
+    cols = math.ceil(FIELD_LENGTH_M / resolution)
+    rows = math.ceil(FIELD_WIDTH_M / resolution)
+    x, y = np.meshgrid((np.arange(cols) + 0.5) * resolution, (np.arange(rows) + 0.5) * resolution)
+    blue, red = (shot_feasible_many(np.hypot(hub.X() - x, hub.Y() - y)) for hub in (BLUE_HUB, RED_HUB))
+    return ShotZoneMap(blue, red, resolution, shot_zone_signature())
+
+
+def load_shot_zones(path: Path = SHOT_ZONE_PATH) -> ShotZoneMap:
+    """Deployed shot zone map, or a fresh build if it is missing or stale."""
+    try:
+        zones = ShotZoneMap.read(path)
+    except (OSError, ValueError) as e:
+        DataLogManager.log(f"Shot zones: {e} — building in memory")
+        return build_shot_zones()
+    if zones.signature != shot_zone_signature():
+        DataLogManager.log(f"Shot zones: {path} built from a different shot map — building in memory")
+        return build_shot_zones(zones.resolution)
+    return zones
+
+
+class BallisticsGrid:
+    """Precomputed moving-shot flight times keyed by (raw distance, closing speed, tangential speed).
+
+    Each node holds the Newton-converged flight time (NaN where Newton did not converge).
+    solve() interpolates it trilinearly and checks it with one lookup in a resampled copy of
+    the shot map at the resulting virtual distance, which also gives the RPM and hood — one
+    O(1) evaluation where Newton needs three or four shot map searches. If that Newton
+    residual misses _GRID_TOLERANCE_S, solve() Newton-refines from the interpolated flight
+    time. The grid goes stale when the slip factor or the shot map changes; refresh()
+    rebuilds all nodes in one vectorized solve, and VirtualGoal only calls it while disabled.
+    """
+
+    def __init__(self) -> None:
+        self._n_dist = round((_GRID_MAX_DISTANCE_M - _GRID_MIN_DISTANCE_M) / _GRID_DISTANCE_STEP_M) + 1
+        self._n_closing = round(2 * _GRID_MAX_CLOSING_SPEED / _GRID_SPEED_STEP) + 1
+        self._n_tangential = round(_GRID_MAX_TANGENTIAL_SPEED / _GRID_SPEED_STEP) + 1
+        self._slip: float | None = None
+        self._version = -1
+        self._ev_per_rpm = 0.0
+        self._max_distance = 0.0
+        self._far_shot = (0.0, 0.0, 0.0)  # limit_shot() past _max_distance
+        self._flight_time: list[float] = []  # tangential speed varies fastest
+        self._n_shot = round(_GRID_SHOT_MAX_DISTANCE_M / _GRID_SHOT_STEP_M) + 1
+        self._shot: list[float] = []  # (rpm, hood) every _GRID_SHOT_STEP_M from 0
+
+    def stale(self, slip: float) -> bool:
+        return slip != self._slip or self._version != SHOT_MAP.version
+
+    def refresh(self, slip: float) -> bool:
+        """Rebuild if stale. Returns True if it rebuilt."""
+        if not self.stale(slip):
+            return False
+        distance, closing, tangential = np.meshgrid(
+            _GRID_MIN_DISTANCE_M + np.arange(self._n_dist) * _GRID_DISTANCE_STEP_M,
+            -_GRID_MAX_CLOSING_SPEED + np.arange(self._n_closing) * _GRID_SPEED_STEP,
+            np.arange(self._n_tangential) * _GRID_SPEED_STEP,
+            indexing="ij",
+        )
+        # Hub straight ahead along +x: closing speed is vx, tangential speed vy
+        flight_time, *_, converged = _solve_flight_time_many(
+            distance.ravel(), np.zeros(distance.size), closing.ravel(), tangential.ravel(), slip
+        )
+        flight_time[~converged] = np.nan
+        self._flight_time = flight_time.tolist()
+        self._shot = (
+            np.column_stack(SHOT_MAP.evaluate_many(np.arange(self._n_shot) * _GRID_SHOT_STEP_M)).ravel().tolist()
+        )
+        self._slip = slip
+        self._version = SHOT_MAP.version
+        self._ev_per_rpm = _rpm_to_exit_velocity(1.0, slip)
+        self._max_distance = max_shot_distance()
+        self._far_shot = limit_shot(self._max_distance)
+        return True
+
+    def flight_time(self, dx: float, dy: float, field_vx: float, field_vy: float) -> float | None:
+        """Interpolated flight time (s; NaN next to an unconverged node), or None outside the grid."""
+        raw_distance = math.hypot(dx, dy)
+        fi = (raw_distance - _GRID_MIN_DISTANCE_M) * (1.0 / _GRID_DISTANCE_STEP_M)
+        if not 0.0 <= fi < self._n_dist - 1:
+            return None
+        per_speed_step = 1.0 / (_GRID_SPEED_STEP * raw_distance)
+        fj = (dx * field_vx + dy * field_vy) * per_speed_step + self._n_closing // 2
+        fk = abs(dx * field_vy - dy * field_vx) * per_speed_step
+        n_closing = self._n_closing
+        n_tangential = self._n_tangential
+        if not (0.0 <= fj < n_closing - 1 and fk < n_tangential - 1):
+            return None
+
+        i = int(fi)
+        j = int(fj)
+        k = int(fk)
+        ti = fi - i
+        tj = fj - j
+        tk = fk - k
+        n00 = (i * n_closing + j) * n_tangential + k
+        n01 = n00 + n_tangential
+        n10 = n00 + n_tangential * n_closing
+        n11 = n10 + n_tangential
+        values = self._flight_time
+        t00, t00k = values[n00 : n00 + 2]
+        t01, t01k = values[n01 : n01 + 2]
+        t10, t10k = values[n10 : n10 + 2]
+        t11, t11k = values[n11 : n11 + 2]
+        near = t00 + (t00k - t00) * tk
+        near += (t01 + (t01k - t01) * tk - near) * tj
+        far = t10 + (t10k - t10) * tk
+        far += (t11 + (t11k - t11) * tk - far) * tj
+        return near + (far - near) * ti
+
+    def solve(
+        self, dx: float, dy: float, field_vx: float, field_vy: float, slip: float
+    ) -> tuple[float, float, float, float, int, float] | None:
+        """Solution shaped like solve_flight_time(), or None outside the grid or while it is stale."""
+        if slip != self._slip or self._version != SHOT_MAP.version:
+            return None
+        t = self.flight_time(dx, dy, field_vx, field_vy)
+        if t is None:
+            return None
+        if t != t:  # NaN: next to a node Newton could not solve
+            return solve_flight_time(dx, dy, field_vx, field_vy, slip)
+        distance = math.hypot(dx - field_vx * t, dy - field_vy * t)
+        fs = distance * (1.0 / _GRID_SHOT_STEP_M)
+        m = int(fs)
+        if m < self._n_shot - 1:
+            rpm, hood, next_rpm, next_hood = self._shot[2 * m : 2 * m + 4]
+            rpm += (next_rpm - rpm) * (fs - m)
+            hood += (next_hood - hood) * (fs - m)
+        else:
+            rpm, hood = SHOT_MAP.evaluate(distance)
+        residual = t - math.hypot(dx, dy) / (self._ev_per_rpm * rpm)
+        if not abs(residual) < _GRID_TOLERANCE_S:
+            return solve_flight_time(dx, dy, field_vx, field_vy, slip, t)
+        # limit_shot(), with the far end cached per refresh
+        if distance > self._max_distance:
+            distance, rpm, hood = self._far_shot
+        elif rpm > SHOOTER_MAX_RPM:
+            rpm = SHOOTER_MAX_RPM
+        return t, distance, rpm, hood, 1, residual
 
 
 # ── VirtualGoal ───────────────────────────────────────────────────────
@@ -65,13 +473,23 @@ def compute_ballistics(distance: float) -> tuple[float, float]:
 class VirtualGoal:
     """Computes a virtual aiming point that compensates for robot motion during ball flight.
 
-    Iterates ballistics ↔ virtual distance to break the circular dependency:
+    Ballistics ↔ virtual distance is a circular dependency:
       distance → RPM → exit velocity → flight time → virtual distance → new RPM ...
-    Converges in 2 iterations since the correction is small relative to raw distance.
+    The default solver interpolates the converged flight time from a precomputed BallisticsGrid
+    (keyed by raw distance, closing and tangential speed) and checks it with one ballistics
+    evaluation, Newton-refining only where it misses the tolerance. NT "VirtualGoal/Solver"
+    switches to plain Newton or the legacy fixed-point loop; iterations and residual are published.
+
+    Results are cached per drivetrain snapshot, which the drivetrain replaces once per
+    scheduler tick: the first calculate() in a tick solves, later callers (drive request,
+    PathPlanner override, HubShot) get the cached result. robotPeriodic() calls periodic()
+    for shot map and grid upkeep.
     """
 
     def __init__(self, drivetrain):
         self._drivetrain = drivetrain
+        self._grid = BallisticsGrid()
+        self._grid.refresh(_SLIP_FACTOR)  # Robot init runs disabled
 
         # NT-tunable slip factor
         shoot_table = NetworkTableInstance.getDefault().getTable("Shoot")
@@ -79,11 +497,33 @@ class VirtualGoal:
         self._slip_factor_pub.set(_SLIP_FACTOR)
         self._slip_factor_sub = shoot_table.getDoubleTopic("Slip Factor").subscribe(_SLIP_FACTOR)
 
+        # Shot map source — SHOT_TABLE, or the tuning CSV (hot-reloaded) when opted in
+        shoot_table.getBooleanTopic("Use Tuning CSV").publish().set(False)
+        self._use_csv_sub = shoot_table.getBooleanTopic("Use Tuning CSV").subscribe(False)
+        self._map_source_pub = shoot_table.getStringTopic("Shot Map Source").publish()
+        self._map_points_pub = shoot_table.getIntegerTopic("Shot Map Points").publish()
+        self._zones_stale_pub = shoot_table.getBooleanTopic("Shot Zones Stale").publish()
+        self._zones = load_shot_zones()
+        self._zones_version = SHOT_MAP.version
+        self._refresh_shot_map()
+
         # Last computed results — read by HubShot
         self.last_virtual_distance = 0.0
         self.last_raw_distance = 0.0
         self.last_rpm = 0.0
         self.last_hood_turns = 0.0
+        self.last_heading_error = 0.0  # rad, aim minus current robot heading
+        self.last_in_zone = False
+        self.last_converged = True  # False: Newton missed the tolerance, fixed-point fallback
+        self.solver_failures = 0
+
+        self._loop = 0  # periodic() calls, for the shot map check
+
+        # Per-tick cache of calculate(), keyed on the drivetrain snapshot it was solved for
+        self._cached_snapshot: object = None
+        self._cached: tuple[Rotation2d, float] = (Rotation2d(), 0.0)
+        self._cached_operator_snapshot: object = None
+        self._cached_operator: tuple[Rotation2d, float] = (Rotation2d(), 0.0)
 
         # Telemetry
         vg_table = NetworkTableInstance.getDefault().getTable("VirtualGoal")
@@ -91,74 +531,157 @@ class VirtualGoal:
         self._raw_dist_pub = vg_table.getDoubleTopic("Raw Distance").publish()
         self._flight_time_pub = vg_table.getDoubleTopic("Flight Time").publish()
         self._vg_pose_pub = vg_table.getStructTopic("Pose", Pose2d).publish()
+        self._iterations_pub = vg_table.getIntegerTopic("Solver Iterations").publish()
+        self._residual_pub = vg_table.getDoubleTopic("Solver Residual").publish()
+        self._in_zone_pub = vg_table.getBooleanTopic("In Shot Zone").publish()
+        telemetry = BatchedPublisher.instance()
+        telemetry.add_boolean("VirtualGoal", "Solver Converged", lambda: self.last_converged)
+        telemetry.add_integer("VirtualGoal", "Solver Failures", lambda: self.solver_failures)
+
+        # Solver selection
+        vg_table.getStringTopic("Solver").publish().set(SOLVER_GRID)
+        self._solver_sub = vg_table.getStringTopic("Solver").subscribe(SOLVER_GRID)
 
     @staticmethod
-    def _get_hub():
-        return (
-            RED_HUB
-            if DriverStation.getAlliance() == DriverStation.Alliance.kRed
-            else BLUE_HUB
-        )
+    def hub_position() -> Translation2d:
+        """Centre of this alliance's hub (blue when the alliance is unknown)."""
+        return RED_HUB if DriverStation.getAlliance() == DriverStation.Alliance.kRed else BLUE_HUB
 
     def calculate_operator(self) -> tuple[Rotation2d, float]:
-        """Like calculate(), but returns aim in operator perspective for FieldCentricFacingAngle."""
-        aim, ff = self.calculate()
-        if DriverStation.getAlliance() == DriverStation.Alliance.kRed:
-            aim = aim.rotateBy(Rotation2d(math.pi))
-        return aim, ff
+        """
+        Like calculate(), but returns aim in operator perspective for FieldCentricFacingAngle.
+        Cached per tick like calculate(), so the red-alliance flip builds one Rotation2d per tick.
+        """
+        snapshot = self._drivetrain.get_snapshot()
+        if snapshot is not self._cached_operator_snapshot:
+            aim, ff = self.calculate()
+            if DriverStation.getAlliance() == DriverStation.Alliance.kRed:
+                aim = aim.rotateBy(_HALF_TURN)
+            self._cached_operator = (aim, ff)
+            self._cached_operator_snapshot = snapshot
+        return self._cached_operator
+
+    def periodic(self):
+        """Shot map and grid upkeep, once per robot loop."""
+        self._loop += 1
+        if self._loop % _SHOT_MAP_CHECK_LOOPS == 0:
+            self._refresh_shot_map()
+            # A stale grid falls back to Newton; rebuild when the loop has time
+            if DriverStation.isDisabled():
+                self._grid.refresh(self._slip_factor_sub.get())
+
+    def _refresh_shot_map(self):
+        """Follow the tuning CSV (or fall back to SHOT_TABLE) without restarting robot code."""
+        if self._use_csv_sub.get():
+            try:
+                SHOT_MAP.reload()
+            except ValueError as e:
+                DataLogManager.log(f"Shot map reload failed: {e}")
+        else:
+            SHOT_MAP.use_default()
+        self._map_source_pub.set(SHOT_MAP.source)
+        self._map_points_pub.set(len(SHOT_MAP.points))
+        # Rasterizing the field takes milliseconds; keep the previous zones until disabled
+        stale = self._zones_version != SHOT_MAP.version
+        self._zones_stale_pub.set(stale)
+        if stale and DriverStation.isDisabled():
+            self._zones = build_shot_zones(self._zones.resolution)
+            self._zones_version = SHOT_MAP.version
+            self._zones_stale_pub.set(False)
+
+    def in_shot_zone(self, pose: Pose2d) -> bool:
+        """True if a stationary shot at this alliance's hub can be made from pose (O(1) lookup)."""
+        red = DriverStation.getAlliance() == DriverStation.Alliance.kRed
+        return self._zones.contains(pose.X(), pose.Y(), red)
+
+    def stationary_shot(self) -> tuple[float, bool]:
+        """(shooter RPM, in shot zone) for a stationary shot from the current pose.
+
+        One shot map lookup at the raw distance — no moving-shot solve and no NT publishes,
+        for every-loop callers that only need a ballpark RPM (PreSpin).
+        """
+        snapshot = self._drivetrain.get_snapshot()
+        hub = self.hub_position()
+        _, rpm, _ = limit_shot(math.hypot(hub.X() - snapshot.x, hub.Y() - snapshot.y))
+        return rpm, self._zones.contains(snapshot.x, snapshot.y, hub is RED_HUB)
 
     def calculate(self) -> tuple[Rotation2d, float]:
-        """Iterate ballistics ↔ virtual distance to convergence.
+        """Solve ballistics ↔ virtual distance for the current drivetrain state, once per tick.
 
         Returns (aim_direction field-absolute, angular_rate_feedforward).
-        Updates last_virtual_distance, last_rpm, last_hood_turns.
+        Updates last_virtual_distance, last_rpm, last_hood_turns, last_heading_error.
         """
-        hub = self._get_hub()
-        state = self._drivetrain.get_state()
-        speeds = state.speeds
-        heading = state.pose.rotation()
-
-        # Convert robot-relative speeds to field-relative
-        cos_h, sin_h = heading.cos(), heading.sin()
-        field_vx = speeds.vx * cos_h - speeds.vy * sin_h
-        field_vy = speeds.vx * sin_h + speeds.vy * cos_h
-
-        # Predict robot pose forward to compensate for control loop latency
-        robot = state.pose.translation()
-        pred_x = robot.X() + field_vx * _LOOKAHEAD_S
-        pred_y = robot.Y() + field_vy * _LOOKAHEAD_S
-
-        dx = hub.X() - pred_x
-        dy = hub.Y() - pred_y
+        snapshot = self._drivetrain.get_snapshot()
+        if snapshot is not self._cached_snapshot:
+            self._cached = self._solve(self._solver_sub.get())
+            self._cached_snapshot = snapshot
+        return self._cached
+
+    def _solve(self, solver: str) -> tuple[Rotation2d, float]:
+        hub = self.hub_position()
+        hub_x, hub_y = hub.X(), hub.Y()
+        motion = self._drivetrain.get_motion()
+        heading = motion.heading
+
+        # Predict robot pose and velocity forward to compensate for control loop latency,
+        # including acceleration so the lead holds up while the robot speeds up or brakes
+        pred_x, pred_y, _ = motion.predict(_LOOKAHEAD_S)
+        field_vx, field_vy = motion.predict_velocity(_LOOKAHEAD_S)
+
+        dx = hub_x - pred_x
+        dy = hub_y - pred_y
         raw_distance = math.hypot(dx, dy)
 
         self.last_raw_distance = raw_distance
         self._raw_dist_pub.set(raw_distance)
+        self.last_in_zone = self._zones.contains(pred_x, pred_y, hub is RED_HUB)
+        self._in_zone_pub.set(self.last_in_zone)
 
         if raw_distance < 0.5:
             aim = Rotation2d(math.atan2(dy, dx))
-            rpm, hood = compute_ballistics(raw_distance)
+            self.last_heading_error = math.remainder(aim.radians() - heading, math.tau)
+            _, rpm, hood = limit_shot(raw_distance)
             self._store(raw_distance, rpm, hood, 0.0)
-            self._vg_pose_pub.set(Pose2d(hub.X(), hub.Y(), Rotation2d()))
+            self._vg_pose_pub.set(Pose2d(hub_x, hub_y, Rotation2d()))
             return aim, 0.0
 
         slip = self._slip_factor_sub.get()
-
-        # Iterate: seed with raw distance, converge virtual distance ↔ RPM
-        distance = raw_distance
-        flight_time = 0.0
-        for _ in range(_ITERATIONS):
-            rpm, hood = compute_ballistics(distance)
-            exit_velocity = _rpm_to_exit_velocity(rpm, slip)
-            flight_time = raw_distance / exit_velocity
-
-            vg_x = hub.X() - field_vx * flight_time
-            vg_y = hub.Y() - field_vy * flight_time
-            distance = math.hypot(vg_x - pred_x, vg_y - pred_y)
+        if solver == SOLVER_FIXED:
+            # Legacy: seed with raw distance, fixed number of distance ↔ RPM steps.
+            # Residual reported is the last step's change in flight time.
+            distance = raw_distance
+            flight_time = previous = 0.0
+            for _ in range(_ITERATIONS):
+                rpm, hood = compute_ballistics(distance)
+                exit_velocity = _rpm_to_exit_velocity(rpm, slip)
+                previous, flight_time = flight_time, raw_distance / exit_velocity
+
+                vg_x = hub_x - field_vx * flight_time
+                vg_y = hub_y - field_vy * flight_time
+                distance = math.hypot(vg_x - pred_x, vg_y - pred_y)
+            evaluations, residual = _ITERATIONS, flight_time - previous
+            if distance > max_shot_distance() or rpm > SHOOTER_MAX_RPM:
+                distance, rpm, hood = limit_shot(distance)
+        else:
+            solution = None
+            if solver != SOLVER_NEWTON:
+                solution = self._grid.solve(dx, dy, field_vx, field_vy, slip)
+            if solution is None:
+                solution = solve_flight_time(dx, dy, field_vx, field_vy, slip)
+            flight_time, distance, rpm, hood, evaluations, residual = solution
+            vg_x = hub_x - field_vx * flight_time
+            vg_y = hub_y - field_vy * flight_time
+
+        self._iterations_pub.set(evaluations)
+        self._residual_pub.set(residual)
+        self.last_converged = evaluations <= _SOLVER_MAX_EVALUATIONS
+        if not self.last_converged:
+            self.solver_failures += 1
 
         vdx = vg_x - pred_x
         vdy = vg_y - pred_y
         aim = Rotation2d(math.atan2(vdy, vdx))
+        self.last_heading_error = math.remainder(aim.radians() - heading, math.tau)
 
         # Angular rate feedforward: d/dt atan2(dy, dx) from field-relative motion
         dist_sq = vdx * vdx + vdy * vdy
@@ -176,6 +699,51 @@ class VirtualGoal:
         self._flight_time_pub.set(flight_time)
 
 
+# ── Ready-to-fire gating ─────────────────────────────────────────────
+
+
+class ShotReadiness:
+    """
+    Ready-to-fire state machine for one volley.
+
+    SPINNING_UP until every check has held for confirm_loops consecutive loops (READY)
+    or timeout_s passes (TIMED_OUT). Both end states latch until reset(): each ball
+    pulls the flywheel out of tolerance, and stopping the feed mid-volley would stall it.
+    """
+
+    SPINNING_UP = "spinning up"
+    READY = "ready"
+    TIMED_OUT = "timed out"
+
+    def __init__(self, confirm_loops: int = READY_CONFIRM_LOOPS, timeout_s: float = 2.0):
+        self.confirm_loops = confirm_loops
+        self.timeout_s = timeout_s
+        self.reset()
+
+    def reset(self) -> None:
+        self.state = self.SPINNING_UP
+        self.time_to_ready = 0.0
+        self._loops_in_tolerance = 0
+
+    @property
+    def feeding(self) -> bool:
+        return self.state != self.SPINNING_UP
+
+    def update(self, in_tolerance: bool, elapsed_s: float) -> bool:
+        """Advance one loop. Returns True when the indexer should feed."""
+        if self.feeding:
+            return True
+        self._loops_in_tolerance = self._loops_in_tolerance + 1 if in_tolerance else 0
+        if self._loops_in_tolerance >= self.confirm_loops:
+            self.state = self.READY
+        elif elapsed_s >= self.timeout_s:
+            self.state = self.TIMED_OUT
+        else:
+            return False
+        self.time_to_ready = elapsed_s
+        return True
+
+
 # ── HubShot Command ──────────────────────────────────────────────────
 
 
@@ -183,8 +751,12 @@ class HubShot(Command):
     """
     Command that coordinates shooter, kicker, conveyor, and hood to shoot at the hub.
 
-    Reads converged RPM, hood angle, and virtual distance from VirtualGoal each cycle.
+    Reads converged RPM, hood angle, and virtual distance from VirtualGoal each cycle
+    (calculated this tick, shared with the aim request through VirtualGoal's cache).
     Stages motors (shooter → kicker → conveyor) and adjusts hood position.
+    The conveyor starts once shooter RPM, kicker speed, hood position and heading are
+    all in tolerance (ShotReadiness), or after FEED_TIMEOUT_S as a fallback. From then on
+    FeedCadence paces it so each ball reaches the flywheel after the previous dip recovers.
     """
 
     def __init__(self, shooter, kicker, indexer, hood, virtual_goal: VirtualGoal):
@@ -198,6 +770,10 @@ class HubShot(Command):
         self.addRequirements(shooter, kicker, indexer, hood)
 
         self._feed_timer = Timer()
+        self._readiness = ShotReadiness(timeout_s=self.FEED_TIMEOUT_S)
+        self._cadence = FeedCadence(READY_RPM_TOLERANCE)
+        self._boost = DipBoost(READY_RPM_TOLERANCE)
+        self._last_feed_output = 0.0
 
         table = ntcore.NetworkTableInstance.getDefault().getTable("Shoot")
         self._distance_pub = table.getDoubleTopic("Distance To Hub").publish()
@@ -206,14 +782,38 @@ class HubShot(Command):
         self._rpm_error_pub = table.getDoubleTopic("RPM Error").publish()
         self._target_hood_pub = table.getDoubleTopic("Target Hood Turns").publish()
         self._feeding_pub = table.getBooleanTopic("Feeding").publish()
+        self._hood_error_pub = table.getDoubleTopic("Hood Error").publish()
+        self._heading_error_pub = table.getDoubleTopic("Heading Error Deg").publish()
+        self._ready_state_pub = table.getStringTopic("Ready State").publish()
+        self._waiting_on_pub = table.getStringTopic("Waiting On").publish()
+        self._time_to_ready_pub = table.getDoubleTopic("Time To Ready").publish()
+        self._shots_fired_pub = table.getIntegerTopic("Shots Fired").publish()
+        self._shot_interval_pub = table.getDoubleTopic("Shot Interval").publish()
+        self._bad_shots_pub = table.getIntegerTopic("Out Of Tolerance Shots").publish()
+        self._feed_lead_pub = table.getDoubleTopic("Feed Lead").publish()
+        self._boost_volts_pub = table.getDoubleTopic("Boost Volts").publish()
+        self._boost_gain_pub = table.getDoubleTopic("Boost Volts Per RPM").publish()
+        self._recovery_time_pub = table.getDoubleTopic("Recovery Time").publish()
         self._kicker_full_pub = table.getBooleanTopic("Kicker Full Speed").publish()
         self._kicker_full_pub.set(True)
         self._kicker_full_sub = table.getBooleanTopic("Kicker Full Speed").subscribe(False)
 
-    FEED_DELAY_S = 2
+    FEED_TIMEOUT_S = 2.0  # feed anyway if readiness never confirms
+
+    _running: weakref.WeakSet[Command] = weakref.WeakSet()
+
+    @classmethod
+    def in_progress(cls) -> bool:
+        """True while any HubShot is running (teleop binding or auto named command)."""
+        return len(cls._running) > 0
 
     def initialize(self):
+        HubShot._running.add(self)
         self._feed_timer.restart()
+        self._readiness.reset()
+        self._cadence.reset()
+        self._boost.reset()
+        self._last_feed_output = 0.0
         PPHolonomicDriveController.setRotationTargetOverride(self._aim_override)
 
     def _aim_override(self):
@@ -223,37 +823,86 @@ class HubShot(Command):
 
     def execute(self):
         vg = self._virtual_goal
+        vg.calculate()
         target_rpm = vg.last_rpm
         target_hood = vg.last_hood_turns
 
-        self.shooter.set_target_speed(target_rpm)
         self.hood.set_target_position(target_hood)
         if self._kicker_full_sub.get():
             self.kicker.set_duty_cycle(1.0)
         else:
             self.kicker.set_target_speed(target_rpm)
 
-        if self._feed_timer.hasElapsed(self.FEED_DELAY_S):
-            self.indexer.set_target_output(1.0)
+        current_rpm = self.shooter.get_current_speed()
+        hood_error = self.hood.get_current_position() - target_hood
+        waiting_on = self._waiting_on(target_rpm, current_rpm, hood_error, vg.last_heading_error)
+
+        was_feeding = self._readiness.feeding
+        feeding = self._readiness.update(not waiting_on, self._feed_timer.get())
+        boost_volts = 0.0
+        if feeding:
+            cadence = self._cadence
+            now = self._feed_timer.get()
+            shots_fired = cadence.shots_fired
+            output = cadence.update(target_rpm, current_rpm, self.shooter.get_output_current(), now)
+            if output > 0.0 and self._last_feed_output == 0.0:
+                self._boost.feed(now, cadence.lead_s)
+            self._last_feed_output = output
+            if cadence.shots_fired != shots_fired:
+                self._boost.exit_detected(now)
+            boost_volts = self._boost.update(target_rpm, current_rpm, now)
+            self.indexer.set_target_output(output)
+            self._shots_fired_pub.set(cadence.shots_fired)
+            self._shot_interval_pub.set(cadence.last_interval)
+            self._bad_shots_pub.set(cadence.bad_shots)
+            self._feed_lead_pub.set(cadence.lead_s)
+            self._boost_gain_pub.set(self._boost.volts_per_rpm)
+            self._recovery_time_pub.set(self._boost.last_recovery_s)
         else:
             self.indexer.stop()
+            self._last_feed_output = 0.0
+        self.shooter.set_target_speed(target_rpm, boost_volts)
+        self._boost_volts_pub.set(boost_volts)
+        if feeding and not was_feeding:
+            self._time_to_ready_pub.set(self._readiness.time_to_ready)
 
-        current_rpm = self.shooter.get_current_speed()
-        feeding = self._feed_timer.hasElapsed(self.FEED_DELAY_S)
         self._distance_pub.set(vg.last_virtual_distance)
         self._target_rpm_pub.set(target_rpm)
         self._current_rpm_pub.set(current_rpm)
         self._rpm_error_pub.set(abs(current_rpm - target_rpm))
         self._target_hood_pub.set(target_hood)
+        self._hood_error_pub.set(hood_error)
+        self._heading_error_pub.set(math.degrees(vg.last_heading_error))
         self._feeding_pub.set(feeding)
+        self._ready_state_pub.set(self._readiness.state)
+        self._waiting_on_pub.set(",".join(waiting_on))
+
+    def _waiting_on(self, target_rpm, current_rpm, hood_error, heading_error) -> list[str]:
+        """Names of the checks still out of tolerance (empty when ready to fire)."""
+        waiting_on = []
+        if abs(current_rpm - target_rpm) > READY_RPM_TOLERANCE:
+            waiting_on.append("shooter")
+        kicker_rpm = self.kicker.get_current_speed()
+        if self._kicker_full_sub.get():
+            if kicker_rpm < READY_KICKER_MIN_RPM:
+                waiting_on.append("kicker")
+        elif abs(kicker_rpm - target_rpm) > READY_KICKER_TOLERANCE:
+            waiting_on.append("kicker")
+        if abs(hood_error) > READY_HOOD_TOLERANCE:
+            waiting_on.append("hood")
+        if abs(heading_error) > READY_HEADING_TOLERANCE_RAD:
+            waiting_on.append("heading")
+        return waiting_on
 
     def end(self, interrupted: bool):
+        HubShot._running.discard(self)
         PPHolonomicDriveController.setRotationTargetOverride(None)
         self.shooter.stop()
         self.kicker.stop()
         self.indexer.stop()
         self.hood.stow()
         self._feeding_pub.set(False)
+        self._ready_state_pub.set("")
 
     def isFinished(self) -> bool:
         return False
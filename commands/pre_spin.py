@@ -0,0 +1,87 @@
+from collections.abc import Callable
+
+import commands2
+import ntcore
+from wpilib import RobotController
+from wpimath.filter import Debouncer, LinearFilter
+
+from commands.hub_shot import VirtualGoal
+from subsystems.shooter import ShooterSubSystem
+
+# Idle speed
+IDLE_FRACTION = 0.8  # Share of the predicted shot RPM held while idling  # TUNE
+ZONE_EXIT_HOLD_S = 0.5  # Keep spinning this long after leaving the zone  # TUNE
+
+# Battery budget — idle RPM scales from full at BUDGET_FULL_VOLTS to zero at BUDGET_CUTOFF_VOLTS
+BUDGET_FULL_VOLTS = 11.5  # TUNE
+BUDGET_CUTOFF_VOLTS = 10.5  # TUNE
+BUDGET_FILTER_TAPS = 10  # ~200 ms moving average — ignore drive current spikes
+
+
+class PreSpin(commands2.Command):
+    """
+    Shooter default command — holds an idle RPM so HubShot starts near speed.
+
+    Idles at IDLE_FRACTION of the stationary-shot RPM for the current position while
+    the robot is in this alliance's shooting zone (or has_game_piece() reports a piece,
+    when a sensor is wired). Idle RPM is scaled down as the filtered battery
+    voltage drops toward BUDGET_CUTOFF_VOLTS; otherwise the flywheel coasts.
+    """
+
+    def __init__(
+        self,
+        shooter: ShooterSubSystem,
+        virtual_goal: VirtualGoal,
+        has_game_piece: Callable[[], bool] | None = None,
+    ) -> None:
+        super().__init__()
+        self.shooter = shooter
+        self._virtual_goal = virtual_goal
+        self._has_game_piece = has_game_piece
+        self.addRequirements(self.shooter)
+
+        self._zone_debouncer = Debouncer(ZONE_EXIT_HOLD_S, Debouncer.DebounceType.kFalling)
+        self._voltage_filter = LinearFilter.movingAverage(BUDGET_FILTER_TAPS)
+
+        table = ntcore.NetworkTableInstance.getDefault().getTable("PreSpin")
+        table.getBooleanTopic("Enabled").publish().set(True)
+        self._enabled_sub = table.getBooleanTopic("Enabled").subscribe(True)
+        table.getDoubleTopic("Idle Fraction").publish().set(IDLE_FRACTION)
+        self._fraction_sub = table.getDoubleTopic("Idle Fraction").subscribe(IDLE_FRACTION)
+
+        self._active_pub = table.getBooleanTopic("Active").publish()
+        self._target_pub = table.getDoubleTopic("Target RPM").publish()
+        self._budget_pub = table.getDoubleTopic("Battery Budget").publish()
+
+    def initialize(self) -> None:
+        # Start the average at the present voltage, not at zero
+        volts = RobotController.getBatteryVoltage()
+        self._voltage_filter.reset([volts] * BUDGET_FILTER_TAPS, [])
+
+    def execute(self) -> None:
+        budget = self._battery_budget(self._voltage_filter.calculate(RobotController.getBatteryVoltage()))
+        self._budget_pub.set(budget)
+
+        rpm, in_zone = self._virtual_goal.stationary_shot()
+        wanted = in_zone or (self._has_game_piece is not None and self._has_game_piece())
+        active = self._zone_debouncer.calculate(wanted) and self._enabled_sub.get() and budget > 0.0
+
+        target = rpm * self._fraction_sub.get() * budget if active else 0.0
+        if target > 0.0:
+            self.shooter.set_target_speed(target)
+        else:
+            self.shooter.stop()
+        self._active_pub.set(target > 0.0)
+        self._target_pub.set(target)
+
+    def end(self, interrupted: bool) -> None:
+        self.shooter.stop()
+        self._active_pub.set(False)
+
+    def isFinished(self) -> bool:
+        return False
+
+    @staticmethod
+    def _battery_budget(volts: float) -> float:
+        """Share of the idle RPM the battery can afford (0..1)."""
+        return min(max((volts - BUDGET_CUTOFF_VOLTS) / (BUDGET_FULL_VOLTS - BUDGET_CUTOFF_VOLTS), 0.0), 1.0)
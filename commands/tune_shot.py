@@ -1,12 +1,12 @@
 import csv
-from pathlib import Path
+import math
 
 import ntcore
 import rev
 from commands2 import Command
 from wpilib import DriverStation, Timer
 
-from commands.hub_shot import BLUE_HUB, RED_HUB
+from commands.hub_shot import BLUE_HUB, RED_HUB, SHOT_LOG_PATH
 from subsystems.hood import HoodSubSystem
 from subsystems.indexer import IndexerSubSystem
 from subsystems.kicker import KickerSubSystem
@@ -18,7 +18,6 @@ from subsystems.shooter import (
 )
 
 SHOOTER_TOLERANCE_RPM = 75
-SHOT_LOG_PATH = Path("/home/lvuser/shot_tuning.csv")
 
 
 class TuneShot(Command):
@@ -138,10 +137,10 @@ class TuneShot(Command):
                 self._last_shooter_p[i] = new
 
     def _get_hub_distance(self) -> float:
-        robot_pos = self._drivetrain.get_state().pose.translation()
+        drive = self._drivetrain.get_snapshot()
         alliance = DriverStation.getAlliance()
         hub = RED_HUB if alliance == DriverStation.Alliance.kRed else BLUE_HUB
-        return robot_pos.distance(hub)
+        return math.hypot(hub.X() - drive.x, hub.Y() - drive.y)
 
     def record_entry(self) -> None:
         """Log current (distance, hood_turns, shooter_rpm) as a calibration point."""
@@ -0,0 +1,104 @@
+"""
+Drive motion estimate — filtered field-relative velocity and acceleration from the
+odometry samples, and constant-acceleration pose prediction for aiming lookahead.
+
+Fed from the CTRE telemetry callback on the odometry thread. Each update builds a new
+frozen MotionEstimate and swaps it in by one reference assignment, so robot-loop readers
+need no lock and always see one consistent sample.
+
+Velocity is the module-derived chassis speed rotated into the field frame, then low-passed
+with time constant VELOCITY_TIME_CONSTANT_S. Acceleration is the finite difference of the
+unfiltered field velocity, low-passed with ACCEL_TIME_CONSTANT_S and clamped to
+MAX_ACCEL_MPS2 so a wheel-slip spike cannot throw the prediction. A gap longer than
+RESET_GAP_S (robot code restart, odometry thread stall) restarts the filters.
+"""
+
+import math
+from dataclasses import dataclass
+
+VELOCITY_TIME_CONSTANT_S = 0.03  # TUNE
+ACCEL_TIME_CONSTANT_S = 0.08  # TUNE
+MAX_ACCEL_MPS2 = 15.0  # Above any traction-limited acceleration  # TUNE
+RESET_GAP_S = 0.25
+
+
+@dataclass(frozen=True, slots=True)
+class MotionEstimate:
+    timestamp: float  # s, CTRE current-time base
+    x: float
+    y: float
+    heading: float  # rad
+    vx: float  # m/s, field-relative, filtered
+    vy: float
+    omega: float  # rad/s
+    ax: float  # m/s², field-relative, filtered
+    ay: float
+
+    def predict(self, dt: float) -> tuple[float, float, float]:
+        """(x, y, heading) dt seconds ahead under constant acceleration and turn rate."""
+        half_dt2 = 0.5 * dt * dt
+        return (
+            self.x + self.vx * dt + self.ax * half_dt2,
+            self.y + self.vy * dt + self.ay * half_dt2,
+            self.heading + self.omega * dt,
+        )
+
+    def predict_velocity(self, dt: float) -> tuple[float, float]:
+        """Field velocity dt seconds ahead under constant acceleration."""
+        return self.vx + self.ax * dt, self.vy + self.ay * dt
+
+
+STILL = MotionEstimate(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+class MotionEstimator:
+    """Updated by one writer thread; readers take .estimate."""
+
+    def __init__(self):
+        self.estimate = STILL
+        self._raw_vx = 0.0
+        self._raw_vy = 0.0
+        self._started = False
+
+    def reset(self) -> None:
+        """Restart the filters at the next sample (pose reset). Call from the writer thread."""
+        self._started = False
+
+    def update(
+        self, timestamp: float, x: float, y: float, heading: float, vx: float, vy: float, omega: float
+    ) -> MotionEstimate:
+        """Add an odometry sample; vx, vy are robot-relative chassis speeds."""
+        cos_h, sin_h = math.cos(heading), math.sin(heading)
+        field_vx = vx * cos_h - vy * sin_h
+        field_vy = vx * sin_h + vy * cos_h
+
+        previous = self.estimate
+        dt = timestamp - previous.timestamp
+        if not self._started or dt > RESET_GAP_S or dt < 0.0:
+            estimate = MotionEstimate(timestamp, x, y, heading, field_vx, field_vy, omega, 0.0, 0.0)
+        elif dt == 0.0:
+            return previous  # Duplicate sample
+        else:
+            v_alpha = dt / (VELOCITY_TIME_CONSTANT_S + dt)
+            a_alpha = dt / (ACCEL_TIME_CONSTANT_S + dt)
+            ax = _clamp((field_vx - self._raw_vx) / dt, MAX_ACCEL_MPS2)
+            ay = _clamp((field_vy - self._raw_vy) / dt, MAX_ACCEL_MPS2)
+            estimate = MotionEstimate(
+                timestamp,
+                x,
+                y,
+                heading,
+                previous.vx + v_alpha * (field_vx - previous.vx),
+                previous.vy + v_alpha * (field_vy - previous.vy),
+                omega,
+                previous.ax + a_alpha * (ax - previous.ax),
+                previous.ay + a_alpha * (ay - previous.ay),
+            )
+        self._raw_vx, self._raw_vy = field_vx, field_vy
+        self._started = True
+        self.estimate = estimate
+        return estimate
+
+
+def _clamp(value: float, limit: float) -> float:
+    return max(-limit, min(limit, value))
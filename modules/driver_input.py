@@ -0,0 +1,105 @@
+"""
+Driver input — reads the drive controller once per robot loop and shapes it in one pass
+(deadband and squared response curve, then slew limiting), so every drive request in
+RobotContainer reads the same three floats instead of polling and filtering the sticks
+itself.
+
+Slew limiting only slows a stick moving away from centre. Releasing a stick, or pushing
+it back through centre, takes effect immediately, so stopping and the idle brake are as
+quick as before. The slew step scales with the measured time since the previous
+update(), so a loop overrun does not slow the ramp.
+"""
+
+from typing import Protocol
+
+from wpilib import Timer
+
+DEADBAND = 0.05
+TRANSLATION_SLEW_PER_S = 5.0  # Stick units per second: centre to full in 0.2 s  # TUNE
+ROTATION_SLEW_PER_S = 8.0  # TUNE
+LOOP_PERIOD_S = 0.02  # Slew step for the first update()
+MAX_LOOP_DT_S = 0.1  # Longest gap slewed over in one update — after a stall, ramp rather than jump
+
+
+class _Controller(Protocol):
+    def getLeftX(self) -> float: ...
+    def getLeftY(self) -> float: ...
+    def getRightX(self) -> float: ...
+
+
+def joystick_filter(value: float) -> float:
+    """Squared response curve with 5% deadband. Rescales so output ramps smoothly from 0."""
+    if abs(value) < DEADBAND:
+        return 0.0
+    scaled = (abs(value) - DEADBAND) / (1.0 - DEADBAND)
+    return scaled * scaled * (1.0 if value > 0 else -1.0)
+
+
+def slew(current: float, target: float, max_step: float) -> float:
+    """Move current toward target by at most max_step, for moves away from zero only."""
+    if current * target <= 0.0:
+        # Released, or reversed through centre: restart from zero
+        return max(-max_step, min(max_step, target))
+    if abs(target) <= abs(current):
+        return target
+    return current + max(-max_step, min(max_step, target - current))
+
+
+class DriverInput:
+    """
+    Shaped drive command for this loop. Call update() once per loop before the scheduler
+    runs; drive requests then read vx, vy (m/s, operator perspective) and omega (rad/s).
+    stick_x, stick_y are the shaped translation stick before slew limiting (-1..1), for
+    uses that want the stick direction itself, like pointing the wheels.
+    """
+
+    __slots__ = (
+        "_controller",
+        "_last_time",
+        "_max_angular_rate",
+        "_max_speed",
+        "_rotation",
+        "_x",
+        "_y",
+        "idle",
+        "omega",
+        "stick_x",
+        "stick_y",
+        "vx",
+        "vy",
+    )
+
+    def __init__(self, controller: _Controller, max_speed: float, max_angular_rate: float):
+        self._controller = controller
+        self._max_speed = max_speed
+        self._max_angular_rate = max_angular_rate
+        self._x = self._y = self._rotation = 0.0  # Shaped and slewed stick values, -1..1
+        self.stick_x = self.stick_y = 0.0
+        self.vx = self.vy = self.omega = 0.0
+        self.idle = True  # All sticks inside the deadband
+        self._last_time: float | None = None
+
+    def update(self) -> None:
+        now = Timer.getFPGATimestamp()
+        last, self._last_time = self._last_time, now
+        dt = LOOP_PERIOD_S if last is None else min(max(now - last, 0.0), MAX_LOOP_DT_S)
+
+        controller = self._controller
+        x = joystick_filter(-controller.getLeftY())
+        y = joystick_filter(-controller.getLeftX())
+        rotation = joystick_filter(-controller.getRightX())
+        self.stick_x = x
+        self.stick_y = y
+        self.idle = idle = x == 0.0 and y == 0.0 and rotation == 0.0
+        if idle:
+            # Release is immediate, so there is nothing to slew
+            self._x = self._y = self._rotation = self.vx = self.vy = self.omega = 0.0
+            return
+
+        translation_step = TRANSLATION_SLEW_PER_S * dt
+        self._x = slew(self._x, x, translation_step)
+        self._y = slew(self._y, y, translation_step)
+        self._rotation = slew(self._rotation, rotation, ROTATION_SLEW_PER_S * dt)
+        self.vx = self._x * self._max_speed
+        self.vy = self._y * self._max_speed
+        self.omega = self._rotation * self._max_angular_rate
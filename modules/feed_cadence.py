@@ -0,0 +1,220 @@
+"""
+Feed cadence — paces the indexer during continuous fire so each ball reaches the
+flywheel after it has recovered from the previous one.
+
+A ball leaving the shooter shows up as a flywheel RPM dip together with a current
+rise. After each exit the indexer holds until the predicted time to recover is
+shorter than the feed lead (conveyor-to-flywheel transit), so the next ball arrives
+just as the RPM is back in tolerance. The lead adapts: a ball that arrives out of
+tolerance shortens it, a ball that arrives well inside tolerance lengthens it —
+converging on the fastest cadence that still keeps shots in tolerance.
+
+DipBoost adds a transient shooter feedforward from each feed command until the
+flywheel is back in tolerance after the exit, sized from the learned dip depth, so
+recovery does not rely on the low slot P gains alone. It engages just before the
+ball is predicted to reach the flywheel; exit detection then times the recovery, and
+engages the boost late only for a ball that was not fed on a command edge.
+"""
+
+# Exit detection
+DIP_RPM = 120.0  # Drop below target that marks a ball leaving  # TUNE
+CURRENT_RISE_A = 6.0  # Shooter current above the idle baseline at exit  # TUNE
+_BASELINE_ALPHA = 0.1  # Current baseline EMA weight, updated while in tolerance
+
+# Pacing
+FEED_OUTPUT = 1.0
+FEED_LEAD_S = 0.12  # Initial conveyor-to-flywheel transit estimate  # TUNE
+FEED_LEAD_MAX_S = 0.3
+FEED_LEAD_STEP_S = 0.02  # Shortened per out-of-tolerance shot, lengthened by 1/4 when under half tolerance
+RECOVERY_RATE_RPM_S = 3000.0  # Initial flywheel recovery estimate  # TUNE
+_RECOVERY_ALPHA = 0.3  # Recovery-rate EMA weight per measured shot
+
+# Dip boost (shooter arbitrary feedforward)
+BOOST_VOLTS_PER_RPM = 0.004  # Initial gain — a 400 RPM dip gets 1.6 V  # TUNE
+BOOST_MAX_VOLTS = 4.0
+BOOST_MAX_S = 0.4  # Drop a boost that has not recovered by then
+BOOST_LEAD_S = 0.06  # Engage this long before the ball is predicted to reach the flywheel  # TUNE
+RECOVERY_TARGET_S = 0.15  # Boost gain grows while recoveries take longer than this  # TUNE
+_BOOST_GAIN_UP = 1.1
+_BOOST_GAIN_DOWN = 0.8  # Applied on overshoot past the target
+_BOOST_GAIN_MAX = 0.02
+_DIP_ALPHA = 0.3  # Expected-dip EMA weight per measured shot
+_SETTLE_S = 0.2  # Watch for overshoot this long after a boost ends
+
+
+class FeedCadence:
+    """
+    Continuous-fire state machine: ARMED (in tolerance, feeding) → RECOVERING after each
+    detected exit → ARMED once the RPM error is back inside rpm_tolerance.
+
+    update() is called once per loop while HubShot is feeding and returns the indexer output.
+    """
+
+    ARMED = "armed"
+    RECOVERING = "recovering"
+
+    def __init__(self, rpm_tolerance: float):
+        self.rpm_tolerance = rpm_tolerance
+        self.lead_s = FEED_LEAD_S
+        self.recovery_rate = RECOVERY_RATE_RPM_S
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new volley. Learned lead and recovery rate carry over."""
+        self.state = self.ARMED
+        self.shots_fired = 0
+        self.bad_shots = 0
+        self.last_interval = 0.0
+        self._last_shot_time: float | None = None
+        self._previous_error = 0.0
+        self._baseline_current: float | None = None
+        self._peak_error = 0.0
+        self._trough_error = 0.0
+
+    def _exit_detected(self, error: float, current: float, reference_error: float) -> bool:
+        baseline = self._baseline_current if self._baseline_current is not None else current
+        return error - reference_error >= DIP_RPM and current >= baseline + CURRENT_RISE_A
+
+    def _record_shot(self, now: float, error_before: float) -> None:
+        self.shots_fired += 1
+        if self._last_shot_time is not None:
+            self.last_interval = now - self._last_shot_time
+        self._last_shot_time = now
+        if error_before > self.rpm_tolerance:
+            self.bad_shots += 1
+            self.lead_s = max(self.lead_s - FEED_LEAD_STEP_S, 0.0)
+        elif error_before < self.rpm_tolerance / 2:
+            # Ball waited longer than it had to — feed the next one earlier
+            self.lead_s = min(self.lead_s + FEED_LEAD_STEP_S / 4, FEED_LEAD_MAX_S)
+        self.state = self.RECOVERING
+        self._peak_error = self._trough_error = 0.0
+
+    def update(self, target_rpm: float, current_rpm: float, current_amps: float, now: float) -> float:
+        """Advance one loop. Returns the indexer output."""
+        error = max(target_rpm - current_rpm, 0.0)
+        previous_error, self._previous_error = self._previous_error, error
+
+        if self.state == self.ARMED:
+            if self._exit_detected(error, current_amps, 0.0):
+                self._record_shot(now, previous_error)
+            elif error <= self.rpm_tolerance:
+                if self._baseline_current is None:
+                    self._baseline_current = current_amps
+                else:
+                    self._baseline_current += _BASELINE_ALPHA * (current_amps - self._baseline_current)
+
+        if self.state == self.RECOVERING:
+            if error > self._peak_error and self._trough_error == self._peak_error:
+                # Still falling into the dip
+                self._peak_error = self._trough_error = error
+            elif self._exit_detected(error, current_amps, self._trough_error):
+                # Next ball arrived before recovery finished
+                self._record_shot(now, self._trough_error)
+                self._peak_error = self._trough_error = error
+            else:
+                self._trough_error = min(self._trough_error, error)
+
+            if error <= self.rpm_tolerance:
+                elapsed = now - self._last_shot_time if self._last_shot_time is not None else 0.0
+                if elapsed > 0.0 and self._peak_error > self.rpm_tolerance:
+                    measured = (self._peak_error - error) / elapsed
+                    self.recovery_rate += _RECOVERY_ALPHA * (measured - self.recovery_rate)
+                self.state = self.ARMED
+            elif (error - self.rpm_tolerance) / self.recovery_rate > self.lead_s:
+                return 0.0
+        return FEED_OUTPUT
+
+
+class DipBoost:
+    """
+    Learned feedforward boost for the shooter during a volley.
+
+    feed() on each indexer feed command schedules the boost BOOST_LEAD_S before the ball
+    is predicted to reach the flywheel; exit_detected() at each detected exit starts the
+    recovery timing (and engages at once if no feed was scheduled). update() returns the
+    volts to add through set_target_speed(). The boost is volts_per_rpm * expected_dip,
+    so it acts before the dip develops, and is held until the error is back inside
+    rpm_tolerance.
+
+    Learning from each measured dip profile: expected_dip tracks the peak error;
+    volts_per_rpm grows while recovery takes longer than RECOVERY_TARGET_S and shrinks
+    when the flywheel then overshoots the target by more than the tolerance.
+    """
+
+    def __init__(self, rpm_tolerance: float):
+        self.rpm_tolerance = rpm_tolerance
+        self.volts_per_rpm = BOOST_VOLTS_PER_RPM
+        self.expected_dip = 0.0
+        self.last_recovery_s = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop any boost in progress. Learned gain and dip carry over."""
+        self._start: float | None = None
+        self._exit: float | None = None
+        self._engage_at: float | None = None
+        self._settle_until: float | None = None
+        self._peak_error = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._start is not None
+
+    def start(self, now: float) -> None:
+        """Engage the boost now."""
+        self._start = now
+        self._exit = None
+        self._settle_until = None
+        self._peak_error = 0.0
+
+    def feed(self, now: float, transit_s: float) -> None:
+        """A ball was fed; it reaches the flywheel about transit_s from now."""
+        self._engage_at = now + max(transit_s - BOOST_LEAD_S, 0.0)
+
+    def exit_detected(self, now: float) -> None:
+        """A ball left the shooter. Recovery is timed from here."""
+        if self._start is None:
+            # Arrived before the scheduled engage, or was never fed on a command edge
+            self._engage_at = None
+            self.start(now)
+        self._exit = now
+
+    def _end_boost(self, now: float, start: float) -> None:
+        self.last_recovery_s = now - start
+        self.expected_dip += _DIP_ALPHA * (self._peak_error - self.expected_dip)
+        if self.last_recovery_s > RECOVERY_TARGET_S:
+            self.volts_per_rpm = min(self.volts_per_rpm * _BOOST_GAIN_UP, _BOOST_GAIN_MAX)
+        self._start = self._exit = None
+        self._settle_until = now + _SETTLE_S
+
+    def update(self, target_rpm: float, current_rpm: float, now: float) -> float:
+        """Advance one loop. Returns the feedforward volts to apply."""
+        error = target_rpm - current_rpm
+        if self._settle_until is not None:
+            if error < -self.rpm_tolerance:
+                self.volts_per_rpm *= _BOOST_GAIN_DOWN
+                self._settle_until = None
+            elif now >= self._settle_until:
+                self._settle_until = None
+
+        if self._start is None and self._engage_at is not None and now >= self._engage_at:
+            self._engage_at = None
+            self.start(now)
+        start = self._start
+        if start is None:
+            return 0.0
+        self._peak_error = max(self._peak_error, error)
+        since = self._exit if self._exit is not None else start
+        if error <= self.rpm_tolerance and self._peak_error > self.rpm_tolerance:
+            self._end_boost(now, since)
+            return 0.0
+        if now - since > BOOST_MAX_S:
+            if self._peak_error > self.rpm_tolerance:
+                self._end_boost(now, since)
+            else:
+                # Ball never arrived — nothing to learn from
+                self._start = self._exit = None
+            return 0.0
+        # No learned dip yet (first shot) — size from the dip being measured
+        dip = self.expected_dip if self.expected_dip > 0.0 else self._peak_error
+        return min(self.volts_per_rpm * dip, BOOST_MAX_VOLTS)
@@ -9,14 +9,54 @@ from dataclasses import dataclass
 from math import radians
 from urllib.parse import ParseResult, urlparse
 
-from ntcore import DoubleArrayEntry, NetworkTable, NetworkTableEntry, NetworkTableInstance
+from ntcore import (
+    DoubleArrayEntry,
+    DoubleEntry,
+    NetworkTable,
+    NetworkTableEntry,
+    NetworkTableInstance,
+    PubSubOptions,
+    StringArrayEntry,
+    StringEntry,
+)
 from wpimath import units
-from wpimath.geometry import Pose2d, Pose3d, Rotation2d, Rotation3d, Translation2d, Translation3d
+from wpimath.geometry import Pose2d, Pose3d, Rotation2d, Rotation3d, Translation3d
 
 
 class ConcurrentDict(dict):
     def compute_if_absent(self, key, mapping_function):
-        return self.setdefault(key, mapping_function())
+        value = self.get(key)
+        if value is None:
+            value = self.setdefault(key, mapping_function())
+        return value
+
+
+# Typed entry factories for LimelightHelpers._cached_entry()
+def _double_entry(table: NetworkTable, name: str) -> DoubleEntry:
+    return table.getDoubleTopic(name).getEntry(0.0)
+
+
+def _double_array_entry(table: NetworkTable, name: str) -> DoubleArrayEntry:
+    return table.getDoubleArrayTopic(name).getEntry([])
+
+
+def _double_array_queue(table: NetworkTable, name: str) -> DoubleArrayEntry:
+    # keepDuplicates so a republished frame reaches readQueue() and can be counted as a duplicate
+    options = PubSubOptions(pollStorage=_QUEUE_DEPTH, keepDuplicates=True)
+    return table.getDoubleArrayTopic(name).getEntry([], options)
+
+
+def _string_entry(table: NetworkTable, name: str) -> StringEntry:
+    return table.getStringTopic(name).getEntry("")
+
+
+def _string_array_entry(table: NetworkTable, name: str) -> StringArrayEntry:
+    return table.getStringArrayTopic(name).getEntry([])
+
+
+_VALS_PER_FIDUCIAL = 7
+_VALS_PER_DETECTION = 12
+_QUEUE_DEPTH = 10  # Frames kept between readQueue() calls — ~100 ms at the Limelight's top frame rate
 
 
 @dataclass
@@ -125,7 +165,15 @@ class LimelightHelpers:
     """
 
     _nt_instance = NetworkTableInstance.getDefault()
+    # Everything below is keyed "<limelight name>/<entry name>" and created on first use,
+    # so per-loop reads are one dict lookup instead of getTable() + getEntry()
+    _tables = ConcurrentDict()
+    _entries = ConcurrentDict()
+    _double_entries = ConcurrentDict()
     _double_array_entries = ConcurrentDict()
+    _double_array_queues = ConcurrentDict()
+    _string_entries = ConcurrentDict()
+    _string_array_entries = ConcurrentDict()
 
     @staticmethod
     def _sanitize_name(name: str | None) -> str:
@@ -162,7 +210,7 @@ class LimelightHelpers:
         if len(in_data) < 6:
             return Pose2d()
         else:
-            return Pose2d(Translation2d(in_data[0], in_data[1]), Rotation2d(radians(in_data[5])))
+            return Pose2d(in_data[0], in_data[1], Rotation2d(radians(in_data[5])))
 
     @staticmethod
     def pose_3d_to_array(pose: Pose3d) -> list[float]:
@@ -201,19 +249,22 @@ class LimelightHelpers:
             units.radiansToDegrees(pose.rotation().radians()),
         ]
 
-    @staticmethod
-    def _extract_array_entry(in_data: list[float], position: int) -> float:
-        if len(in_data) < position + 1:
-            return 0
-        return in_data[position]
-
     @staticmethod
     def _get_botpose_estimate(limelight_name: str, entry_name: str, is_megatag_2: bool) -> PoseEstimate:
         pose_entry = LimelightHelpers.get_limelight_double_array_entry(limelight_name, entry_name)
 
         ts_value = pose_entry.getAtomic()  # Consider replacing this if needed
-        pose_array, timestamp = ts_value.value, ts_value.time
+        return LimelightHelpers.pose_estimate_from_array(ts_value.value, ts_value.time, is_megatag_2)
 
+    @staticmethod
+    def pose_estimate_from_array(pose_array: list[float], timestamp: int, is_megatag_2: bool) -> PoseEstimate:
+        """
+        Parses a botpose array into a PoseEstimate.
+        @param pose_array botpose_* value: pose, latency, tag stats, then 7 values per fiducial
+        @param timestamp NT timestamp of the value (its publish time) in microseconds
+        @param is_megatag_2 Whether the array came from a botpose_orb_* topic
+        @return PoseEstimate, empty if the array is empty
+        """
         if not pose_array:
             return PoseEstimate()
 
@@ -224,14 +275,11 @@ class LimelightHelpers:
         # Timestamp adjustment
         timestamp = timestamp * 1e-6 - latency * 1e-3  # Avoid extra divisions
 
-        vals_per_fiducial = 7
         base_index = 11
+        end_index = base_index + tag_count * _VALS_PER_FIDUCIAL
         raw_fiducials = (
-            [
-                RawFiducial(int(pose_array[i]), *pose_array[i + 1 : i + 7])
-                for i in range(base_index, base_index + tag_count * vals_per_fiducial, vals_per_fiducial)
-            ]
-            if len(pose_array) >= base_index + tag_count * vals_per_fiducial
+            LimelightHelpers._parse_raw_fiducials(pose_array, base_index, end_index)
+            if len(pose_array) >= end_index
             else []
         )
 
@@ -247,6 +295,11 @@ class LimelightHelpers:
             is_megatag_2,
         )
 
+    @staticmethod
+    def _parse_raw_fiducials(data: list[float], start: int, end: int) -> list[RawFiducial]:
+        step = _VALS_PER_FIDUCIAL
+        return [RawFiducial(int(data[i]), *data[i + 1 : i + step]) for i in range(start, end, step)]
+
     @staticmethod
     def get_raw_fiducials(limelight_name: str) -> list[RawFiducial]:
         """
@@ -255,28 +308,24 @@ class LimelightHelpers:
         @param limelight_name Name/identifier of the Limelight
         @return Array of RawFiducial objects containing detection details
         """
-        entry = LimelightHelpers.get_limelight_NTTableEntry(limelight_name, "rawfiducials")
-        raw_fiducial_array = entry.getDoubleArray([])
-        vals_per_entry = 7
-        if len(raw_fiducial_array) % vals_per_entry != 0:
+        raw_fiducial_array = LimelightHelpers.get_limelight_NTDoubleArray(limelight_name, "rawfiducials")
+        if len(raw_fiducial_array) % _VALS_PER_FIDUCIAL != 0:
             return []
+        return LimelightHelpers._parse_raw_fiducials(raw_fiducial_array, 0, len(raw_fiducial_array))
 
-        num_fiducials = len(raw_fiducial_array) // vals_per_entry
-        raw_fiducials = []
-
-        for i in range(num_fiducials):
-            base_index = i * vals_per_entry
-            tag_id = int(LimelightHelpers._extract_array_entry(raw_fiducial_array, base_index))
-            txnc = LimelightHelpers._extract_array_entry(raw_fiducial_array, base_index + 1)
-            tync = LimelightHelpers._extract_array_entry(raw_fiducial_array, base_index + 2)
-            ta = LimelightHelpers._extract_array_entry(raw_fiducial_array, base_index + 3)
-            dist_to_camera = LimelightHelpers._extract_array_entry(raw_fiducial_array, base_index + 4)
-            dist_to_robot = LimelightHelpers._extract_array_entry(raw_fiducial_array, base_index + 5)
-            ambiguity = LimelightHelpers._extract_array_entry(raw_fiducial_array, base_index + 6)
-
-            raw_fiducials.append(RawFiducial(tag_id, txnc, tync, ta, dist_to_camera, dist_to_robot, ambiguity))
+    @staticmethod
+    def get_raw_fiducial_columns(limelight_name: str) -> tuple[list[float], ...]:
+        """
+        Gets the latest raw fiducial results as one list per field, without building a RawFiducial per tag.
 
-        return raw_fiducials
+        @param limelight_name Name/identifier of the Limelight
+        @return (ids, txnc, tync, ta, dist_to_camera, dist_to_robot, ambiguity), each one value per tag
+        """
+        data = LimelightHelpers.get_limelight_NTDoubleArray(limelight_name, "rawfiducials")
+        step = _VALS_PER_FIDUCIAL
+        if len(data) % step != 0:
+            data = []
+        return tuple(data[field::step] for field in range(step))
 
     @staticmethod
     def get_raw_detections(limelight_name: str) -> list[RawDetection]:
@@ -286,48 +335,14 @@ class LimelightHelpers:
         @param limelight_name Name/identifier of the Limelight
         @return Array of RawDetection objects containing detection details
         """
-        entry = LimelightHelpers.get_limelight_NTTableEntry(limelight_name, "rawdetections")
-        raw_detection_array = entry.getDoubleArray([])
-        vals_per_entry = 12
-        if len(raw_detection_array) % vals_per_entry != 0:
+        raw_detection_array = LimelightHelpers.get_limelight_NTDoubleArray(limelight_name, "rawdetections")
+        step = _VALS_PER_DETECTION
+        if len(raw_detection_array) % step != 0:
             return []
-
-        num_detections = len(raw_detection_array) // vals_per_entry
-        raw_detections = []
-
-        for i in range(num_detections):
-            base_index = i * vals_per_entry  # Starting index for this detection's data
-            class_id = int(LimelightHelpers._extract_array_entry(raw_detection_array, base_index))
-            txnc = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 1)
-            tync = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 2)
-            ta = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 3)
-            corner0_x = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 4)
-            corner0_y = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 5)
-            corner1_x = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 6)
-            corner1_y = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 7)
-            corner2_x = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 8)
-            corner2_y = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 9)
-            corner3_x = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 10)
-            corner3_y = LimelightHelpers._extract_array_entry(raw_detection_array, base_index + 11)
-
-            raw_detections.append(
-                RawDetection(
-                    class_id,
-                    txnc,
-                    tync,
-                    ta,
-                    corner0_x,
-                    corner0_y,
-                    corner1_x,
-                    corner1_y,
-                    corner2_x,
-                    corner2_y,
-                    corner3_x,
-                    corner3_y,
-                )
-            )
-
-        return raw_detections
+        return [
+            RawDetection(int(raw_detection_array[i]), *raw_detection_array[i + 1 : i + step])
+            for i in range(0, len(raw_detection_array), step)
+        ]
 
     @staticmethod
     def print_pose_estimate(pose: PoseEstimate) -> None:
@@ -375,49 +390,82 @@ class LimelightHelpers:
 
     @staticmethod
     def get_limelight_NTTable(table_name: str) -> NetworkTable:
-        return LimelightHelpers._nt_instance.getTable(LimelightHelpers._sanitize_name(table_name))
+        table = LimelightHelpers._tables.get(table_name)
+        if table is None:
+            table = LimelightHelpers._tables.setdefault(
+                table_name, LimelightHelpers._nt_instance.getTable(LimelightHelpers._sanitize_name(table_name))
+            )
+        return table
 
     @staticmethod
     def flush() -> None:
         LimelightHelpers._nt_instance.flush()
 
+    @staticmethod
+    def _cached_entry(cache: ConcurrentDict, table_name: str, entry_name: str, make):
+        key = f"{table_name}/{entry_name}"
+        entry = cache.get(key)
+        if entry is None:
+            entry = cache.setdefault(key, make(LimelightHelpers.get_limelight_NTTable(table_name), entry_name))
+        return entry
+
     @staticmethod
     def get_limelight_NTTableEntry(table_name: str, entry_name: str) -> NetworkTableEntry:
-        return LimelightHelpers.get_limelight_NTTable(table_name).getEntry(entry_name)
+        return LimelightHelpers._cached_entry(LimelightHelpers._entries, table_name, entry_name, NetworkTable.getEntry)
+
+    @staticmethod
+    def get_limelight_double_entry(table_name: str, entry_name: str) -> DoubleEntry:
+        return LimelightHelpers._cached_entry(LimelightHelpers._double_entries, table_name, entry_name, _double_entry)
 
     @staticmethod
     def get_limelight_double_array_entry(table_name: str, entry_name: str) -> DoubleArrayEntry:
-        key = f"{table_name}/{entry_name}"
-        if key in LimelightHelpers._double_array_entries:
-            return LimelightHelpers._double_array_entries[key]
+        return LimelightHelpers._cached_entry(
+            LimelightHelpers._double_array_entries, table_name, entry_name, _double_array_entry
+        )
 
-        return LimelightHelpers._double_array_entries.setdefault(
-            key, LimelightHelpers.get_limelight_NTTable(table_name).getDoubleArrayTopic(entry_name).getEntry([])
+    @staticmethod
+    def get_limelight_double_array_queue(table_name: str, entry_name: str) -> DoubleArrayEntry:
+        """
+        Double array entry whose readQueue() returns every value received since the last call,
+        each with its own timestamp. Separate from get_limelight_double_array_entry().
+        """
+        return LimelightHelpers._cached_entry(
+            LimelightHelpers._double_array_queues, table_name, entry_name, _double_array_queue
+        )
+
+    @staticmethod
+    def get_limelight_string_entry(table_name: str, entry_name: str) -> StringEntry:
+        return LimelightHelpers._cached_entry(LimelightHelpers._string_entries, table_name, entry_name, _string_entry)
+
+    @staticmethod
+    def get_limelight_string_array_entry(table_name: str, entry_name: str) -> StringArrayEntry:
+        return LimelightHelpers._cached_entry(
+            LimelightHelpers._string_array_entries, table_name, entry_name, _string_array_entry
         )
 
     @staticmethod
     def get_limelight_NTDouble(table_name: str, entry_name: str) -> float:
-        return LimelightHelpers.get_limelight_NTTableEntry(table_name, entry_name).getDouble(0.0)
+        return LimelightHelpers.get_limelight_double_entry(table_name, entry_name).get()
 
     @staticmethod
     def set_limelight_NTDouble(table_name: str, entry_name: str, val: float) -> None:
-        LimelightHelpers.get_limelight_NTTableEntry(table_name, entry_name).setDouble(val)
+        LimelightHelpers.get_limelight_double_entry(table_name, entry_name).set(val)
 
     @staticmethod
     def set_limelight_NTDoubleArray(table_name: str, entry_name: str, val: list[float]) -> None:
-        LimelightHelpers.get_limelight_NTTableEntry(table_name, entry_name).setDoubleArray(val)  # type: ignore[arg-type]
+        LimelightHelpers.get_limelight_double_array_entry(table_name, entry_name).set(val)
 
     @staticmethod
     def get_limelight_NTDoubleArray(table_name: str, entry_name: str) -> list[float]:
-        return LimelightHelpers.get_limelight_NTTableEntry(table_name, entry_name).getDoubleArray([])
+        return LimelightHelpers.get_limelight_double_array_entry(table_name, entry_name).get()
 
     @staticmethod
     def get_limelight_NTString(table_name: str, entry_name: str) -> str:
-        return LimelightHelpers.get_limelight_NTTableEntry(table_name, entry_name).getString("")
+        return LimelightHelpers.get_limelight_string_entry(table_name, entry_name).get()
 
     @staticmethod
     def get_limelight_NTStringArray(table_name: str, entry_name: str) -> list[str]:
-        return LimelightHelpers.get_limelight_NTTableEntry(table_name, entry_name).getStringArray([])
+        return LimelightHelpers.get_limelight_string_array_entry(table_name, entry_name).get()
 
     @staticmethod
     def get_limelight_url_string(table_name: str, request: str) -> ParseResult | None:
@@ -0,0 +1,150 @@
+"""
+Batched NT telemetry — subsystems register each topic once with a getter and a rate
+tier, and a single flush() per robot loop publishes only what is due and has changed.
+
+    FAST        polled every loop; published when it moves more than its deadband
+    SLOW        polled every SLOW_PERIOD_LOOPS loops (5 Hz) — temperatures, diagnostics
+    ON_CHANGE   polled every loop; published on any change — flags, counters, states
+
+Getters of values that are not due are not called, so slow values skip their sensor reads
+too, and unchanged values never cross into ntcore. Slow topics are spread across the
+SLOW_PERIOD_LOOPS phases so they do not all land on the same loop.
+
+Related values can be registered as one group: a wpistruct dataclass published on a
+single struct topic, which costs one set() for the whole group. Each field can have its
+own deadband; the group is published when any field moves past its own.
+"""
+
+import dataclasses
+from collections.abc import Callable
+from typing import Any, ClassVar, Self
+
+import ntcore
+
+FAST = "fast"
+SLOW = "slow"
+ON_CHANGE = "on_change"
+SLOW_PERIOD_LOOPS = 10  # 5 Hz at the 20 ms loop
+
+# Common deadbands — well under what a dashboard plot or tuning session resolves
+RPM_DEADBAND = 1.0  # TUNE
+AMPS_DEADBAND = 0.1  # TUNE
+TURNS_DEADBAND = 0.005  # TUNE
+
+# Per-field deadbands of a struct topic: (field name, deadband) for every field
+FieldDeadbands = tuple[tuple[str, float], ...]
+
+
+class _Topic:
+    __slots__ = ("deadband", "getter", "last", "period", "phase", "publisher")
+
+    def __init__(
+        self,
+        publisher: Any,
+        getter: Callable[[], Any],
+        period: int,
+        phase: int,
+        deadband: float | FieldDeadbands | None,
+    ):
+        self.publisher = publisher
+        self.getter = getter
+        self.period = period
+        self.phase = phase
+        self.deadband = deadband  # None: publish on any change (non-numeric values)
+        self.last: Any = None
+
+
+class BatchedPublisher:
+    """Shared NT publisher. Register topics in __init__, call flush() once per robot loop."""
+
+    _instance: ClassVar[Self | None] = None
+
+    def __init__(self, inst: ntcore.NetworkTableInstance | None = None):
+        self._inst = inst or ntcore.NetworkTableInstance.getDefault()
+        self._topics: list[_Topic] = []
+        self._slow_count = 0
+        self._loop = 0
+        self.published = 0  # set() calls made by the last flush()
+
+    @classmethod
+    def instance(cls) -> Self:
+        """The robot-wide publisher that robotPeriodic() flushes."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Drop the robot-wide publisher and its topics, before subsystems are rebuilt."""
+        cls._instance = None
+
+    def _add(
+        self, publisher: Any, getter: Callable[[], Any], tier: str, deadband: float | FieldDeadbands | None
+    ) -> None:
+        if tier == SLOW:
+            period, phase = SLOW_PERIOD_LOOPS, self._slow_count % SLOW_PERIOD_LOOPS
+            self._slow_count += 1
+        else:
+            period, phase = 1, 0
+        if tier == ON_CHANGE:
+            deadband = None
+        self._topics.append(_Topic(publisher, getter, period, phase, deadband))
+
+    def add_double(
+        self, table: str, name: str, getter: Callable[[], float], tier: str = FAST, deadband: float = 0.0
+    ) -> None:
+        self._add(self._inst.getTable(table).getDoubleTopic(name).publish(), getter, tier, deadband)
+
+    def add_boolean(self, table: str, name: str, getter: Callable[[], bool], tier: str = ON_CHANGE) -> None:
+        self._add(self._inst.getTable(table).getBooleanTopic(name).publish(), getter, tier, None)
+
+    def add_integer(self, table: str, name: str, getter: Callable[[], int], tier: str = ON_CHANGE) -> None:
+        self._add(self._inst.getTable(table).getIntegerTopic(name).publish(), getter, tier, None)
+
+    def add_struct(
+        self,
+        table: str,
+        name: str,
+        struct_type: type,
+        getter: Callable[[], Any],
+        tier: str = FAST,
+        deadbands: dict[str, float] | None = None,
+    ) -> None:
+        """
+        A group of values as one wpistruct topic. Without deadbands it is published when any
+        field changes; with them, when any field moves more than its deadband (fields left
+        out have none).
+        """
+        deadband: FieldDeadbands | None = None
+        if deadbands:
+            names = [field.name for field in dataclasses.fields(struct_type)]
+            unknown = deadbands.keys() - set(names)
+            if unknown:
+                raise ValueError(f"{struct_type.__name__} has no fields {sorted(unknown)}")
+            deadband = tuple((field, deadbands.get(field, 0.0)) for field in names)
+        self._add(self._inst.getTable(table).getStructTopic(name, struct_type).publish(), getter, tier, deadband)
+
+    def flush(self) -> None:
+        """Poll the topics due this loop and publish the ones that changed."""
+        loop = self._loop
+        self._loop += 1
+        published = 0
+        for topic in self._topics:
+            if topic.period != 1 and loop % topic.period != topic.phase:
+                continue
+            value = topic.getter()
+            last = topic.last
+            if last is not None:
+                deadband = topic.deadband
+                if deadband is None:
+                    if value == last:
+                        continue
+                elif type(deadband) is tuple:
+                    if all(abs(getattr(value, f) - getattr(last, f)) <= db for f, db in deadband):
+                        continue
+                elif abs(value - last) <= deadband:
+                    continue
+            topic.publisher.set(value)
+            topic.last = value
+            published += 1
+        self.published = published
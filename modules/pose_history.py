@@ -0,0 +1,152 @@
+"""
+Pose history — fixed-size ring buffer of drivetrain samples (timestamp, pose, chassis
+speeds, module states) with interpolated lookups at any past time and range slices, for
+shot analytics, vision latency compensation and post-match review.
+
+Storage is preallocated parallel float lists, written in place: recording a sample from
+the odometry thread allocates nothing. Queries binary-search the timestamps (O(log n))
+and build Pose2d / ChassisSpeeds / SwerveModuleState objects only for what they return.
+
+One writer (the odometry thread) and any number of readers, without a lock: a sample's
+fields are written before the count that publishes it, and queries leave out the oldest
+slot, which is the next one to be overwritten.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from wpimath.geometry import Pose2d, Rotation2d
+from wpimath.kinematics import ChassisSpeeds, SwerveModuleState
+
+CAPACITY = 256  # ~5 s of 50 Hz odometry  # TUNE
+MODULES = 4
+
+
+@dataclass(frozen=True, slots=True)
+class PoseSample:
+    timestamp: float  # s, FPGA time
+    pose: Pose2d
+    speeds: ChassisSpeeds  # robot-relative
+    module_states: tuple[SwerveModuleState, ...]
+
+
+class PoseHistory:
+    """Ring buffer of the last `capacity` drivetrain samples, in timestamp order."""
+
+    def __init__(self, capacity: int = CAPACITY, modules: int = MODULES):
+        self._capacity = capacity
+        self._modules = modules
+        self._t = [0.0] * capacity
+        self._x = [0.0] * capacity
+        self._y = [0.0] * capacity
+        self._heading = [0.0] * capacity
+        self._vx = [0.0] * capacity
+        self._vy = [0.0] * capacity
+        self._omega = [0.0] * capacity
+        self._module_speed = [0.0] * (capacity * modules)
+        self._module_angle = [0.0] * (capacity * modules)
+        self._next = 0  # Slot the next sample goes into
+        self._count = 0
+
+    def __len__(self) -> int:
+        return max(self._count - 1, 0) if self._count == self._capacity else self._count
+
+    def clear(self) -> None:
+        """Drop every sample. Call from the writer thread only, like add()."""
+        self._count = 0
+
+    def add(self, timestamp: float, pose: Pose2d, speeds: ChassisSpeeds, module_states: Sequence[SwerveModuleState]):
+        """Record a sample. Samples older than the newest one are dropped."""
+        if self._count and timestamp <= self._t[(self._next - 1) % self._capacity]:
+            return
+        i = self._next
+        self._t[i] = timestamp
+        self._x[i] = pose.X()
+        self._y[i] = pose.Y()
+        self._heading[i] = pose.rotation().radians()
+        self._vx[i] = speeds.vx
+        self._vy[i] = speeds.vy
+        self._omega[i] = speeds.omega
+        base = i * self._modules
+        for m, state in enumerate(module_states[: self._modules]):
+            self._module_speed[base + m] = state.speed
+            self._module_angle[base + m] = state.angle.radians()
+        self._next = (i + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def _window(self) -> tuple[int, int]:
+        """(slot of the oldest readable sample, number of readable samples)."""
+        count = self._count
+        end = self._next
+        if count == self._capacity:
+            count -= 1
+        return (end - count) % self._capacity, count
+
+    def _bisect(self, timestamp: float, start: int, count: int, right: bool) -> int:
+        """Logical index (0 = oldest readable) where timestamp would be inserted."""
+        t, capacity = self._t, self._capacity
+        search = bisect_right if right else bisect_left
+        return search(range(count), timestamp, key=lambda k: t[(start + k) % capacity])
+
+    def _sample(self, i: int) -> PoseSample:
+        base = i * self._modules
+        return PoseSample(
+            self._t[i],
+            Pose2d(self._x[i], self._y[i], Rotation2d(self._heading[i])),
+            ChassisSpeeds(self._vx[i], self._vy[i], self._omega[i]),
+            tuple(
+                SwerveModuleState(self._module_speed[base + m], Rotation2d(self._module_angle[base + m]))
+                for m in range(self._modules)
+            ),
+        )
+
+    def sample_at(self, timestamp: float) -> PoseSample | None:
+        """
+        Sample interpolated at timestamp, clamped to the oldest and newest samples;
+        None when the buffer is empty.
+        """
+        start, count = self._window()
+        if count == 0:
+            return None
+        k = self._bisect(timestamp, start, count, right=True)
+        if k == 0:
+            return self._sample(start)
+        if k == count:
+            return self._sample((start + count - 1) % self._capacity)
+        a = (start + k - 1) % self._capacity
+        b = (start + k) % self._capacity
+        t0, t1 = self._t[a], self._t[b]
+        f = (timestamp - t0) / (t1 - t0)
+
+        def lerp(values: list[float], i: int, j: int) -> float:
+            return values[i] + (values[j] - values[i]) * f
+
+        def slerp(values: list[float], i: int, j: int) -> float:
+            return values[i] + math.remainder(values[j] - values[i], math.tau) * f
+
+        base_a, base_b = a * self._modules, b * self._modules
+        return PoseSample(
+            timestamp,
+            Pose2d(lerp(self._x, a, b), lerp(self._y, a, b), Rotation2d(slerp(self._heading, a, b))),
+            ChassisSpeeds(lerp(self._vx, a, b), lerp(self._vy, a, b), lerp(self._omega, a, b)),
+            tuple(
+                SwerveModuleState(
+                    lerp(self._module_speed, base_a + m, base_b + m),
+                    Rotation2d(slerp(self._module_angle, base_a + m, base_b + m)),
+                )
+                for m in range(self._modules)
+            ),
+        )
+
+    def between(self, start_s: float, end_s: float) -> list[PoseSample]:
+        """Recorded samples with start_s <= timestamp <= end_s, oldest first."""
+        start, count = self._window()
+        first = self._bisect(start_s, start, count, right=False)
+        last = self._bisect(end_s, start, count, right=True)
+        return [self._sample((start + k) % self._capacity) for k in range(first, last)]
+
+    def latest(self) -> PoseSample | None:
+        start, count = self._window()
+        return self._sample((start + count - 1) % self._capacity) if count else None
@@ -0,0 +1,147 @@
+"""
+Loop profiler — opt-in timing of subsystem periodic(), command execute() and the drive
+telemetry callback, to show where the 20 ms loop goes when the scheduler reports an
+overrun. Commands are timed per instance as the scheduler initializes them, so commands
+running inside a group count toward the group rather than appearing on their own.
+
+With PROFILER_ENABLED off nothing is wrapped and the loop runs exactly as before. With it
+on, wrapped calls are timed while the Profiler/Enabled tunable is true (one attribute
+check per call while it is false), and every PUBLISH_PERIOD_S the rolling p50/p99/max of
+each item's last WINDOW samples goes to the Profiler NT table and the DataLog.
+
+The telemetry callback runs on the CTRE odometry thread; its samples are written there
+and read here without a lock, which can at worst mix one stale sample into a window.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+
+import ntcore
+from commands2 import Command, CommandScheduler, Subsystem
+from wpilib import DataLogManager
+from wpiutil.log import DoubleArrayLogEntry
+
+PROFILER_ENABLED = False  # Wrap periodic()/execute()/telemetry at startup  # TUNE
+WINDOW = 250  # Samples per item — 5 s of 20 ms loops
+PUBLISH_PERIOD_S = 1.0
+
+
+class _Samples:
+    """Ring buffer of the last WINDOW call durations (seconds) for one item."""
+
+    __slots__ = ("count", "durations", "index")
+
+    def __init__(self):
+        self.durations = [0.0] * WINDOW
+        self.index = 0
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        self.durations[self.index] = seconds
+        self.index = (self.index + 1) % WINDOW
+        self.count = min(self.count + 1, WINDOW)
+
+    def stats_ms(self) -> tuple[float, float, float]:
+        """(p50, p99, max) in milliseconds over the window."""
+        ordered = sorted(self.durations[: self.count])
+        last = len(ordered) - 1
+        return (
+            ordered[int(0.5 * last)] * 1e3,
+            ordered[int(0.99 * last)] * 1e3,
+            ordered[last] * 1e3,
+        )
+
+
+class _ItemOutput:
+    """NT publishers and DataLog entry for one profiled item."""
+
+    def __init__(self, table: ntcore.NetworkTable, name: str):
+        self.p50 = table.getDoubleTopic(f"{name}/p50Ms").publish()
+        self.p99 = table.getDoubleTopic(f"{name}/p99Ms").publish()
+        self.max = table.getDoubleTopic(f"{name}/maxMs").publish()
+        self.log = DoubleArrayLogEntry(DataLogManager.getLog(), f"Profiler/{name}")
+
+    def publish(self, p50: float, p99: float, max_ms: float) -> None:
+        self.p50.set(p50)
+        self.p99.set(p99)
+        self.max.set(max_ms)
+        self.log.append([p50, p99, max_ms])
+
+
+class Profiler:
+    """
+    Times wrapped callables by name. Call periodic() once per robot loop to pick up the
+    Profiler/Enabled tunable and publish.
+    """
+
+    def __init__(self, active: bool = PROFILER_ENABLED):
+        self.active = active  # False: wrap() returns callables unchanged
+        self.enabled = active
+        self._samples: dict[str, _Samples] = {}
+        self._outputs: dict[str, _ItemOutput] = {}
+        self._command_instances: dict[str, int] = {}  # command name → instances wrapped so far
+        self._last_publish_s = time.perf_counter()
+
+        self._table = ntcore.NetworkTableInstance.getDefault().getTable("Profiler")
+        self._enabled_pub = self._table.getBooleanTopic("Enabled").publish()
+        self._enabled_pub.set(active)
+        self._enabled_sub = self._table.getBooleanTopic("Enabled").subscribe(active)
+
+    def wrap[**P, R](self, name: str, fn: Callable[P, R]) -> Callable[P, R]:
+        """fn, timed under name. Returned unchanged when the profiler is not active."""
+        if not self.active:
+            return fn
+        samples = self._samples.setdefault(name, _Samples())
+
+        def timed(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                samples.add(time.perf_counter() - start)
+
+        return timed
+
+    def instrument_subsystems(self, subsystems: Iterable[Subsystem]) -> None:
+        """Time each subsystem's periodic() (the scheduler looks it up on the instance)."""
+        for subsystem in subsystems:
+            subsystem.periodic = self.wrap(f"{subsystem.getName()}.periodic", subsystem.periodic)
+
+    def instrument_commands(self, scheduler: CommandScheduler) -> None:
+        """
+        Time execute() of every command the scheduler initializes from now on, one item per
+        command instance: unnamed RunCommands and the like would otherwise share a bucket, so
+        the second instance with a name is reported as "Name#2", and so on. Commands inside a
+        group are never scheduled on their own; their time is part of the group's execute().
+        """
+        if self.active:
+            scheduler.onCommandInitialize(self._wrap_execute)
+
+    def _wrap_execute(self, command: Command) -> None:
+        if getattr(command, "_profiled", False):
+            return
+        name = command.getName()
+        instance = self._command_instances.get(name, 0) + 1
+        self._command_instances[name] = instance
+        if instance > 1:
+            name = f"{name}#{instance}"
+        command.execute = self.wrap(f"{name}.execute", command.execute)
+        command._profiled = True  # type: ignore[attr-defined]
+
+    def periodic(self) -> None:
+        if not self.active:
+            return
+        self.enabled = self._enabled_sub.get()
+        now_s = time.perf_counter()
+        if now_s - self._last_publish_s < PUBLISH_PERIOD_S:
+            return
+        self._last_publish_s = now_s
+        for name, samples in list(self._samples.items()):
+            if samples.count == 0:
+                continue
+            output = self._outputs.get(name)
+            if output is None:
+                output = self._outputs[name] = _ItemOutput(self._table, name)
+            output.publish(*samples.stats_ms())
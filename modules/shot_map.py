@@ -0,0 +1,315 @@
+"""
+Shot map — shooter RPM and hood turns as a function of distance, interpolated
+through the calibration points instead of fitted with a single line.
+
+Points come from SHOT_TABLE or from the CSV TuneShot.record_entry() appends to
+(distance_m, hood_turns, shooter_rpm). reload() picks up new CSV rows while the
+robot code keeps running.
+"""
+
+import csv
+import os
+from bisect import bisect_right
+from pathlib import Path
+
+import numpy as np
+
+LINEAR = "linear"
+MONOTONE = "monotone"  # Fritsch-Carlson monotone cubic Hermite
+
+_MIN_SPACING_M = 0.05  # points closer than this are averaged into one
+
+
+def _merge_points(
+    entries: list[tuple[float, float, float]],
+) -> tuple[list[float], list[float], list[float]]:
+    """Sort by distance and average points closer than _MIN_SPACING_M.
+
+    Returns (distances, hood_turns, rpms).
+    """
+    xs: list[float] = []
+    hoods: list[float] = []
+    rpms: list[float] = []
+    cluster: list[tuple[float, float, float]] = []
+
+    def _flush():
+        n = len(cluster)
+        xs.append(sum(d for d, _, _ in cluster) / n)
+        hoods.append(sum(h for _, h, _ in cluster) / n)
+        rpms.append(sum(r for _, _, r in cluster) / n)
+        cluster.clear()
+
+    for entry in sorted(entries):
+        if cluster and entry[0] - cluster[0][0] >= _MIN_SPACING_M:
+            _flush()
+        cluster.append(entry)
+    if cluster:
+        _flush()
+    return xs, hoods, rpms
+
+
+def _monotone_tangents(xs: list[float], ys: list[float]) -> list[float]:
+    """Fritsch-Carlson tangents: no overshoot between points, monotone data stays monotone."""
+    n = len(xs)
+    secants = [(ys[k + 1] - ys[k]) / (xs[k + 1] - xs[k]) for k in range(n - 1)]
+    tangents = [secants[0]] + [0.0] * (n - 2) + [secants[-1]]
+    for k in range(1, n - 1):
+        if secants[k - 1] * secants[k] > 0:
+            # Weighted harmonic mean of the neighbouring secants
+            h0 = xs[k] - xs[k - 1]
+            h1 = xs[k + 1] - xs[k]
+            w0 = 2 * h1 + h0
+            w1 = h1 + 2 * h0
+            tangents[k] = (w0 + w1) / (w0 / secants[k - 1] + w1 / secants[k])
+    for k in range(n - 1):
+        if secants[k] == 0:
+            tangents[k] = tangents[k + 1] = 0.0
+            continue
+        a = tangents[k] / secants[k]
+        b = tangents[k + 1] / secants[k]
+        if a < 0:
+            tangents[k] = 0.0
+        if b < 0:
+            tangents[k + 1] = 0.0
+        if a * a + b * b > 9:
+            tau = 3 / (a * a + b * b) ** 0.5
+            tangents[k] = tau * a * secants[k]
+            tangents[k + 1] = tau * b * secants[k]
+    return tangents
+
+
+class _Curve:
+    """One interpolated column (RPM or hood) over the shared distance knots."""
+
+    def __init__(self, xs: list[float], ys: list[float], mode: str):
+        self.ys = ys
+        if len(xs) < 2:
+            self.tangents = [0.0] * len(xs)
+        elif mode == MONOTONE:
+            self.tangents = _monotone_tangents(xs, ys)
+        else:
+            # Linear: extrapolate with the end secants, tangents unused inside the range
+            self.tangents = [(ys[1] - ys[0]) / (xs[1] - xs[0])] * (len(xs) - 1) + [
+                (ys[-1] - ys[-2]) / (xs[-1] - xs[-2])
+            ]
+        self.cubic = mode == MONOTONE
+        self.ys_array = np.asarray(ys, dtype=float)
+        self.tangents_array = np.asarray(self.tangents, dtype=float)
+
+    def value(self, k: int, t: float, h: float) -> float:
+        """Value on segment k at normalized position t (0..1), segment width h."""
+        y0 = self.ys[k]
+        y1 = self.ys[k + 1]
+        if not self.cubic:
+            return y0 + (y1 - y0) * t
+        t2 = t * t
+        t3 = t2 * t
+        return (
+            (2 * t3 - 3 * t2 + 1) * y0
+            + (t3 - 2 * t2 + t) * h * self.tangents[k]
+            + (-2 * t3 + 3 * t2) * y1
+            + (t3 - t2) * h * self.tangents[k + 1]
+        )
+
+    def values(self, k: np.ndarray, t: np.ndarray, h: np.ndarray) -> np.ndarray:
+        """Vectorized value(): one segment index and position per element."""
+        y0 = self.ys_array[k]
+        y1 = self.ys_array[k + 1]
+        if not self.cubic:
+            return y0 + (y1 - y0) * t
+        t2 = t * t
+        t3 = t2 * t
+        return (
+            (2 * t3 - 3 * t2 + 1) * y0
+            + (t3 - 2 * t2 + t) * h * self.tangents_array[k]
+            + (-2 * t3 + 3 * t2) * y1
+            + (t3 - t2) * h * self.tangents_array[k + 1]
+        )
+
+    def slopes(self, k: np.ndarray, t: np.ndarray, h: np.ndarray) -> np.ndarray:
+        """Vectorized slope()."""
+        y0 = self.ys_array[k]
+        y1 = self.ys_array[k + 1]
+        if not self.cubic:
+            return (y1 - y0) / h
+        t2 = t * t
+        return (
+            (6 * t2 - 6 * t) * y0 / h
+            + (3 * t2 - 4 * t + 1) * self.tangents_array[k]
+            + (-6 * t2 + 6 * t) * y1 / h
+            + (3 * t2 - 2 * t) * self.tangents_array[k + 1]
+        )
+
+    def slope(self, k: int, t: float, h: float) -> float:
+        """dy/dx on segment k at normalized position t."""
+        y0 = self.ys[k]
+        y1 = self.ys[k + 1]
+        if not self.cubic:
+            return (y1 - y0) / h
+        t2 = t * t
+        return (
+            (6 * t2 - 6 * t) * y0 / h
+            + (3 * t2 - 4 * t + 1) * self.tangents[k]
+            + (-6 * t2 + 6 * t) * y1 / h
+            + (3 * t2 - 2 * t) * self.tangents[k + 1]
+        )
+
+
+class ShotMap:
+    """
+    Distance → (shooter_rpm, hood_turns) lookup with binary-search segment lookup.
+
+    Interpolates linearly or with a monotone cubic between calibration points and
+    extrapolates linearly past either end. When csv_path is set and the file holds
+    at least two distinct distances, its points replace the default table.
+    version increments every time the points change, so cached solutions can rebuild.
+    """
+
+    def __init__(
+        self,
+        entries: list[tuple[float, float, float]],
+        mode: str = MONOTONE,
+        csv_path: Path | None = None,
+    ):
+        self._default = list(entries)
+        self._mode = mode
+        self._csv_path = csv_path
+        self._csv_mtime: float | None = None
+        self.version = 0
+        self.source = "table"
+        self.load(self._default)
+
+    def load(self, entries: list[tuple[float, float, float]]) -> None:
+        """Replace the calibration points."""
+        xs, hoods, rpms = _merge_points(entries)
+        if not xs:
+            raise ValueError("shot map needs at least one point")
+        self._xs = xs
+        self._xs_array = np.asarray(xs, dtype=float)
+        self._rpm = _Curve(xs, rpms, self._mode)
+        self._hood = _Curve(xs, hoods, self._mode)
+        self.version += 1
+
+    @property
+    def points(self) -> list[tuple[float, float, float]]:
+        """Merged (distance, hood_turns, rpm) knots."""
+        return list(zip(self._xs, self._hood.ys, self._rpm.ys, strict=True))
+
+    def _locate(self, distance: float) -> tuple[int, float, float]:
+        """Binary search for the segment. Returns (k, t, h); t < 0 or > 1 outside the range."""
+        xs = self._xs
+        k = min(max(bisect_right(xs, distance) - 1, 0), len(xs) - 2)
+        h = xs[k + 1] - xs[k]
+        return k, (distance - xs[k]) / h, h
+
+    def _extrapolate(self, curve: _Curve, distance: float) -> float:
+        if distance <= self._xs[0]:
+            return curve.ys[0] + curve.tangents[0] * (distance - self._xs[0])
+        return curve.ys[-1] + curve.tangents[-1] * (distance - self._xs[-1])
+
+    def evaluate(self, distance: float) -> tuple[float, float]:
+        """Returns (shooter_rpm, hood_turns) for a given distance."""
+        xs = self._xs
+        if len(xs) < 2:
+            return self._rpm.ys[0], self._hood.ys[0]
+        if distance <= xs[0] or distance >= xs[-1]:
+            return self._extrapolate(self._rpm, distance), self._extrapolate(self._hood, distance)
+        k, t, h = self._locate(distance)
+        return self._rpm.value(k, t, h), self._hood.value(k, t, h)
+
+    def rpm_slope(self, distance: float) -> float:
+        """d(rpm)/d(distance) at a given distance."""
+        xs = self._xs
+        if len(xs) < 2:
+            return 0.0
+        if distance <= xs[0]:
+            return self._rpm.tangents[0]
+        if distance >= xs[-1]:
+            return self._rpm.tangents[-1]
+        k, t, h = self._locate(distance)
+        return self._rpm.slope(k, t, h)
+
+    # ── Batch (NumPy) ──────────────────────────────────────────────
+
+    def _locate_many(self, distances: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        xs = self._xs_array
+        k = np.clip(np.searchsorted(xs, distances, side="right") - 1, 0, len(xs) - 2)
+        h = xs[k + 1] - xs[k]
+        return k, (distances - xs[k]) / h, h
+
+    def _values_many(self, curve: _Curve, distances: np.ndarray, k, t, h) -> np.ndarray:
+        xs = self._xs_array
+        below = curve.ys_array[0] + curve.tangents_array[0] * (distances - xs[0])
+        above = curve.ys_array[-1] + curve.tangents_array[-1] * (distances - xs[-1])
+        return np.where(distances <= xs[0], below, np.where(distances >= xs[-1], above, curve.values(k, t, h)))
+
+    def evaluate_many(self, distances: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized evaluate(): (shooter_rpm, hood_turns) arrays, same values element-wise."""
+        distances = np.asarray(distances, dtype=float)
+        if len(self._xs) < 2:
+            return np.full(distances.shape, self._rpm.ys[0]), np.full(distances.shape, self._hood.ys[0])
+        k, t, h = self._locate_many(distances)
+        return self._values_many(self._rpm, distances, k, t, h), self._values_many(self._hood, distances, k, t, h)
+
+    def rpm_slope_many(self, distances: np.ndarray) -> np.ndarray:
+        """Vectorized rpm_slope()."""
+        distances = np.asarray(distances, dtype=float)
+        if len(self._xs) < 2:
+            return np.zeros(distances.shape)
+        k, t, h = self._locate_many(distances)
+        tangents = self._rpm.tangents_array
+        slope = np.where(distances <= self._xs[0], tangents[0], self._rpm.slopes(k, t, h))
+        return np.where(distances >= self._xs[-1], tangents[-1], slope)
+
+    # ── CSV hot reload ─────────────────────────────────────────────
+
+    @staticmethod
+    def read_csv(path: Path) -> list[tuple[float, float, float]]:
+        """Parse a TuneShot log, skipping the header and malformed rows."""
+        entries = []
+        with open(path, newline="") as f:
+            for row in csv.reader(f):
+                if len(row) < 3:
+                    continue
+                try:
+                    entries.append((float(row[0]), float(row[1]), float(row[2])))
+                except ValueError:
+                    continue
+        return entries
+
+    def reload(self) -> bool:
+        """Reload from csv_path if the file changed. Returns True when the points changed.
+
+        Falls back to the default table when the file disappears or has fewer than
+        two distinct distances.
+        """
+        if self._csv_path is None:
+            return False
+        try:
+            mtime = os.stat(self._csv_path).st_mtime
+        except OSError:
+            mtime = None
+        if mtime == self._csv_mtime:
+            return False
+        self._csv_mtime = mtime
+
+        try:
+            entries = self.read_csv(self._csv_path) if mtime is not None else []
+        except OSError:
+            entries = []
+        if len(_merge_points(entries)[0]) >= 2:
+            self.load(entries)
+            self.source = "csv"
+            return True
+        if self.source != "table":
+            self.load(self._default)
+            self.source = "table"
+            return True
+        return False
+
+    def use_default(self) -> None:
+        """Switch back to the default table and stop following the CSV until it changes again."""
+        if self.source != "table":
+            self.load(self._default)
+            self.source = "table"
+        self._csv_mtime = None
@@ -0,0 +1,78 @@
+"""
+Shot-zone map — precomputed "can we shoot from here" cells over the whole field,
+one bitmap per alliance hub, so zone checks are a single array index.
+
+Built by tools/shot_heatmap.py into deploy/ (or at startup when that file is missing
+or was generated from a different shot map) and stored as packed bits:
+
+    header  magic "SHZ1", signature u32, cols u16, rows u16, resolution_m f32
+    blue    ceil(rows * cols / 8) bytes, row-major (row = y, col = x), MSB first
+    red     same layout
+"""
+
+import struct
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+
+_MAGIC = b"SHZ1"
+_HEADER = struct.Struct("<4sIHHf")
+
+
+class ShotZoneMap:
+    """
+    Per-alliance boolean grids with O(1) lookup by field position.
+
+    Cell (row, col) covers x in [col, col + 1) * resolution and y in [row, row + 1) * resolution.
+    signature identifies the shot map and limits the grid was built from.
+    """
+
+    def __init__(self, blue: np.ndarray, red: np.ndarray, resolution: float, signature: int):
+        if blue.shape != red.shape or blue.ndim != 2:
+            raise ValueError(f"shot zone grids must share a 2-D shape, got {blue.shape} and {red.shape}")
+        self.rows, self.cols = blue.shape
+        self.resolution = resolution
+        self.signature = signature
+        self.blue = blue.astype(bool)
+        self.red = red.astype(bool)
+        # bytes index faster than NumPy scalars for single-cell lookups
+        self._cells = (self.blue.tobytes(), self.red.tobytes())
+
+    def contains(self, x: float, y: float, red: bool = False) -> bool:
+        """True if (x, y) lies in a shootable cell for the given alliance's hub."""
+        col = int(x / self.resolution)
+        row = int(y / self.resolution)
+        if x < 0.0 or y < 0.0 or col >= self.cols or row >= self.rows:
+            return False
+        return self._cells[red][row * self.cols + col] != 0
+
+    def fraction(self, red: bool = False) -> float:
+        """Share of field cells that are shootable."""
+        return float((self.red if red else self.blue).mean())
+
+    # ── File format ────────────────────────────────────────────────
+
+    def write(self, path: Path) -> None:
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.signature, self.cols, self.rows, self.resolution))
+            f.write(np.packbits(self.blue).tobytes())
+            f.write(np.packbits(self.red).tobytes())
+
+    @classmethod
+    def read(cls, path: Path) -> Self:
+        """Load a map written by write(). Raises ValueError if the file is malformed."""
+        data = Path(path).read_bytes()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path}: truncated header")
+        magic, signature, cols, rows, resolution = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"{path}: not a shot zone map")
+        n = rows * cols
+        packed = (n + 7) // 8
+        if len(data) != _HEADER.size + 2 * packed or resolution <= 0:
+            raise ValueError(f"{path}: size does not match {cols}x{rows} header")
+        bits = np.frombuffer(data, dtype=np.uint8, offset=_HEADER.size)
+        blue = np.unpackbits(bits[:packed], count=n).reshape(rows, cols)
+        red = np.unpackbits(bits[packed:], count=n).reshape(rows, cols)
+        return cls(blue, red, resolution, signature)
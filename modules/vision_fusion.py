@@ -0,0 +1,93 @@
+"""
+Vision fusion — checks camera estimates against odometry and merges near-simultaneous
+frames from different cameras, so each group of agreeing frames becomes a single
+pose-estimator update.
+
+The odometry gate is a Mahalanobis distance: the pose residual against the odometry
+pose at the frame's timestamp, scaled by the frame's std devs widened by the odometry
+drift allowance. Agreeing frames are combined by inverse-variance weighting — the
+fused std dev is never larger than the tightest input.
+"""
+
+import math
+from dataclasses import dataclass
+
+from wpimath.geometry import Pose2d, Rotation2d
+
+ODOMETRY_STD_DEV_M = 0.1  # Odometry drift allowance added to each vision std dev  # TUNE
+ODOMETRY_STD_DEV_RAD = math.radians(3.0)  # TUNE
+MAX_MAHALANOBIS = 3.0  # ~97 % chi-square gate for 3 DOF  # TUNE
+GROUP_WINDOW_S = 0.03  # Frames this close together are treated as simultaneous  # TUNE
+
+
+@dataclass(slots=True)
+class VisionMeasurement:
+    """One gated camera estimate, ready for add_vision_measurement()."""
+
+    camera: str
+    pose: Pose2d
+    timestamp: float
+    std_devs: tuple[float, float, float]
+
+
+def mahalanobis(measurement: VisionMeasurement, reference: Pose2d) -> float:
+    """Distance of the measurement from the odometry pose, in combined standard deviations."""
+    sx, sy, st = measurement.std_devs
+    dx = measurement.pose.X() - reference.X()
+    dy = measurement.pose.Y() - reference.Y()
+    d2 = dx * dx / (sx * sx + ODOMETRY_STD_DEV_M**2) + dy * dy / (sy * sy + ODOMETRY_STD_DEV_M**2)
+    if math.isfinite(st):
+        dt = math.remainder(measurement.pose.rotation().radians() - reference.rotation().radians(), math.tau)
+        d2 += dt * dt / (st * st + ODOMETRY_STD_DEV_RAD**2)
+    return math.sqrt(d2)
+
+
+def group_by_time(
+    measurements: list[VisionMeasurement], window_s: float = GROUP_WINDOW_S
+) -> list[list[VisionMeasurement]]:
+    """
+    Split measurements into time-ordered groups spanning at most window_s, with at most
+    one frame per camera in each group (a camera's consecutive frames are never merged).
+    """
+    groups: list[list[VisionMeasurement]] = []
+    for m in sorted(measurements, key=lambda m: m.timestamp):
+        group = groups[-1] if groups else None
+        if (
+            group is not None
+            and m.timestamp - group[0].timestamp <= window_s
+            and all(other.camera != m.camera for other in group)
+        ):
+            group.append(m)
+        else:
+            groups.append([m])
+    return groups
+
+
+def combine(group: list[VisionMeasurement]) -> VisionMeasurement:
+    """Inverse-variance weighted mean of a group. Infinite heading std devs carry no heading weight."""
+    if len(group) == 1:
+        return group[0]
+
+    wx = [1.0 / (m.std_devs[0] ** 2) for m in group]
+    wy = [1.0 / (m.std_devs[1] ** 2) for m in group]
+    wt = [1.0 / (m.std_devs[2] ** 2) if math.isfinite(m.std_devs[2]) else 0.0 for m in group]
+    sum_wx, sum_wy, sum_wt = sum(wx), sum(wy), sum(wt)
+
+    x = sum(w * m.pose.X() for w, m in zip(wx, group, strict=True)) / sum_wx
+    y = sum(w * m.pose.Y() for w, m in zip(wy, group, strict=True)) / sum_wy
+    timestamp = sum(w * m.timestamp for w, m in zip(wx, group, strict=True)) / sum_wx
+    if sum_wt > 0.0:
+        sin = sum(w * m.pose.rotation().sin() for w, m in zip(wt, group, strict=True))
+        cos = sum(w * m.pose.rotation().cos() for w, m in zip(wt, group, strict=True))
+        heading = Rotation2d(math.atan2(sin, cos))
+        st = math.sqrt(1.0 / sum_wt)
+    else:
+        heading = group[0].pose.rotation()
+        st = math.inf
+
+    return VisionMeasurement(
+        "+".join(m.camera for m in group),
+        Pose2d(x, y, heading),
+        timestamp,
+        (math.sqrt(1.0 / sum_wx), math.sqrt(1.0 / sum_wy), st),
+    )
@@ -0,0 +1,69 @@
+"""
+AprilTag ID filters — picks each camera's tag whitelist from the alliance, the field
+zone the robot is in and whether a shot is being aimed, so the Limelight localizes only
+off tags that can be in view and useful from where the robot is.
+
+    alliance unknown or disabled        every tag (pipeline filter)
+    pose not trusted                    every tag (pipeline filter)
+    aiming a shot, camera faces the hub own hub tags
+    own alliance zone                   own alliance tags
+    neutral zone                        every tag (pipeline filter)
+    opponent alliance zone              opponent alliance tags
+
+The zone comes from the odometry pose, so a drifted pose could hide the very tags that
+would correct it. The caller reports the pose as not trusted until the first MT1 pose,
+after vision has gone quiet for a while and while the odometry gate keeps rejecting
+frames, and the cameras then see every tag.
+
+Tag IDs follow the 2026 REBUILT field layout: red elements carry tags 1-16 and blue
+elements 17-32. Check them against the official layout JSON when it is revised.
+"""
+
+from dataclasses import dataclass
+
+# Field dimensions: 651.22 inches long; each alliance zone ends at its hub centre line
+FIELD_LENGTH_M = 651.22 * 0.0254  # 16.541 m
+ALLIANCE_ZONE_DEPTH_M = 182.11 * 0.0254  # 4.626 m from the alliance wall
+
+RED_HUB_TAGS = (2, 3, 4, 5, 8, 9, 10, 11)
+BLUE_HUB_TAGS = (18, 19, 20, 21, 24, 25, 26, 27)
+RED_TAGS = tuple(range(1, 17))  # Hub, trench, outpost and tower
+BLUE_TAGS = tuple(range(17, 33))
+
+
+@dataclass(frozen=True, slots=True)
+class TagFilter:
+    name: str
+    ids: tuple[int, ...]  # Empty hands the filter back to the pipeline
+
+
+ALL_TAGS = TagFilter("all", ())
+
+
+def field_zone(x_m: float, red_alliance: bool) -> str:
+    """Alliance zone ("own", "neutral" or "opponent") of a robot at field x, blue origin."""
+    if x_m < ALLIANCE_ZONE_DEPTH_M:
+        return "opponent" if red_alliance else "own"
+    if x_m > FIELD_LENGTH_M - ALLIANCE_ZONE_DEPTH_M:
+        return "own" if red_alliance else "opponent"
+    return "neutral"
+
+
+def select_tag_filter(
+    enabled: bool,
+    red_alliance: bool | None,
+    zone: str,
+    shot_active: bool,
+    facing_hub: bool,
+    pose_trusted: bool = True,
+) -> TagFilter:
+    """Tag whitelist for one camera, per the table in the module docstring."""
+    if not enabled or red_alliance is None or not pose_trusted:
+        return ALL_TAGS
+    if shot_active and facing_hub:
+        return TagFilter("hub", RED_HUB_TAGS if red_alliance else BLUE_HUB_TAGS)
+    if zone == "own":
+        return TagFilter("own", RED_TAGS if red_alliance else BLUE_TAGS)
+    if zone == "opponent":
+        return TagFilter("opponent", BLUE_TAGS if red_alliance else RED_TAGS)
+    return ALL_TAGS
@@ -0,0 +1,63 @@
+"""
+Limelight throttle policy — picks each camera's frame skip and AprilTag downscale
+from what the robot is doing, so full frame rate goes where it matters and the
+cameras spend less compute (and heat) elsewhere.
+
+    disabled, no MT1 pose accepted yet  full rate, pipeline downscale (fast pre-match localization)
+    disabled                            throttle DISABLED_THROTTLE, pipeline downscale
+    shot in progress, facing the hub    full rate, full resolution (distant hub tags)
+    shot in progress, other camera      throttle SUPPORT_THROTTLE, 2x downscale
+    driving fast                        full rate, 2x downscale (more frames per second)
+    not facing the hub, few useful tags throttle IDLE_THROTTLE, 2x downscale
+    otherwise                           full rate, pipeline downscale
+"""
+
+import math
+from dataclasses import dataclass
+
+from wpimath.geometry import Pose2d, Translation2d
+
+DISABLED_THROTTLE = 100  # Limelight docs suggest 100-200 while disabled  # TUNE
+SUPPORT_THROTTLE = 4  # Camera away from the hub during a shot  # TUNE
+IDLE_THROTTLE = 2  # Still ~20 fps at 60 fps, so a camera that starts seeing tags recovers  # TUNE
+FAST_SPEED_MPS = 2.0  # TUNE
+MIN_USEFUL_FPS = 5.0  # Frames per second that passed the vision gates  # TUNE
+FACING_HALF_ANGLE_DEG = 60.0  # Camera "faces the hub" within this angle of the hub bearing  # TUNE
+
+PIPELINE_DOWNSCALE = 0.0  # set_fiducial_downscaling_override(0) hands control back to the pipeline
+
+
+@dataclass(frozen=True, slots=True)
+class CameraSettings:
+    throttle: int
+    downscale: float
+
+
+FULL_RATE = CameraSettings(0, PIPELINE_DOWNSCALE)
+
+
+def faces_hub(camera_yaw_deg: float, pose: Pose2d, hub: Translation2d) -> bool:
+    """True if a camera mounted at camera_yaw_deg (robot frame) points within FACING_HALF_ANGLE_DEG of the hub."""
+    bearing = math.atan2(hub.Y() - pose.Y(), hub.X() - pose.X())
+    facing = pose.rotation().radians() + math.radians(camera_yaw_deg)
+    return abs(math.remainder(bearing - facing, math.tau)) <= math.radians(FACING_HALF_ANGLE_DEG)
+
+
+def select_settings(
+    enabled: bool,
+    shot_active: bool,
+    facing_hub: bool,
+    speed_mps: float,
+    useful_fps: float,
+    localized: bool = True,
+) -> CameraSettings:
+    """Throttle and downscale for one camera, per the table in the module docstring."""
+    if not enabled:
+        return CameraSettings(DISABLED_THROTTLE, PIPELINE_DOWNSCALE) if localized else FULL_RATE
+    if shot_active:
+        return CameraSettings(0, 1.0) if facing_hub else CameraSettings(SUPPORT_THROTTLE, 2.0)
+    if speed_mps >= FAST_SPEED_MPS:
+        return CameraSettings(0, 2.0)
+    if not facing_hub and useful_fps < MIN_USEFUL_FPS:
+        return CameraSettings(IDLE_THROTTLE, 2.0)
+    return FULL_RATE
@@ -0,0 +1,86 @@
+"""
+Vision timing — corrects Limelight frame timestamps for clock offset and keeps latency
+histograms, so each pose estimate is matched to the odometry sample of its capture.
+
+A frame's NT timestamp is its publish time on the Limelight's estimate of the robot
+(NT server) clock. Capture time is that minus the botpose total latency (index 6, which
+Limelight documents as capture + pipeline latency, so cl is not added again).
+
+The Limelight's clock sync can be off by a few milliseconds. A frame cannot arrive before
+it was published, so the windowed minimum of (receive time - publish time) bounds the
+error. When that minimum is negative the Limelight clock runs ahead by at least that
+much, and the correction moves frame timestamps back by it. A positive minimum cannot be
+told apart from network delay, so it is reported but not applied. Receive time is taken
+by an NT listener as the frame arrives, not when the robot loop drains the queue, so
+time spent waiting in the queue does not hide the offset.
+"""
+
+from collections import deque
+
+LATENCY_BIN_MS = 5.0
+LATENCY_BINS = 20  # 0-100 ms; the last bin also counts anything slower
+OFFSET_WINDOW = 100  # Frames in the clock-offset minimum, ~2 s at 50 fps  # TUNE
+
+
+class LatencyHistogram:
+    """Fixed-width latency histogram, cumulative until clear() (the vision stats clear it every window)."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self):
+        self.counts = [0] * LATENCY_BINS
+        self.total = 0
+
+    def add(self, latency_ms: float) -> None:
+        self.counts[min(max(int(latency_ms / LATENCY_BIN_MS), 0), LATENCY_BINS - 1)] += 1
+        self.total += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper edge (ms) of the bin holding the given fraction of samples; 0 when empty."""
+        if self.total == 0:
+            return 0.0
+        target = fraction * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return (i + 1) * LATENCY_BIN_MS
+        return LATENCY_BINS * LATENCY_BIN_MS
+
+    def clear(self) -> None:
+        self.counts = [0] * LATENCY_BINS
+        self.total = 0
+
+
+class ClockOffsetEstimator:
+    """Sliding minimum of (receive - publish) over the last OFFSET_WINDOW frames.
+
+    Fed by one writer thread (the NT listener); readers take min_delay_us or correction_us.
+    """
+
+    def __init__(self, window: int = OFFSET_WINDOW):
+        self._window = window
+        self._count = 0
+        self._minima: deque[tuple[int, int]] = deque()  # (frame index, delay µs), delays increasing
+        self.min_delay_us: int | None = None  # Smallest receive - publish in the window
+
+    def observe(self, publish_us: int, receive_us: int) -> None:
+        delay_us = receive_us - publish_us
+        while self._minima and self._minima[-1][1] >= delay_us:
+            self._minima.pop()
+        self._minima.append((self._count, delay_us))
+        if self._minima[0][0] <= self._count - self._window:
+            self._minima.popleft()
+        self._count += 1
+        self.min_delay_us = self._minima[0][1]
+
+    @property
+    def correction_us(self) -> int:
+        """Amount to add to a frame's publish time: negative when the camera clock runs ahead."""
+        delay_us = self.min_delay_us
+        return min(delay_us, 0) if delay_us is not None else 0
+
+
+def capture_time_s(publish_us: int, total_latency_ms: float, correction_us: int = 0) -> float:
+    """Capture time of a frame in the robot's NT time base, in seconds."""
+    return (publish_us + correction_us) * 1e-6 - total_latency_ms * 1e-3
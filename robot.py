@@ -7,6 +7,7 @@
 
 import commands2
 
+from modules.nt_batch import BatchedPublisher
 from robotcontainer import RobotContainer
 
 # from phoenix6 import HootAutoReplay
@@ -27,9 +28,16 @@ class MyRobot(commands2.TimedCommandRobot):
         """
 
         # Instantiate our RobotContainer.  This will perform all our button bindings, and put our
-        # autonomous chooser on the dashboard.
+        # autonomous chooser on the dashboard. Subsystems register their telemetry with a fresh
+        # batched publisher.
+        BatchedPublisher.reset_instance()
         self.container = RobotContainer()
 
+        # Loop upkeep outside the scheduler, timed like the subsystems (no-op unless profiling)
+        profiler = self.container.profiler
+        self._flush_telemetry = profiler.wrap("BatchedPublisher.flush", BatchedPublisher.instance().flush)
+        self._virtual_goal_periodic = profiler.wrap("VirtualGoal.periodic", self.container.virtual_goal.periodic)
+
         # log and replay timestamp and joystick data
         # self._time_and_joystick_replay = (
         #     HootAutoReplay()
@@ -45,16 +53,22 @@ class MyRobot(commands2.TimedCommandRobot):
         SmartDashboard integrated updating."""
 
         # self._time_and_joystick_replay.update()
+
+        # Read and shape the drive sticks once, before the drive requests use them.
+        self.container.driver_input.update()
+
         # Runs the Scheduler.  This is responsible for polling buttons, adding newly-scheduled
         # commands, running already-scheduled commands, removing finished or interrupted commands,
         # and running subsystem periodic() methods.  This must be called from the robot's periodic
         # block in order for anything in the Command-based framework to work.
         commands2.CommandScheduler.getInstance().run()
+        self._flush_telemetry()  # Telemetry getters run here, outside the subsystems' timed periodic()
+        self._virtual_goal_periodic()
+        self.container.profiler.periodic()
 
     def disabledInit(self) -> None:
         """This function is called once each time the robot enters Disabled mode."""
-        self.container.limelight.set_throttle(0)
-        self.container.limelight._use_megatag2 = False
+        self.container.limelight.set_enabled(False)
 
     def disabledPeriodic(self) -> None:
         """This function is called periodically when disabled"""
@@ -62,8 +76,7 @@ class MyRobot(commands2.TimedCommandRobot):
 
     def autonomousInit(self) -> None:
         """This autonomous runs the autonomous command selected by your RobotContainer class."""
-        self.container.limelight.set_throttle(0)
-        self.container.limelight._use_megatag2 = True
+        self.container.limelight.set_enabled(True)
         self.autonomousCommand = self.container.getAutonomousCommand()
 
         if self.autonomousCommand:
@@ -74,8 +87,7 @@ class MyRobot(commands2.TimedCommandRobot):
         pass
 
     def teleopInit(self) -> None:
-        self.container.limelight.set_throttle(0)
-        self.container.limelight._use_megatag2 = True
+        self.container.limelight.set_enabled(True)
 
         # This makes sure that the autonomous stops running when
         # teleop starts running. If you want the autonomous to
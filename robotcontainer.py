@@ -29,9 +29,12 @@ from commands.calibrate_ff import CalibrateFF
 from commands.home_hood import HomeHood
 from commands.home_intake import HomeIntake
 from commands.hub_shot import HubShot, VirtualGoal
+from commands.pre_spin import PreSpin
 from commands.safe_retract_intake import SafeRetractIntake
 from commands.tune_shot import TuneShot
 from generated.tuner_constants import TunerConstants
+from modules.driver_input import DriverInput
+from modules.profiler import Profiler
 from subsystems.hood import HOMING_TIMEOUT_SECONDS, HoodSubSystem
 from subsystems.indexer import IndexerSubSystem
 from subsystems.intake import IntakeSubSystem
@@ -41,14 +44,6 @@ from subsystems.vision import CAMERAS, VisionSubsystem
 from telemetry import Telemetry
 
 
-def joystick_filter(value):
-    """Squared response curve with 5% deadband. Rescales so output ramps smoothly from 0."""
-    if abs(value) < 0.05:
-        return 0
-    scaled = (abs(value) - 0.05) / 0.95
-    return scaled * scaled * (1 if value > 0 else -1)
-
-
 class RobotContainer:
     """
     This class is where the bulk of the robot should be declared. Since Command-based is a
@@ -93,14 +88,24 @@ class RobotContainer:
         )
 
         self._logger = Telemetry(self._max_speed)
+        self.profiler = Profiler()
+        self._telemeterize = self.profiler.wrap("Telemetry.telemeterize", self._logger.telemeterize)
 
         self._joystick_1 = CommandXboxController(0)
+        # Sticks read and shaped once per loop (robotPeriodic); drive requests below are
+        # preallocated and only have their fields overwritten
+        self.driver_input = DriverInput(self._joystick_1, self._max_speed, self._max_angular_rate)
 
         self.drivetrain = TunerConstants.create_drivetrain()
-        self._virtual_goal = VirtualGoal(self.drivetrain)
+        self.virtual_goal = VirtualGoal(self.drivetrain)
 
         # Add vision
-        self.limelight = VisionSubsystem(swerve=self.drivetrain, cameras=CAMERAS)
+        self.limelight = VisionSubsystem(
+            swerve=self.drivetrain,
+            cameras=CAMERAS,
+            hub=self.virtual_goal.hub_position,
+            shot_active=HubShot.in_progress,
+        )
 
         # self.climber = ClimbSubsystem()  # Disabled — PCM not on CAN bus yet
         self.shooter = ShooterSubSystem()
@@ -110,7 +115,8 @@ class RobotContainer:
         self.indexer = IndexerSubSystem()
 
         # Default commands — ensure motors stop when no command is running
-        self.shooter.setDefaultCommand(self.shooter.run(self.shooter.stop))
+        # (shooter idles near the predicted shot RPM inside the shooting zone)
+        self.shooter.setDefaultCommand(PreSpin(self.shooter, self.virtual_goal))
         self.kicker.setDefaultCommand(self.kicker.run(self.kicker.stop))
         self.indexer.setDefaultCommand(self.indexer.run(self.indexer.stop))
         self.intake.setDefaultCommand(self.intake.run(self.intake.hold))
@@ -130,7 +136,7 @@ class RobotContainer:
         NamedCommands.registerCommand(
             "hubshot",
             HubShot(
-                self.shooter, self.kicker, self.indexer, self.hood, self._virtual_goal
+                self.shooter, self.kicker, self.indexer, self.hood, self.virtual_goal
             ).finallyDo(lambda interrupted: self._clearout_command().schedule()),
         )
 
@@ -158,11 +164,25 @@ class RobotContainer:
         # self.configureManualBindings()
         self.configureCompetitionBindings()
 
+        # Loop profiling — no-op unless modules.profiler.PROFILER_ENABLED
+        self.profiler.instrument_subsystems(
+            [
+                self.shooter,
+                self.hood,
+                self.intake,
+                self.kicker,
+                self.indexer,
+                self.limelight,
+                self.drivetrain,
+            ]
+        )
+        self.profiler.instrument_commands(commands2.CommandScheduler.getInstance())
+
     def _clearout_command(self):
         """Reverse conveyor while shooter+kicker keep running, then stop."""
         return cmd.run(
             lambda: (
-                self.shooter.set_target_speed(self._virtual_goal.last_rpm),
+                self.shooter.set_target_speed(self.virtual_goal.last_rpm),
                 self.kicker.set_duty_cycle(1.0),
                 self.indexer.set_target_output(-1.0),
             ),
@@ -173,16 +193,14 @@ class RobotContainer:
 
     def _drive_or_brake(self):
         """Swerve request: drive from joystick input, or brake when sticks are idle."""
-        vx = joystick_filter(-self._joystick_1.getLeftY())
-        vy = joystick_filter(-self._joystick_1.getLeftX())
-        vr = joystick_filter(-self._joystick_1.getRightX())
-        if vx == 0 and vy == 0 and vr == 0:
+        driver = self.driver_input
+        if driver.idle:
             return self._brake
-        return (
-            self._drive.with_velocity_x(vx * self._max_speed)
-            .with_velocity_y(vy * self._max_speed)
-            .with_rotational_rate(vr * self._max_angular_rate)
-        )
+        drive = self._drive
+        drive.velocity_x = driver.vx
+        drive.velocity_y = driver.vy
+        drive.rotational_rate = driver.omega
+        return drive
 
     def configureSwerveButtonBindings(self) -> None:
         """
@@ -208,17 +226,12 @@ class RobotContainer:
         self._joystick_1.b().whileTrue(
             self.drivetrain.apply_request(
                 lambda: self._point.with_module_direction(
-                    Rotation2d(
-                        joystick_filter(-self._joystick_1.getLeftY()),
-                        joystick_filter(-self._joystick_1.getLeftX()),
-                    )
+                    Rotation2d(self.driver_input.stick_x, self.driver_input.stick_y)
                 )
             )
         )
 
-        self.drivetrain.register_telemetry(
-            lambda state: self._logger.telemeterize(state)
-        )
+        self.drivetrain.register_telemetry(self._telemeterize)
 
     def configureHardwareTestBindings(self):
         """
@@ -495,34 +508,22 @@ class RobotContainer:
             self.drivetrain.apply_request(lambda: idle).ignoringDisable(True)
         )
 
-        self.drivetrain.register_telemetry(
-            lambda state: self._logger.telemeterize(state)
-        )
+        self.drivetrain.register_telemetry(self._telemeterize)
 
         # RT: Hold to aim at hub + shoot (auto RPM + hood from lookup table)
         self._shoot_at_hub = HubShot(
-            self.shooter, self.kicker, self.indexer, self.hood, self._virtual_goal
+            self.shooter, self.kicker, self.indexer, self.hood, self.virtual_goal
         )
         _SHOOT_DRIVE_SCALE = (
             0.25  # Limit swerve to 25% while shooting to prevent brownouts
         )
 
         def _hub_shot_request():
-            aim, ff = self._virtual_goal.calculate_operator()
-            return (
-                self._snap_angle.with_target_direction(aim)
-                .with_target_rate_feedforward(ff)
-                .with_velocity_x(
-                    joystick_filter(-self._joystick_1.getLeftY())
-                    * self._max_speed
-                    * _SHOOT_DRIVE_SCALE
-                )
-                .with_velocity_y(
-                    joystick_filter(-self._joystick_1.getLeftX())
-                    * self._max_speed
-                    * _SHOOT_DRIVE_SCALE
-                )
-            )
+            request = self._snap_angle
+            request.target_direction, request.target_rate_feedforward = self.virtual_goal.calculate_operator()
+            request.velocity_x = self.driver_input.vx * _SHOOT_DRIVE_SCALE
+            request.velocity_y = self.driver_input.vy * _SHOOT_DRIVE_SCALE
+            return request
 
         self._joystick_1.rightTrigger().whileTrue(
             ParallelCommandGroup(
@@ -538,22 +539,11 @@ class RobotContainer:
         _INTAKE_DRIVE_SCALE = 0.25  # Limit swerve to 50% while intaking  # TUNE
 
         def _intake_drive_request():
-            return (
-                self._drive.with_velocity_x(
-                    joystick_filter(-self._joystick_1.getLeftY())
-                    * self._max_speed
-                    * _INTAKE_DRIVE_SCALE
-                )
-                .with_velocity_y(
-                    joystick_filter(-self._joystick_1.getLeftX())
-                    * self._max_speed
-                    * _INTAKE_DRIVE_SCALE
-                )
-                .with_rotational_rate(
-                    joystick_filter(-self._joystick_1.getRightX())
-                    * self._max_angular_rate
-                )
-            )
+            request = self._drive
+            request.velocity_x = self.driver_input.vx * _INTAKE_DRIVE_SCALE
+            request.velocity_y = self.driver_input.vy * _INTAKE_DRIVE_SCALE
+            request.rotational_rate = self.driver_input.omega
+            return request
 
         self._joystick_1.leftTrigger().whileTrue(
             ParallelCommandGroup(
@@ -616,9 +606,7 @@ class RobotContainer:
             self.drivetrain.apply_request(lambda: idle).ignoringDisable(True)
         )
 
-        self.drivetrain.register_telemetry(
-            lambda state: self._logger.telemeterize(state)
-        )
+        self.drivetrain.register_telemetry(self._telemeterize)
 
         # --- Mechanism bindings ---
         table = NetworkTableInstance.getDefault().getTable("Manual")
@@ -669,22 +657,18 @@ class RobotContainer:
         )
 
         def _tune_shot_request():
-            hub = self._virtual_goal._get_hub()
-            pose = self.drivetrain.get_state().pose
-            dx = hub.X() - pose.X()
-            dy = hub.Y() - pose.Y()
+            hub = self.virtual_goal.hub_position()
+            drive = self.drivetrain.get_snapshot()
+            dx = hub.X() - drive.x
+            dy = hub.Y() - drive.y
             aim = Rotation2d(math.atan2(dy, dx))
             if DriverStation.getAlliance() == DriverStation.Alliance.kRed:
                 aim = aim.rotateBy(Rotation2d(math.pi))
-            return (
-                self._snap_angle.with_target_direction(aim)
-                .with_velocity_x(
-                    joystick_filter(-self._joystick_1.getLeftY()) * self._max_speed
-                )
-                .with_velocity_y(
-                    joystick_filter(-self._joystick_1.getLeftX()) * self._max_speed
-                )
-            )
+            request = self._snap_angle
+            request.target_direction = aim
+            request.velocity_x = self.driver_input.vx
+            request.velocity_y = self.driver_input.vy
+            return request
 
         self._joystick_1.rightTrigger().whileTrue(
             ParallelCommandGroup(
@@ -1,6 +1,7 @@
 import math
 from collections.abc import Callable
-from typing import overload
+from dataclasses import dataclass
+from typing import Self, overload
 
 from commands2 import Command, Subsystem
 from commands2.sysid import SysIdRoutine
@@ -13,6 +14,42 @@ from wpimath.geometry import Pose2d, Rotation2d
 from wpimath.kinematics import ChassisSpeeds
 
 from generated.tuner_constants import TunerSwerveDrivetrain
+from modules.drive_motion import MotionEstimate, MotionEstimator
+from modules.pose_history import PoseHistory, PoseSample
+
+
+@dataclass(frozen=True, slots=True)
+class DriveSnapshot:
+    """
+    Drivetrain state for one scheduler tick as plain floats, plus the pose and
+    robot-relative speeds objects for APIs that take them.
+    """
+
+    x: float
+    y: float
+    heading: float  # rad, field frame
+    vx: float  # m/s, field-relative
+    vy: float
+    omega: float  # rad/s
+    timestamp: float  # s, CTRE current-time base
+    pose: Pose2d
+    speeds: ChassisSpeeds  # robot-relative
+
+    @classmethod
+    def from_state(cls, pose: Pose2d, speeds: ChassisSpeeds, timestamp: float = 0.0) -> Self:
+        heading = pose.rotation().radians()
+        cos_h, sin_h = math.cos(heading), math.sin(heading)
+        return cls(
+            pose.X(),
+            pose.Y(),
+            heading,
+            speeds.vx * cos_h - speeds.vy * sin_h,
+            speeds.vx * sin_h + speeds.vy * cos_h,
+            speeds.omega,
+            timestamp,
+            pose,
+            speeds,
+        )
 
 
 class CommandSwerveDrivetrain(Subsystem, TunerSwerveDrivetrain):
@@ -144,6 +181,17 @@ class CommandSwerveDrivetrain(Subsystem, TunerSwerveDrivetrain):
         self._has_applied_operator_perspective = False
         """Keep track if we've ever applied the operator perspective before or not"""
 
+        self._snapshot = DriveSnapshot.from_state(Pose2d(), ChassisSpeeds())
+        """This tick's drive state, replaced whole so readers on other threads need no lock"""
+
+        self._motion = MotionEstimator()
+        self._history = PoseHistory()
+        # reset_pose() requests (CTRE time), applied by the odometry thread that owns the history
+        self._reset_at: float | None = None
+        self._applied_reset_at: float | None = None
+        self._telemetry_function: Callable[[swerve.SwerveDrivetrain.SwerveDriveState], None] | None = None
+        TunerSwerveDrivetrain.register_telemetry(self, self._on_odometry)
+
         # Swerve request to apply during path following
         self._apply_robot_speeds = swerve.requests.ApplyRobotSpeeds()
 
@@ -246,9 +294,9 @@ class CommandSwerveDrivetrain(Subsystem, TunerSwerveDrivetrain):
     def _configure_auto_builder(self):
         config = RobotConfig.fromGUISettings()
         AutoBuilder.configure(
-            lambda: self.get_state().pose,  # Supplier of current robot pose
+            lambda: self._snapshot.pose,  # Supplier of current robot pose
             self.reset_pose,  # Consumer for seeding pose against auto
-            lambda: self.get_state().speeds,  # Supplier of current robot speeds
+            lambda: self._snapshot.speeds,  # Supplier of current robot speeds
             # Consumer of ChassisSpeeds and feedforwards to drive the robot
             lambda speeds, feedforwards: self.set_control(
                 self._apply_robot_speeds.with_speeds(
@@ -311,7 +359,86 @@ class CommandSwerveDrivetrain(Subsystem, TunerSwerveDrivetrain):
         """
         return self._sys_id_routine_to_apply.dynamic(direction)
 
+    def get_snapshot(self) -> DriveSnapshot:
+        """
+        Drive state captured at the start of this scheduler tick. Consumers read this
+        instead of get_state(), which copies the full state (module arrays included)
+        across the pybind boundary on every call.
+        """
+        return self._snapshot
+
+    def refresh_snapshot(self) -> DriveSnapshot:
+        """Capture a new snapshot from get_state(). Called once per tick from periodic()."""
+        state = self.get_state()
+        self._snapshot = snapshot = DriveSnapshot.from_state(state.pose, state.speeds, state.timestamp)
+        return snapshot
+
+    def register_telemetry(self, telemetry_function: Callable[[swerve.SwerveDrivetrain.SwerveDriveState], None]):
+        """
+        Register a function to be called with the drive state on every odometry update.
+        It runs on the odometry thread after the motion estimate has been updated.
+        """
+        self._telemetry_function = telemetry_function
+
+    def _on_odometry(self, state: swerve.SwerveDrivetrain.SwerveDriveState) -> None:
+        reset_at = self._reset_at
+        if reset_at != self._applied_reset_at and state.timestamp >= reset_at:
+            # First sample after reset_pose(): drop what came before the jump
+            self._history.clear()
+            self._motion.reset()
+            self._applied_reset_at = reset_at
+        pose, speeds = state.pose, state.speeds
+        self._motion.update(
+            state.timestamp, pose.X(), pose.Y(), pose.rotation().radians(), speeds.vx, speeds.vy, speeds.omega
+        )
+        self._history.add(utils.current_time_to_fpga_time(state.timestamp), pose, speeds, state.module_states)
+        telemetry_function = self._telemetry_function
+        if telemetry_function is not None:
+            telemetry_function(state)
+
+    def get_motion(self) -> MotionEstimate:
+        """Filtered field-relative velocity and acceleration at the latest odometry update."""
+        return self._motion.estimate
+
+    def predict_pose(self, dt: units.second) -> Pose2d:
+        """
+        Pose dt seconds after the latest odometry update, assuming constant acceleration
+        and turn rate — for aiming and gating lookahead.
+        """
+        x, y, heading = self._motion.estimate.predict(dt)
+        return Pose2d(x, y, Rotation2d(heading))
+
+    def sample_history_at(self, timestamp: units.second) -> PoseSample | None:
+        """
+        Pose, speeds and module states interpolated at a past FPGA timestamp, from the
+        last few seconds of odometry (clamped to the oldest and newest samples).
+
+        :param timestamp: The timestamp in seconds, FPGA time base.
+        :type timestamp: second
+        :returns: The interpolated sample (or None if the history is empty).
+        :rtype: PoseSample | None
+        """
+        return self._history.sample_at(timestamp)
+
+    def history_between(self, start: units.second, end: units.second) -> list[PoseSample]:
+        """Recorded odometry samples between two FPGA timestamps (inclusive), oldest first."""
+        return self._history.between(start, end)
+
+    def reset_pose(self, pose: Pose2d) -> None:
+        """
+        Reset the odometry pose; the snapshot follows immediately instead of next tick.
+        The odometry thread clears the pose history and restarts the motion filters on its
+        first sample after the reset, so neither spans the jump.
+        """
+        self._reset_at = utils.get_current_time_seconds()
+        TunerSwerveDrivetrain.reset_pose(self, pose)
+        snapshot = self._snapshot
+        self._snapshot = DriveSnapshot.from_state(pose, snapshot.speeds, snapshot.timestamp)
+
     def periodic(self):
+        # Registered before the other subsystems, so this runs first in each tick
+        self.refresh_snapshot()
+
         # Periodically try to apply the operator perspective.
         # If we haven't applied the operator perspective before, then we should apply it regardless of DS state.
         # This allows us to correct the perspective in case the robot code restarts mid-match.
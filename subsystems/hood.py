@@ -1,8 +1,11 @@
-import ntcore
+import dataclasses
+
 import rev
 from commands2 import Subsystem
+from wpiutil import wpistruct
 
 from constants import CANIds
+from modules.nt_batch import AMPS_DEADBAND, RPM_DEADBAND, SLOW, TURNS_DEADBAND, BatchedPublisher
 
 # Homing constants
 HOMING_DUTYCYCLE = -0.15  # Duty cycle toward hard stop  # TUNE
@@ -19,6 +22,8 @@ POSITION_STALL_CYCLES = 10  # ~200ms at 20ms loop  # TUNE
 
 # Position constants
 STOW_POSITION = 0.1  # Motor turns — min soft limit, clear of hard stop
+MIN_ROTATIONS = 0.1  # Default soft limits (motor turns) until set_min/max_limit
+MAX_ROTATIONS = 6.4
 
 # PID defaults (slot 0 — position)
 KP = 0.10
@@ -26,6 +31,15 @@ KI = 0.0
 KD = 0.0001
 
 
+@wpistruct.make_wpistruct(name="HoodState")
+@dataclasses.dataclass
+class HoodState:
+    position_turns: float
+    target_turns: float
+    velocity_rpm: float
+    amps: float
+
+
 class HoodSubSystem(Subsystem):
     """
     Hood subsystem — adjustable shooter angle with relative encoder.
@@ -44,8 +58,8 @@ class HoodSubSystem(Subsystem):
         self._soft_limits_enabled: bool = True
 
         # Rotation limits — set via set_min_limit / set_max_limit
-        self.min_rotations: float = 0.1
-        self.max_rotations: float = 6.4
+        self.min_rotations: float = MIN_ROTATIONS
+        self.max_rotations: float = MAX_ROTATIONS
 
         self._config = rev.SparkBaseConfig()
         self._config.inverted(True)
@@ -72,16 +86,25 @@ class HoodSubSystem(Subsystem):
         self._position_active: bool = False
         self._stall_cycle: int = 0
         self._stall_count: int = 0
-
-        table = ntcore.NetworkTableInstance.getDefault().getTable("Hood")
-        self._position_pub = table.getDoubleTopic("Position Turns").publish()
-        self._target_pub = table.getDoubleTopic("Target Turns").publish()
-        self._velocity_pub = table.getDoubleTopic("Velocity RPM").publish()
-        self._amps_pub = table.getDoubleTopic("Amps").publish()
-        self._homed_pub = table.getBooleanTopic("Homed").publish()
-        self._stall_cycle_pub = table.getIntegerTopic("Stall Cycle").publish()
-        self._stall_count_pub = table.getIntegerTopic("Stall Count").publish()
-        self._limits_set_pub = table.getBooleanTopic("Limits Set").publish()
+        self._current: float = 0.0
+        self._velocity: float = 0.0
+
+        telemetry = BatchedPublisher.instance()
+        telemetry.add_struct(
+            "Hood",
+            "State",
+            HoodState,
+            self._state,
+            deadbands={
+                "position_turns": TURNS_DEADBAND,
+                "velocity_rpm": RPM_DEADBAND,
+                "amps": AMPS_DEADBAND,
+            },
+        )
+        telemetry.add_boolean("Hood", "Homed", lambda: self.is_homed)
+        telemetry.add_integer("Hood", "Stall Cycle", lambda: self._stall_cycle)
+        telemetry.add_integer("Hood", "Stall Count", lambda: self._stall_count)
+        telemetry.add_boolean("Hood", "Limits Set", lambda: self.limits_set, tier=SLOW)
 
     # ── Low-level motor access (for homing / auto-tune commands) ──
 
@@ -186,9 +209,13 @@ class HoodSubSystem(Subsystem):
 
     # ── Periodic ───────────────────────────────────────────────────
 
+    def _state(self) -> HoodState:
+        return HoodState(self._encoder.getPosition(), self._target_position, self._velocity, self._current)
+
     def periodic(self) -> None:
-        current = self._motor.getOutputCurrent()
-        velocity = abs(self._encoder.getVelocity())
+        current = self._current = self._motor.getOutputCurrent()
+        self._velocity = self._encoder.getVelocity()
+        velocity = abs(self._velocity)
 
         # Stall detection during position control
         if self._position_active:
@@ -202,14 +229,5 @@ class HoodSubSystem(Subsystem):
                 self._position_active = False
                 self._motor.stopMotor()
 
-        self._position_pub.set(self._encoder.getPosition())
-        self._target_pub.set(self._target_position)
-        self._velocity_pub.set(self._encoder.getVelocity())
-        self._amps_pub.set(current)
-        self._homed_pub.set(self.is_homed)
-        self._stall_cycle_pub.set(self._stall_cycle)
-        self._stall_count_pub.set(self._stall_count)
-        self._limits_set_pub.set(self.limits_set)
-
     def simulationPeriodic(self) -> None:
         pass
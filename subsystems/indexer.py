@@ -1,8 +1,8 @@
-import ntcore
 import rev
 from commands2 import Subsystem
 
 from constants import CANIds
+from modules.nt_batch import AMPS_DEADBAND, ON_CHANGE, BatchedPublisher
 
 
 class IndexerSubSystem(Subsystem):
@@ -29,9 +29,9 @@ class IndexerSubSystem(Subsystem):
 
         self._target_output = 0.0
 
-        table = ntcore.NetworkTableInstance.getDefault().getTable("Indexer")
-        self._output_pub = table.getDoubleTopic("Conveyor Output").publish()
-        self._amps_pub = table.getDoubleTopic("Conveyor Amps").publish()
+        telemetry = BatchedPublisher.instance()
+        telemetry.add_double("Indexer", "Conveyor Output", lambda: self._target_output, tier=ON_CHANGE)
+        telemetry.add_double("Indexer", "Conveyor Amps", self._motor.getOutputCurrent, deadband=AMPS_DEADBAND)
 
     def set_target_output(self, output):
         """Set conveyor duty cycle output (-1.0 to 1.0)."""
@@ -42,9 +42,5 @@ class IndexerSubSystem(Subsystem):
         self._target_output = 0.0
         self._motor.stopMotor()
 
-    def periodic(self):
-        self._output_pub.set(self._target_output)
-        self._amps_pub.set(self._motor.getOutputCurrent())
-
     def simulationPeriodic(self):
         pass
@@ -1,8 +1,11 @@
-import ntcore
+import dataclasses
+
 import rev
 from commands2 import Subsystem
+from wpiutil import wpistruct
 
 from constants import NEO_FREE_SPEED_RPM, CANIds
+from modules.nt_batch import AMPS_DEADBAND, RPM_DEADBAND, SLOW, TURNS_DEADBAND, BatchedPublisher
 
 # Homing constants
 HOMING_DUTYCYCLE = 0.15  # Duty cycle toward deployed hard stop (positive)  # TUNE
@@ -26,6 +29,18 @@ ARM_KI = 0.0
 ARM_KD = 0.002
 
 
+@wpistruct.make_wpistruct(name="IntakeState")
+@dataclasses.dataclass
+class IntakeState:
+    arm_position_turns: float
+    arm_target_turns: float
+    arm_velocity_rpm: float
+    arm_amps: float
+    roller_velocity_rpm: float
+    roller_target_rpm: float
+    roller_amps: float
+
+
 class IntakeSubSystem(Subsystem):
     """
     Intake subsystem — deployable arm with roller for game piece pickup.
@@ -104,21 +119,27 @@ class IntakeSubSystem(Subsystem):
         self._arm_position_active: bool = False
         self._stall_cycle: int = 0
         self._stall_count: int = 0
-
-        table = ntcore.NetworkTableInstance.getDefault().getTable("Intake")
-        self._arm_amps_pub = table.getDoubleTopic("Arm Amps").publish()
-        self._arm_position_pub = table.getDoubleTopic("Arm Position Turns").publish()
-        self._arm_target_pub = table.getDoubleTopic("Arm Target Turns").publish()
-        self._arm_velocity_pub = table.getDoubleTopic("Arm Velocity RPM").publish()
-        self._arm_homed_pub = table.getBooleanTopic("Arm Homed").publish()
-        self._arm_stall_cycle_pub = table.getIntegerTopic("Arm Stall Cycle").publish()
-        self._arm_stall_count_pub = table.getIntegerTopic("Arm Stall Count").publish()
-        self._arm_limits_set_pub = table.getBooleanTopic("Arm Limits Set").publish()
-        self._roller_velocity_pub = table.getDoubleTopic(
-            "Roller Velocity RPM"
-        ).publish()
-        self._roller_target_pub = table.getDoubleTopic("Roller Target RPM").publish()
-        self._roller_amps_pub = table.getDoubleTopic("Roller Amps").publish()
+        self._arm_current: float = 0.0
+        self._arm_velocity: float = 0.0
+
+        telemetry = BatchedPublisher.instance()
+        telemetry.add_struct(
+            "Intake",
+            "State",
+            IntakeState,
+            self._state,
+            deadbands={
+                "arm_position_turns": TURNS_DEADBAND,
+                "arm_velocity_rpm": RPM_DEADBAND,
+                "arm_amps": AMPS_DEADBAND,
+                "roller_velocity_rpm": RPM_DEADBAND,
+                "roller_amps": AMPS_DEADBAND,
+            },
+        )
+        telemetry.add_boolean("Intake", "Arm Homed", lambda: self.homed)
+        telemetry.add_integer("Intake", "Arm Stall Cycle", lambda: self._stall_cycle)
+        telemetry.add_integer("Intake", "Arm Stall Count", lambda: self._stall_count)
+        telemetry.add_boolean("Intake", "Arm Limits Set", lambda: self.limits_set, tier=SLOW)
 
     # ── Low-level arm motor access (for homing / auto-tune commands) ──
 
@@ -244,9 +265,21 @@ class IntakeSubSystem(Subsystem):
 
     # ── Periodic ───────────────────────────────────────────────────
 
+    def _state(self) -> IntakeState:
+        return IntakeState(
+            self._arm_encoder.getPosition(),
+            self._arm_target,
+            self._arm_velocity,
+            self._arm_current,
+            self._roller_encoder.getVelocity(),
+            self._roller_target,
+            self._roller_motor.getOutputCurrent(),
+        )
+
     def periodic(self) -> None:
-        arm_current = self._arm_motor.getOutputCurrent()
-        arm_velocity = abs(self._arm_encoder.getVelocity())
+        arm_current = self._arm_current = self._arm_motor.getOutputCurrent()
+        self._arm_velocity = self._arm_encoder.getVelocity()
+        arm_velocity = abs(self._arm_velocity)
 
         # Stall detection during position control
         if self._arm_position_active:
@@ -263,17 +296,5 @@ class IntakeSubSystem(Subsystem):
                 self._arm_position_active = False
                 self._arm_motor.stopMotor()
 
-        self._arm_amps_pub.set(arm_current)
-        self._arm_position_pub.set(self._arm_encoder.getPosition())
-        self._arm_target_pub.set(self._arm_target)
-        self._arm_velocity_pub.set(self._arm_encoder.getVelocity())
-        self._arm_homed_pub.set(self.homed)
-        self._arm_stall_cycle_pub.set(self._stall_cycle)
-        self._arm_stall_count_pub.set(self._stall_count)
-        self._arm_limits_set_pub.set(self.limits_set)
-        self._roller_velocity_pub.set(self._roller_encoder.getVelocity())
-        self._roller_target_pub.set(self._roller_target)
-        self._roller_amps_pub.set(self._roller_motor.getOutputCurrent())
-
     def simulationPeriodic(self) -> None:
         pass
@@ -1,8 +1,8 @@
-import ntcore
 import rev
 from commands2 import Subsystem
 
 from constants import CANIds
+from modules.nt_batch import AMPS_DEADBAND, ON_CHANGE, RPM_DEADBAND, BatchedPublisher
 
 # FF gains from CalibrateFF
 RIGHT_KF = 1.8e-4
@@ -91,12 +91,12 @@ class KickerSubSystem(Subsystem):
 
         self._target_speed = 0.0
 
-        table = ntcore.NetworkTableInstance.getDefault().getTable("Kicker")
-        self._right_velocity_pub = table.getDoubleTopic("Right Velocity RPM").publish()
-        self._left_velocity_pub = table.getDoubleTopic("Left Velocity RPM").publish()
-        self._target_pub = table.getDoubleTopic("Target RPM").publish()
-        self._right_amps_pub = table.getDoubleTopic("Right Amps").publish()
-        self._left_amps_pub = table.getDoubleTopic("Left Amps").publish()
+        telemetry = BatchedPublisher.instance()
+        telemetry.add_double("Kicker", "Right Velocity RPM", self._right_encoder.getVelocity, deadband=RPM_DEADBAND)
+        telemetry.add_double("Kicker", "Left Velocity RPM", self._left_encoder.getVelocity, deadband=RPM_DEADBAND)
+        telemetry.add_double("Kicker", "Target RPM", lambda: self._target_speed, tier=ON_CHANGE)
+        telemetry.add_double("Kicker", "Right Amps", self._right_motor.getOutputCurrent, deadband=AMPS_DEADBAND)
+        telemetry.add_double("Kicker", "Left Amps", self._left_motor.getOutputCurrent, deadband=AMPS_DEADBAND)
 
     def set_duty_cycle(self, output: float) -> None:
         self._right_motor.set(output)
@@ -136,12 +136,5 @@ class KickerSubSystem(Subsystem):
         self._right_motor.stopMotor()
         self._left_motor.stopMotor()
 
-    def periodic(self):
-        self._right_velocity_pub.set(self._right_encoder.getVelocity())
-        self._left_velocity_pub.set(self._left_encoder.getVelocity())
-        self._target_pub.set(self._target_speed)
-        self._right_amps_pub.set(self._right_motor.getOutputCurrent())
-        self._left_amps_pub.set(self._left_motor.getOutputCurrent())
-
     def simulationPeriodic(self):
         pass
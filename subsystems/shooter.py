@@ -1,8 +1,8 @@
-import ntcore
 import rev
 from commands2 import Subsystem
 
 from constants import CANIds
+from modules.nt_batch import AMPS_DEADBAND, ON_CHANGE, RPM_DEADBAND, SLOW, BatchedPublisher
 
 # FF gain from CalibrateFF
 KF = 1.9e-4
@@ -12,6 +12,9 @@ KP_LOW = 7.5e-4  # Slot 0: < 1500 RPM
 KP_MID = 5.0e-4  # Slot 1: 1500–3750 RPM
 KP_HIGH = 3.5e-4  # Slot 2: > 3750 RPM
 
+# Highest target the flywheel holds under load — NEO free speed is ~4800 RPM at 10 V compensation
+MAX_RPM = 4500.0  # TUNE
+
 # Slot boundaries
 _LOW_MID_BOUNDARY = 1500.0
 _MID_HIGH_BOUNDARY = 3750.0
@@ -81,12 +84,14 @@ class ShooterSubSystem(Subsystem):
         )
 
         self._target_speed = 0.0
+        self._arb_ff_volts = 0.0
 
-        table = ntcore.NetworkTableInstance.getDefault().getTable("Shooter")
-        self._velocity_pub = table.getDoubleTopic("Velocity RPM").publish()
-        self._target_pub = table.getDoubleTopic("Target RPM").publish()
-        self._amps_pub = table.getDoubleTopic("Amps").publish()
-        self._temp_pub = table.getDoubleTopic("Temperature C").publish()
+        telemetry = BatchedPublisher.instance()
+        telemetry.add_double("Shooter", "Velocity RPM", self._encoder.getVelocity, deadband=RPM_DEADBAND)
+        telemetry.add_double("Shooter", "Target RPM", lambda: self._target_speed, tier=ON_CHANGE)
+        telemetry.add_double("Shooter", "Arb FF Volts", lambda: self._arb_ff_volts, tier=ON_CHANGE)
+        telemetry.add_double("Shooter", "Amps", self._motor.getOutputCurrent, deadband=AMPS_DEADBAND)
+        telemetry.add_double("Shooter", "Temperature C", self._motor.getMotorTemperature, tier=SLOW, deadband=0.5)
 
     @staticmethod
     def _slot_for_rpm(rpm: float) -> rev.ClosedLoopSlot:
@@ -111,23 +116,25 @@ class ShooterSubSystem(Subsystem):
     def get_current_speed(self):
         return self._encoder.getVelocity()
 
-    def set_target_speed(self, target_velocity):
+    def get_output_current(self) -> float:
+        return self._motor.getOutputCurrent()
+
+    def set_target_speed(self, target_velocity, arb_ff_volts: float = 0.0):
+        """Closed-loop velocity (RPM), plus an optional feedforward voltage on top of the PID output."""
         self._target_speed = target_velocity
+        self._arb_ff_volts = arb_ff_volts
         self._closed_loop.setReference(
             target_velocity,
             rev.SparkBase.ControlType.kVelocity,
             self._slot_for_rpm(target_velocity),
+            arb_ff_volts,
+            rev.SparkClosedLoopController.ArbFFUnits.kVoltage,
         )
 
     def stop(self):
         self._target_speed = 0.0
+        self._arb_ff_volts = 0.0
         self._motor.stopMotor()
 
-    def periodic(self):
-        self._velocity_pub.set(self._encoder.getVelocity())
-        self._target_pub.set(self._target_speed)
-        self._amps_pub.set(self._motor.getOutputCurrent())
-        self._temp_pub.set(self._motor.getMotorTemperature())
-
     def simulationPeriodic(self):
         pass
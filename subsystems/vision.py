@@ -1,16 +1,136 @@
+import atexit
 import math
+import threading
+import weakref
+from collections.abc import Callable
 from typing import override
 
 import ntcore
 from commands2 import Subsystem
-from wpilib import DataLogManager
+from wpilib import DataLogManager, DriverStation
+from wpimath.geometry import Pose2d, Translation2d
 
 from modules.limelight import LimelightHelpers, PoseEstimate
+from modules.vision_fusion import MAX_MAHALANOBIS, VisionMeasurement, combine, group_by_time, mahalanobis
+from modules.vision_tags import ALL_TAGS, TagFilter, field_zone, select_tag_filter
+from modules.vision_throttle import FULL_RATE, CameraSettings, faces_hub, select_settings
+from modules.vision_timing import LATENCY_BIN_MS, ClockOffsetEstimator, LatencyHistogram
 from subsystems.command_swerve_drivetrain import CommandSwerveDrivetrain
 
 CAMERAS = ["limelight-front", "limelight-back"]
+CAMERA_YAW_DEG = {"limelight-front": 0.0, "limelight-back": 180.0}  # Mounting yaw, robot frame
 VISION_MAX_TAG_DISTANCE = 4.125  # meters — reject estimates beyond this
 VISION_MAX_ANGULAR_VELOCITY = 720  # deg/s — reject estimates during fast rotation
+VISION_MAX_AMBIGUITY = 0.3  # reject single-tag estimates whose tag is more ambiguous than this
+VISION_MAX_REJECT_STREAK = 25  # loops of odometry-gate rejections before the gate lets one through
+VISION_TAG_FILTER_REJECT_STREAK = 10  # rejection loops after which tag filters are dropped  # TUNE
+VISION_TAG_FILTER_BLIND_LOOPS = 50  # loops without a fused frame after which tag filters are dropped  # TUNE
+VISION_INGEST_QUEUE = True  # Fuse every new frame via readQueue(); False polls the latest frame once per loop
+VISION_FUSION_THREAD = False  # Ingest and fuse on a background thread instead of in periodic()
+VISION_FUSION_PERIOD_S = 0.01  # Worker wake-up period — about the Limelight's top frame rate
+
+MT1_TOPIC = "botpose_wpiblue"
+MT2_TOPIC = "botpose_orb_wpiblue"
+_STATS_PERIOD_S = 1.0
+_THROTTLE_PERIOD_LOOPS = 5  # Re-evaluate camera throttles and tag filters every 100 ms
+_LATENCY_SMOOTHING = 0.1  # EMA weight of each pipeline latency sample
+
+
+class _FrameStats:
+    """
+    Per-camera ingestion counters, clock offset and latency histograms, published every
+    _STATS_PERIOD_S. The histograms cover one publish window, not the whole run.
+    """
+
+    def __init__(self, table: ntcore.NetworkTable, cam: str):
+        self.frames = 0
+        self.duplicates = 0
+        self.fps = 0.0
+        self.useful_fps = 0.0  # Frames that passed the vision gates
+        self.latency_ms = 0.0
+        self._window_useful = 0
+        self._last_value: list[float] | None = None
+        self._window_start_us: int | None = None
+        self._window_frames = 0
+        self._window_latency_us = 0
+        self.clock = ClockOffsetEstimator()
+        self.capture_ms = LatencyHistogram()  # cl — exposure to pipeline start
+        self.pipeline_ms = LatencyHistogram()  # tl — pipeline processing
+        self.age_ms = LatencyHistogram()  # Capture to ingestion, on the corrected clock
+
+        # The clock offset needs each frame's receive time, so it is fed as frames arrive
+        # rather than when the queue is drained. The callback holds only the estimator.
+        camera_table = LimelightHelpers.get_limelight_NTTable(cam)
+        for topic in (MT1_TOPIC, MT2_TOPIC):
+            listener = ntcore.NetworkTableListener.createListener(
+                camera_table.getDoubleArrayTopic(topic), ntcore.EventFlags.kValueAll, _clock_observer(self.clock)
+            )
+            weakref.finalize(self, listener.close)  # ntcore aborts at exit on an open listener
+
+        self._fps_pub = table.getDoubleTopic(f"{cam}/FPS").publish()
+        self._duplicates_pub = table.getIntegerTopic(f"{cam}/DuplicatesDropped").publish()
+        self._latency_pub = table.getDoubleTopic(f"{cam}/IngestLatencyMs").publish()
+        self._useful_pub = table.getDoubleTopic(f"{cam}/UsefulFPS").publish()
+        self._offset_pub = table.getDoubleTopic(f"{cam}/ClockOffsetMs").publish()
+        self._histogram_pubs = {
+            name: table.getIntegerArrayTopic(f"{cam}/LatencyHistogram/{name}").publish()
+            for name in ("Capture", "Pipeline", "Age")
+        }
+        self._age_p50_pub = table.getDoubleTopic(f"{cam}/AgeP50Ms").publish()
+        self._age_p95_pub = table.getDoubleTopic(f"{cam}/AgeP95Ms").publish()
+        table.getDoubleTopic("LatencyHistogram/BinMs").publish().set(LATENCY_BIN_MS)
+
+    def accept(self, value: list[float], received_us: int, now_us: int) -> bool:
+        """Count a queued frame. False if it repeats the previous frame and should be dropped."""
+        if value == self._last_value:
+            self.duplicates += 1
+            return False
+        self._last_value = value
+        self.frames += 1
+        self._window_frames += 1
+        self._window_latency_us += now_us - received_us
+        return True
+
+    def mark_useful(self) -> None:
+        self._window_useful += 1
+
+    def publish(self, now_us: int) -> None:
+        if self._window_start_us is None:
+            self._window_start_us = now_us
+            return
+        elapsed_s = (now_us - self._window_start_us) * 1e-6
+        if elapsed_s < _STATS_PERIOD_S:
+            return
+        self.fps = self._window_frames / elapsed_s
+        self.useful_fps = self._window_useful / elapsed_s
+        if self._window_frames:
+            self.latency_ms = self._window_latency_us / self._window_frames * 1e-3
+        self._fps_pub.set(self.fps)
+        self._duplicates_pub.set(self.duplicates)
+        self._latency_pub.set(self.latency_ms)
+        self._useful_pub.set(self.useful_fps)
+        min_delay_us = self.clock.min_delay_us
+        if min_delay_us is not None:
+            self._offset_pub.set(min_delay_us * 1e-3)
+        if self.age_ms.total:
+            self._age_p50_pub.set(self.age_ms.percentile(0.5))
+            self._age_p95_pub.set(self.age_ms.percentile(0.95))
+        for name, histogram in (("Capture", self.capture_ms), ("Pipeline", self.pipeline_ms), ("Age", self.age_ms)):
+            self._histogram_pubs[name].set(histogram.counts)
+            histogram.clear()
+        self._window_start_us = now_us
+        self._window_frames = 0
+        self._window_useful = 0
+        self._window_latency_us = 0
+
+
+def _clock_observer(clock: ClockOffsetEstimator) -> Callable[[ntcore.Event], None]:
+    """NT listener callback: frame publish time against its arrival on the robot clock."""
+
+    def observe(event: ntcore.Event) -> None:
+        clock.observe(event.data.value.time(), ntcore._now())
+
+    return observe
 
 
 class VisionSubsystem(Subsystem):
@@ -19,14 +139,60 @@ class VisionSubsystem(Subsystem):
 
     Uses MT1 while disabled (full 6-DOF solve for initial localization),
     switches to MT2 during auto/teleop (gyro-constrained, more stable while moving).
-    Each camera's estimate is fed independently to the pose estimator with
-    distance-scaled standard deviations.
+    Each loop's estimates from all cameras are gated (tag distance, single-tag ambiguity
+    and, in MT2, Mahalanobis distance from the odometry pose at the frame's timestamp),
+    then near-simultaneous frames from different cameras are combined and fed to the
+    pose estimator as one measurement with distance-scaled standard deviations.
+
+    With VISION_INGEST_QUEUE, each loop drains every frame the camera published since the
+    last one (NT readQueue), fusing each exactly once at its own timestamp and dropping
+    repeats; otherwise only the latest frame is polled. Queued frame timestamps are
+    corrected for the camera's clock offset by modules.vision_timing, which also keeps the
+    per-camera capture, pipeline and frame-age histograms.
+
+    Camera throttle and AprilTag downscaling are chosen per camera every 100 ms by
+    modules.vision_throttle from enable state, robot speed, whether the camera faces
+    hub() and whether shot_active() reports a shot, and the camera's useful frame rate.
+    The AprilTag ID whitelist is chosen alongside by modules.vision_tags from the alliance,
+    the field zone and the shot; the pipeline latency under each filter is averaged so the
+    frame-rate gain over the unfiltered pipeline can be reported.
+
+    With fusion_thread, a daemon worker does the ingestion and add_vision_measurement()
+    calls (the CTRE pose estimator is thread-safe) every VISION_FUSION_PERIOD_S, and
+    periodic() only publishes the last fused measurement handed back under a lock.
+    Ingestion and the throttle and tag-filter policies share the frame stats, reject
+    counters and LimelightHelpers entries, so they run under one state lock. set_enabled()
+    stops the worker while disabled and at interpreter exit.
     """
 
-    def __init__(self, swerve: CommandSwerveDrivetrain, cameras: list[str]):
+    def __init__(
+        self,
+        swerve: CommandSwerveDrivetrain,
+        cameras: list[str],
+        fusion_thread: bool = VISION_FUSION_THREAD,
+        hub: Callable[[], Translation2d] | None = None,
+        shot_active: Callable[[], bool] | None = None,
+    ):
         self._swerve: CommandSwerveDrivetrain = swerve
         self._cameras = cameras
         self._use_megatag2 = False
+        self._localized = False  # An MT1 pose has been fused; until then the cameras run unthrottled
+        self._hub = hub
+        self._shot_active = shot_active
+        self._loop = 0
+        self._fused_loop = 0  # periodic() loop of the last fused frame
+        self._applied: dict[str, CameraSettings] = {}
+        self._applied_filters: dict[str, TagFilter] = {}
+        self._pipeline_ms: dict[str, dict[str, float]] = {cam: {} for cam in cameras}  # camera → filter → EMA
+
+        # Worker → main loop handoff
+        self._fusion_thread = fusion_thread
+        self._state_lock = threading.Lock()  # _update() vs the throttle and tag-filter policies
+        self._measurement_lock = threading.Lock()
+        self._last_measurement: tuple[Pose2d, float] | None = None
+        self._published_timestamp = 0.0
+        self._stop_event = threading.Event()
+        self._worker: threading.Thread | None = None
 
         table = ntcore.NetworkTableInstance.getDefault().getTable("Vision")
         self._too_far_pubs = {
@@ -35,26 +201,128 @@ class VisionSubsystem(Subsystem):
         self._tag_count_pubs = {
             cam: table.getIntegerTopic(f"{cam}/TagCount").publish() for cam in cameras
         }
+        self._stats = {cam: _FrameStats(table, cam) for cam in cameras}
+        self._ambiguous_pubs = {cam: table.getIntegerTopic(f"{cam}/RejectedAmbiguity").publish() for cam in cameras}
+        self._outlier_pubs = {cam: table.getIntegerTopic(f"{cam}/RejectedOdometry").publish() for cam in cameras}
+        self._ambiguous = dict.fromkeys(cameras, 0)
+        self._outliers = dict.fromkeys(cameras, 0)
+        self._reject_streak = 0
+        self._updates_pub = table.getIntegerTopic("UpdatesPerLoop").publish()
+        self._measurement_pub = table.getStructTopic("LastMeasurement", Pose2d).publish()
+        self._throttle_pubs = {cam: table.getIntegerTopic(f"{cam}/Throttle").publish() for cam in cameras}
+        self._downscale_pubs = {cam: table.getDoubleTopic(f"{cam}/Downscale").publish() for cam in cameras}
+        table.getBooleanTopic("AdaptiveThrottle").publish().set(True)
+        self._adaptive_sub = table.getBooleanTopic("AdaptiveThrottle").subscribe(True)
+        self._tag_filter_pubs = {cam: table.getStringTopic(f"{cam}/TagFilter").publish() for cam in cameras}
+        self._tag_ids_pubs = {cam: table.getIntegerArrayTopic(f"{cam}/TagIds").publish() for cam in cameras}
+        self._filter_gain_pubs = {
+            cam: table.getDoubleTopic(f"{cam}/TagFilterFrameRateGain").publish() for cam in cameras
+        }
+        table.getBooleanTopic("AdaptiveTagFilter").publish().set(True)
+        self._tag_filter_sub = table.getBooleanTopic("AdaptiveTagFilter").subscribe(True)
 
         super().__init__()
+        if fusion_thread:
+            self.start_fusion_thread()
 
     @override
     def periodic(self):
+        worker = self._worker
+        if worker is not None and not worker.is_alive():
+            DataLogManager.log("Vision fusion thread died — fusing in periodic()")
+            self._worker = worker = None
+        if worker is None:
+            self._update(queue=VISION_INGEST_QUEUE)
+
+        if self._loop % _THROTTLE_PERIOD_LOOPS == 0:
+            with self._state_lock:
+                self._apply_throttle_policy()
+                self._apply_tag_filters()
+        self._loop += 1
+
+        measurement = self.last_measurement()
+        if measurement is not None and measurement[1] != self._published_timestamp:
+            self._measurement_pub.set(measurement[0])
+            self._published_timestamp = measurement[1]
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Mode change: MT2 and the fusion worker (if configured) while enabled, MT1 in periodic() while disabled."""
+        with self._state_lock:
+            self._use_megatag2 = enabled
+        if not self._fusion_thread:
+            return
+        if enabled:
+            self.start_fusion_thread()
+        else:
+            self.stop_fusion_thread()
+
+    def _update(self, queue: bool) -> None:
+        with self._state_lock:
+            self._update_locked(queue)
+
+    def _update_locked(self, queue: bool) -> None:
         angular_velocity = self._swerve.pigeon2.get_angular_velocity_z_world().value
-        if abs(angular_velocity) > VISION_MAX_ANGULAR_VELOCITY:
+        rotating_fast = abs(angular_velocity) > VISION_MAX_ANGULAR_VELOCITY
+        if rotating_fast and not queue:
             return
 
         try:
-            state = self._swerve.get_state_copy()
-            heading_deg = state.pose.rotation().degrees()
+            heading_deg = math.degrees(self._swerve.get_snapshot().heading)
 
+            measurements: list[VisionMeasurement] = []
             for cam in self._cameras:
-                self._process_camera(cam, heading_deg)
+                if queue:
+                    estimates = self._ingest_camera(cam, heading_deg, fuse=not rotating_fast)
+                else:
+                    estimates = [self._process_camera(cam, heading_deg)]
+                stats = self._stats[cam]
+                for estimate in estimates:
+                    measurement = self._gate(cam, estimate)
+                    if measurement is not None:
+                        stats.mark_useful()
+                        measurements.append(measurement)
+                stats.publish(ntcore._now())
+
+            self._fuse(self._reject_outliers(measurements))
 
         except Exception as e:
             DataLogManager.log(f"Vision processing failed: {e}")
 
-    def _process_camera(self, cam: str, heading_deg: float) -> None:
+    # ── Fusion thread ──────────────────────────────────────────────
+
+    def start_fusion_thread(self) -> None:
+        """Move ingestion and fusion off the main loop. No-op if already running."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._fusion_loop, name="VisionFusion", daemon=True)
+        self._worker.start()
+        atexit.register(self.stop_fusion_thread)  # Daemon threads are killed mid-update otherwise
+
+    def stop_fusion_thread(self, timeout_s: float = 1.0) -> None:
+        """Stop the worker and wait for it; periodic() fuses again afterwards."""
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        atexit.unregister(self.stop_fusion_thread)
+        self._stop_event.set()
+        worker.join(timeout_s)
+
+    @property
+    def fusion_thread_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def _fusion_loop(self) -> None:
+        # Polling readQueue() each wake-up fuses every frame once, so it needs queue ingestion
+        while not self._stop_event.wait(VISION_FUSION_PERIOD_S):
+            self._update(queue=True)
+
+    def last_measurement(self) -> tuple[Pose2d, float] | None:
+        """Last (pose, timestamp) passed to add_vision_measurement(), from either thread."""
+        with self._measurement_lock:
+            return self._last_measurement
+
+    def _process_camera(self, cam: str, heading_deg: float) -> PoseEstimate:
         if self._use_megatag2:
             LimelightHelpers.set_robot_orientation_no_flush(
                 cam, heading_deg, 0, 0, 0, 0, 0
@@ -62,28 +330,187 @@ class VisionSubsystem(Subsystem):
             estimate = LimelightHelpers.get_botpose_estimate_wpiblue_megatag2(cam)
         else:
             estimate = LimelightHelpers.get_botpose_estimate_wpiblue(cam)
+        return estimate
+
+    def _ingest_camera(self, cam: str, heading_deg: float, fuse: bool) -> list[PoseEstimate]:
+        """Every new frame queued since the last loop. fuse=False drains and returns nothing."""
+        megatag2 = self._use_megatag2
+        if megatag2:
+            LimelightHelpers.set_robot_orientation_no_flush(
+                cam, heading_deg, 0, 0, 0, 0, 0
+            )
+        active, inactive = (MT2_TOPIC, MT1_TOPIC) if megatag2 else (MT1_TOPIC, MT2_TOPIC)
+        # Drain the unused topic too, so a mode switch does not fuse stale frames
+        LimelightHelpers.get_limelight_double_array_queue(cam, inactive).readQueue()
+        frames = LimelightHelpers.get_limelight_double_array_queue(cam, active).readQueue()
 
+        stats = self._stats[cam]
+        now_us = ntcore._now()
+        fresh = [frame for frame in frames if stats.accept(frame.value, frame.time, now_us)]
+        if not fresh:
+            return []
+
+        # cl and tl are only the latest frame's; sample them once per drain
+        stats.capture_ms.add(LimelightHelpers.get_latency_capture(cam))
+        stats.pipeline_ms.add(LimelightHelpers.get_latency_pipeline(cam))
+        correction_us = stats.clock.correction_us
+        estimates = []
+        for frame in fresh:
+            estimate = LimelightHelpers.pose_estimate_from_array(frame.value, frame.time + correction_us, megatag2)
+            if frame.value:
+                stats.age_ms.add((now_us * 1e-6 - estimate.timestamp_seconds) * 1e3)
+            if fuse:
+                estimates.append(estimate)
+        return estimates
+
+    # ── Fusion ─────────────────────────────────────────────────────
+
+    def _gate(self, cam: str, estimate: PoseEstimate | None) -> VisionMeasurement | None:
+        """Per-frame checks that need no odometry. Returns the measurement to fuse, or None."""
         if estimate is None or estimate.tag_count == 0:
             self._tag_count_pubs[cam].set(0)
-            return
+            return None
 
         self._tag_count_pubs[cam].set(estimate.tag_count)
 
         if estimate.avg_tag_dist > VISION_MAX_TAG_DISTANCE:
             self._too_far_pubs[cam].set(True)
-            return
+            return None
 
         self._too_far_pubs[cam].set(False)
 
-        self._swerve.add_vision_measurement(
+        # A lone ambiguous tag can flip between two mirror-image solutions
+        if estimate.tag_count == 1 and any(
+            f.ambiguity > VISION_MAX_AMBIGUITY for f in estimate.raw_fiducials
+        ):
+            self._ambiguous[cam] += 1
+            self._ambiguous_pubs[cam].set(self._ambiguous[cam])
+            return None
+
+        return VisionMeasurement(
+            cam,
             estimate.pose,
             estimate.timestamp_seconds,
             self._get_dynamic_std_devs(estimate),
         )
 
-    def set_throttle(self, throttle: int) -> None:
-        for cam in self._cameras:
-            LimelightHelpers.set_throttle(cam, throttle)
+    def _reject_outliers(self, measurements: list[VisionMeasurement]) -> list[VisionMeasurement]:
+        """
+        Drop measurements that disagree with odometry. Only in MT2 — MT1 runs while disabled to
+        find the initial pose, when odometry cannot be trusted. After VISION_MAX_REJECT_STREAK
+        loops in which everything was rejected, one loop passes so odometry can be corrected.
+        """
+        if not self._use_megatag2 or not measurements:
+            return measurements
+
+        accepted = []
+        for m in measurements:
+            odometry = self._swerve.sample_pose_at(m.timestamp)
+            if odometry is None or mahalanobis(m, odometry) <= MAX_MAHALANOBIS:
+                accepted.append(m)
+            else:
+                self._outliers[m.camera] += 1
+                self._outlier_pubs[m.camera].set(self._outliers[m.camera])
+
+        if accepted:
+            self._reject_streak = 0
+            return accepted
+        self._reject_streak += 1
+        if self._reject_streak >= VISION_MAX_REJECT_STREAK:
+            self._reject_streak = 0
+            return measurements
+        return []
+
+    def _fuse(self, measurements: list[VisionMeasurement]) -> None:
+        """One add_vision_measurement() per group of near-simultaneous frames."""
+        groups = group_by_time(measurements)
+        for group in groups:
+            m = combine(group)
+            self._swerve.add_vision_measurement(m.pose, m.timestamp, m.std_devs)
+            self._localized = self._localized or not self._use_megatag2
+            self._fused_loop = self._loop
+            with self._measurement_lock:
+                self._last_measurement = (m.pose, m.timestamp)
+        self._updates_pub.set(len(groups))
+
+    # ── Throttle policy ────────────────────────────────────────────
+
+    def _apply_throttle_policy(self) -> None:
+        """Push each camera's throttle and downscale, writing NT only when they change."""
+        try:
+            drive = self._swerve.get_snapshot()
+            speed = math.hypot(drive.vx, drive.vy)
+            enabled = DriverStation.isEnabled()
+            shot_active = self._shot_active is not None and self._shot_active()
+            hub = self._hub() if self._hub is not None else None
+            adaptive = self._adaptive_sub.get()
+
+            for cam in self._cameras:
+                if adaptive:
+                    facing = hub is not None and faces_hub(CAMERA_YAW_DEG.get(cam, 0.0), drive.pose, hub)
+                    settings = select_settings(
+                        enabled, shot_active, facing, speed, self._stats[cam].useful_fps, self._localized
+                    )
+                else:
+                    settings = FULL_RATE
+                if settings != self._applied.get(cam):
+                    LimelightHelpers.set_throttle(cam, settings.throttle)
+                    LimelightHelpers.set_fiducial_downscaling_override(cam, settings.downscale)
+                    self._throttle_pubs[cam].set(settings.throttle)
+                    self._downscale_pubs[cam].set(settings.downscale)
+                    self._applied[cam] = settings
+
+        except Exception as e:
+            DataLogManager.log(f"Vision throttle policy failed: {e}")
+
+    # ── Tag filters ────────────────────────────────────────────────
+
+    def _apply_tag_filters(self) -> None:
+        """Push each camera's tag whitelist on change, and report its pipeline frame-rate gain."""
+        try:
+            pose = self._swerve.get_snapshot().pose
+            alliance = DriverStation.getAlliance()
+            red = None if alliance is None else alliance == DriverStation.Alliance.kRed
+            enabled = DriverStation.isEnabled() and self._tag_filter_sub.get()
+            zone = field_zone(pose.X(), bool(red))
+            shot_active = self._shot_active is not None and self._shot_active()
+            hub = self._hub() if self._hub is not None else None
+            # The zone comes from odometry; while it may have drifted, let every tag correct it
+            pose_trusted = (
+                self._localized
+                and self._loop - self._fused_loop < VISION_TAG_FILTER_BLIND_LOOPS
+                and self._reject_streak < VISION_TAG_FILTER_REJECT_STREAK
+            )
+
+            for cam in self._cameras:
+                facing = hub is not None and faces_hub(CAMERA_YAW_DEG.get(cam, 0.0), pose, hub)
+                tag_filter = select_tag_filter(enabled, red, zone, shot_active, facing, pose_trusted)
+                applied = self._applied_filters.get(cam)
+                if tag_filter != applied:
+                    LimelightHelpers.set_fiducial_id_filters_override(cam, list(tag_filter.ids))
+                    self._tag_filter_pubs[cam].set(tag_filter.name)
+                    self._tag_ids_pubs[cam].set(list(tag_filter.ids))
+                    self._applied_filters[cam] = tag_filter
+                if applied is not None:
+                    self._record_pipeline_latency(cam, applied.name)
+
+        except Exception as e:
+            DataLogManager.log(f"Vision tag filter failed: {e}")
+
+    def _record_pipeline_latency(self, cam: str, filter_name: str) -> None:
+        """
+        Average the camera's pipeline latency under the filter that was active for the last
+        100 ms. Frame-rate gain is unfiltered latency over filtered latency (1.0 until both
+        have been measured).
+        """
+        latency_ms = LimelightHelpers.get_latency_pipeline(cam)
+        if latency_ms <= 0.0:
+            return
+        averages = self._pipeline_ms[cam]
+        previous = averages.get(filter_name, latency_ms)
+        current = averages[filter_name] = previous + _LATENCY_SMOOTHING * (latency_ms - previous)
+        baseline = averages.get(ALL_TAGS.name)
+        self._filter_gain_pubs[cam].set(baseline / current if baseline is not None else 1.0)
 
     @staticmethod
     def _get_dynamic_std_devs(estimate: PoseEstimate) -> tuple[float, float, float]:
@@ -1,19 +1,38 @@
+import time
+
+import ntcore.meta
 from ntcore import NetworkTableInstance
 from phoenix6 import SignalLogger, swerve, units
 from wpilib import Color, Color8Bit, Mechanism2d, MechanismLigament2d, SmartDashboard
 from wpimath.geometry import Pose2d
 from wpimath.kinematics import ChassisSpeeds, SwerveModulePosition, SwerveModuleState
 
+NT_PERIOD_S = 0.02  # NT rate cap, 50 Hz — DataLogManager records DriveState for tools/replay_vision.py  # TUNE
+MECHANISM_CHECK_PERIOD_S = 1.0  # How often to look for a dashboard subscribed to the Mechanism2d widgets
+
 
 class Telemetry:
-    def __init__(self, max_speed: units.meters_per_second):
+    def __init__(self, max_speed: units.meters_per_second, nt_period_s: float = NT_PERIOD_S):
         """
         Construct a telemetry object with the specified max speed of the robot.
 
         :param max_speed: Maximum speed
         :type max_speed: units.meters_per_second
+        :param nt_period_s: Minimum time between NetworkTables updates
+        :type nt_period_s: float
         """
         self._max_speed = max_speed
+        self._speed_scale = 1.0 / (2 * max_speed)
+        self._nt_period_s = nt_period_s
+        self._next_nt_s = 0.0
+        self._next_mechanism_check_s = 0.0
+        self._mechanisms_watched = False
+        self._pose_array = [0.0, 0.0, 0.0]
+
+        # Callback CPU time, averaged over the calls between NT updates
+        self._cpu_s = 0.0
+        self._cpu_max_s = 0.0
+        self._calls = 0
         # SignalLogger.start()
 
         # What to publish over networktables for telemetry
@@ -34,11 +53,14 @@ class Telemetry:
         ).publish()
         self._drive_timestamp = self._drive_state_table.getDoubleTopic("Timestamp").publish()
         self._drive_odometry_frequency = self._drive_state_table.getDoubleTopic("OdometryFrequency").publish()
+        self._callback_cpu = self._drive_state_table.getDoubleTopic("TelemetryCpuMs").publish()
+        self._callback_cpu_max = self._drive_state_table.getDoubleTopic("TelemetryCpuMaxMs").publish()
 
         # Robot pose for field positioning
         self._table = self._inst.getTable("Pose")
         self._field_pub = self._table.getDoubleArrayTopic("robotPose").publish()
         self._field_type_pub = self._table.getStringTopic(".type").publish()
+        self._field_type_pub.set("Field2d")
 
         # Mechanisms to represent the swerve module states
         self._module_mechanisms: list[Mechanism2d] = [
@@ -74,10 +96,42 @@ class Telemetry:
         for i, module_mechanism in enumerate(self._module_mechanisms):
             SmartDashboard.putData(f"Module {i}", module_mechanism)
 
+        # The server lists every subscriber of a topic, prefix subscriptions included, on $sub$<topic>.
+        # A dashboard may show any one of the modules, so watch each one's speed ligament.
+        self._mechanism_subscribers = [
+            self._inst.getRawTopic(f"$sub$/SmartDashboard/Module {i}/RootSpeed/Speed/angle").subscribe("msgpack", b"")
+            for i in range(len(self._module_mechanisms))
+        ]
+
     def telemeterize(self, state: swerve.SwerveDrivetrain.SwerveDriveState):
         """
         Accept the swerve drive state and telemeterize it to SmartDashboard and SignalLogger.
+        Every state goes to SignalLogger; NetworkTables gets one every nt_period_s, and the
+        Mechanism2d widgets only while a dashboard is subscribed to them.
         """
+        start = time.thread_time()
+
+        # Log every odometry update
+        SignalLogger.write_struct("DriveState/Pose", Pose2d, state.pose)
+        SignalLogger.write_struct("DriveState/Speeds", ChassisSpeeds, state.speeds)
+        SignalLogger.write_struct_array("DriveState/ModuleStates", SwerveModuleState, state.module_states)
+        SignalLogger.write_struct_array("DriveState/ModuleTargets", SwerveModuleState, state.module_targets)
+        SignalLogger.write_struct_array("DriveState/ModulePositions", SwerveModulePosition, state.module_positions)
+        SignalLogger.write_double("DriveState/OdometryPeriod", state.odometry_period, "seconds")
+
+        # Half an odometry period of slack so timestamp jitter does not skip a due update
+        if state.timestamp >= self._next_nt_s - state.odometry_period / 2:
+            self._next_nt_s += self._nt_period_s
+            if self._next_nt_s <= state.timestamp:  # Fell behind (or first call) — restart the schedule
+                self._next_nt_s = state.timestamp + self._nt_period_s
+            self._publish_nt(state)
+
+        elapsed = time.thread_time() - start
+        self._cpu_s += elapsed
+        self._cpu_max_s = max(self._cpu_max_s, elapsed)
+        self._calls += 1
+
+    def _publish_nt(self, state: swerve.SwerveDrivetrain.SwerveDriveState) -> None:
         # Telemeterize the swerve drive state
         self._drive_pose.set(state.pose)
         self._drive_speeds.set(state.speeds)
@@ -87,22 +141,35 @@ class Telemetry:
         self._drive_timestamp.set(state.timestamp)
         self._drive_odometry_frequency.set(1.0 / state.odometry_period)
 
-        # Also write to log file
-        SignalLogger.write_struct("DriveState/Pose", Pose2d, state.pose)
-        SignalLogger.write_struct("DriveState/Speeds", ChassisSpeeds, state.speeds)
-        SignalLogger.write_struct_array("DriveState/ModuleStates", SwerveModuleState, state.module_states)
-        SignalLogger.write_struct_array("DriveState/ModuleTargets", SwerveModuleState, state.module_targets)
-        SignalLogger.write_struct_array("DriveState/ModulePositions", SwerveModulePosition, state.module_positions)
-        SignalLogger.write_double("DriveState/OdometryPeriod", state.odometry_period, "seconds")
-
         # Telemeterize the pose to a Field2d
-        self._field_type_pub.set("Field2d")
-
-        pose_array: list[float] = [state.pose.x, state.pose.y, state.pose.rotation().degrees()]
-        self._field_pub.set(pose_array)  # type: ignore[arg-type]
+        pose_array = self._pose_array
+        pose_array[0] = state.pose.x
+        pose_array[1] = state.pose.y
+        pose_array[2] = state.pose.rotation().degrees()
+        self._field_pub.set(pose_array)
 
         # Telemeterize each module state to a Mechanism2d
-        for i, module_state in enumerate(state.module_states):
-            self._module_speeds[i].setAngle(module_state.angle.degrees())
-            self._module_directions[i].setAngle(module_state.angle.degrees())
-            self._module_speeds[i].setLength(module_state.speed / (2 * self._max_speed))
+        if state.timestamp >= self._next_mechanism_check_s:
+            self._next_mechanism_check_s = state.timestamp + MECHANISM_CHECK_PERIOD_S
+            self._mechanisms_watched = self._dashboard_subscribed()
+        if self._mechanisms_watched:
+            for i, module_state in enumerate(state.module_states):
+                angle = module_state.angle.degrees()
+                self._module_speeds[i].setAngle(angle)
+                self._module_directions[i].setAngle(angle)
+                self._module_speeds[i].setLength(module_state.speed * self._speed_scale)
+
+        if self._calls:
+            self._callback_cpu.set(self._cpu_s / self._calls * 1e3)
+            self._callback_cpu_max.set(self._cpu_max_s * 1e3)
+        self._cpu_s = 0.0
+        self._cpu_max_s = 0.0
+        self._calls = 0
+
+    def _dashboard_subscribed(self) -> bool:
+        """True if a remote client subscribes to any module widget (the local client is named "")."""
+        for subscribers in self._mechanism_subscribers:
+            raw = subscribers.get()
+            if raw and any(sub.client for sub in ntcore.meta.decodeTopicSubscribers(raw)):
+                return True
+        return False
@@ -0,0 +1,59 @@
+import math
+
+import pytest
+
+from modules.drive_motion import MAX_ACCEL_MPS2, RESET_GAP_S, MotionEstimate, MotionEstimator
+
+DT = 0.02
+
+
+def test_first_sample_rotates_speeds_into_field_frame():
+    estimator = MotionEstimator()
+    estimate = estimator.update(1.0, 2.0, 3.0, math.pi / 2, 1.5, 0.0, 0.4)
+    assert (estimate.vx, estimate.vy) == pytest.approx((0.0, 1.5))
+    assert (estimate.ax, estimate.ay) == (0.0, 0.0)
+    assert estimate.omega == 0.4
+    assert estimator.estimate is estimate
+
+
+def test_constant_acceleration_converges():
+    estimator = MotionEstimator()
+    for i in range(100):
+        t = i * DT
+        estimate = estimator.update(t, 0.0, 0.0, 0.0, 3.0 * t, 0.0, 0.0)
+    assert estimate.ax == pytest.approx(3.0, rel=1e-3)
+    assert estimate.vx == pytest.approx(3.0 * 99 * DT, abs=0.1)  # filter lag ~ a * tau
+    assert estimate.ay == pytest.approx(0.0)
+
+
+def test_acceleration_clamped_on_wheel_slip_spike():
+    estimator = MotionEstimator()
+    estimator.update(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    estimate = estimator.update(DT, 0.0, 0.0, 0.0, 10.0, 0.0, 0.0)  # 500 m/s² raw
+    assert 0.0 < estimate.ax <= MAX_ACCEL_MPS2
+
+
+def test_duplicate_sample_and_gap_handling():
+    estimator = MotionEstimator()
+    estimator.update(0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    previous = estimator.update(DT, 0.0, 0.0, 0.0, 2.0, 0.0, 0.0)
+    assert estimator.update(DT, 5.0, 5.0, 0.0, 9.0, 0.0, 0.0) is previous
+
+    restarted = estimator.update(DT + RESET_GAP_S + 0.1, 1.0, 1.0, 0.0, 0.5, 0.0, 0.0)
+    assert (restarted.vx, restarted.ax) == (0.5, 0.0)
+
+
+def test_reset_restarts_filters():
+    estimator = MotionEstimator()
+    estimator.update(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    estimator.update(DT, 0.0, 0.0, 0.0, 2.0, 0.0, 0.0)
+    estimator.reset()
+    restarted = estimator.update(2 * DT, 5.0, 5.0, 0.0, 1.0, 0.0, 0.0)
+    assert (restarted.x, restarted.vx, restarted.ax) == (5.0, 1.0, 0.0)
+
+
+def test_predict_under_constant_acceleration():
+    estimate = MotionEstimate(0.0, 1.0, 2.0, 0.5, 2.0, -1.0, 0.2, 4.0, 0.0)
+    x, y, heading = estimate.predict(0.5)
+    assert (x, y, heading) == pytest.approx((1.0 + 1.0 + 0.5, 2.0 - 0.5, 0.6))
+    assert estimate.predict_velocity(0.5) == pytest.approx((4.0, -1.0))
@@ -0,0 +1,56 @@
+import math
+from types import SimpleNamespace
+
+import pytest
+from wpimath.geometry import Pose2d, Rotation2d
+from wpimath.kinematics import ChassisSpeeds
+
+from modules.drive_motion import MotionEstimator
+from modules.pose_history import PoseHistory
+from subsystems.command_swerve_drivetrain import CommandSwerveDrivetrain, DriveSnapshot
+
+
+def test_from_state_rotates_speeds_into_field_frame():
+    pose = Pose2d(3.0, 4.0, Rotation2d.fromDegrees(90.0))
+    speeds = ChassisSpeeds(2.0, 0.5, 1.5)
+    drive = DriveSnapshot.from_state(pose, speeds, 12.5)
+    assert (drive.x, drive.y, drive.heading) == pytest.approx((3.0, 4.0, math.pi / 2))
+    assert (drive.vx, drive.vy) == pytest.approx((-0.5, 2.0))  # robot forward is field +y
+    assert drive.omega == 1.5
+    assert drive.timestamp == 12.5
+    assert drive.pose is pose and drive.speeds is speeds
+
+
+def test_snapshot_is_immutable():
+    drive = DriveSnapshot.from_state(Pose2d(), ChassisSpeeds())
+    with pytest.raises(AttributeError):
+        drive.x = 1.0  # type: ignore[misc]
+
+
+def _odometry(timestamp: float, x: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        timestamp=timestamp, pose=Pose2d(x, 0.0, 0.0), speeds=ChassisSpeeds(1.0, 0.0, 0.0), module_states=[]
+    )
+
+
+def test_pose_reset_applied_on_odometry_thread():
+    """reset_pose() only records the time; the odometry callback drops history and motion from before it."""
+    drivetrain = SimpleNamespace(
+        _motion=MotionEstimator(),
+        _history=PoseHistory(16),
+        _reset_at=None,
+        _applied_reset_at=None,
+        _telemetry_function=None,
+    )
+    for i in range(5):
+        CommandSwerveDrivetrain._on_odometry(drivetrain, _odometry(i * 0.02, i * 0.02))
+    drivetrain._reset_at = 0.09
+
+    CommandSwerveDrivetrain._on_odometry(drivetrain, _odometry(0.085, 0.1))  # computed before the reset
+    assert len(drivetrain._history) == 6  # reset still pending
+
+    CommandSwerveDrivetrain._on_odometry(drivetrain, _odometry(0.1, 7.0))
+    assert len(drivetrain._history) == 1
+    assert drivetrain._motion.estimate.x == 7.0
+    CommandSwerveDrivetrain._on_odometry(drivetrain, _odometry(0.12, 7.02))
+    assert len(drivetrain._history) == 2
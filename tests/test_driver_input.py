@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import pytest
+
+from modules import driver_input
+from modules.driver_input import (
+    LOOP_PERIOD_S,
+    MAX_LOOP_DT_S,
+    ROTATION_SLEW_PER_S,
+    TRANSLATION_SLEW_PER_S,
+    DriverInput,
+    joystick_filter,
+    slew,
+)
+
+MAX_SPEED = 4.0
+MAX_ANGULAR_RATE = 3.0
+TRANSLATION_STEP = TRANSLATION_SLEW_PER_S * LOOP_PERIOD_S
+
+
+@pytest.fixture
+def sticks():
+    return {"left_x": 0.0, "left_y": 0.0, "right_x": 0.0}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """FPGA time, advanced one robot loop per update() unless a test moves it."""
+    clock = {"now": 10.0, "step": LOOP_PERIOD_S}
+
+    def get_fpga_timestamp():
+        clock["now"] += clock["step"]
+        return clock["now"]
+
+    monkeypatch.setattr(driver_input, "Timer", SimpleNamespace(getFPGATimestamp=get_fpga_timestamp))
+    return clock
+
+
+@pytest.fixture
+def driver(sticks, clock):
+    controller = SimpleNamespace(
+        getLeftX=lambda: sticks["left_x"], getLeftY=lambda: sticks["left_y"], getRightX=lambda: sticks["right_x"]
+    )
+    return DriverInput(controller, MAX_SPEED, MAX_ANGULAR_RATE)
+
+
+def test_joystick_filter_deadband_and_curve():
+    assert joystick_filter(0.04) == 0.0
+    assert joystick_filter(1.0) == pytest.approx(1.0)
+    assert joystick_filter(-1.0) == pytest.approx(-1.0)
+    assert joystick_filter(0.525) == pytest.approx(0.25)
+
+
+def test_slew_limits_only_moves_away_from_centre():
+    assert slew(0.0, 1.0, 0.1) == pytest.approx(0.1)
+    assert slew(0.5, 1.0, 0.1) == pytest.approx(0.6)
+    assert slew(0.8, 0.2, 0.1) == 0.2  # Easing off is immediate
+    assert slew(0.8, 0.0, 0.1) == 0.0  # Release is immediate
+    assert slew(0.8, -1.0, 0.1) == pytest.approx(-0.1)  # Reversal restarts from centre
+
+
+def test_idle_when_sticks_centred(driver, sticks):
+    driver.update()
+    assert driver.idle
+    assert (driver.vx, driver.vy, driver.omega) == (0.0, 0.0, 0.0)
+    sticks["right_x"] = 0.5
+    driver.update()
+    assert not driver.idle
+
+
+def test_full_stick_ramps_to_max_speed(driver, sticks):
+    sticks["left_y"] = -1.0  # Pushed forward
+    driver.update()
+    assert driver.vx == pytest.approx(TRANSLATION_STEP * MAX_SPEED)
+    for _ in range(round(1.0 / TRANSLATION_STEP)):
+        driver.update()
+    assert driver.vx == pytest.approx(MAX_SPEED)
+    assert driver.vy == 0.0
+
+    sticks["left_y"] = 0.0
+    driver.update()
+    assert driver.vx == 0.0 and driver.idle
+
+
+def test_rotation_uses_its_own_slew_and_scale(driver, sticks):
+    sticks["right_x"] = -1.0  # Counter-clockwise
+    driver.update()
+    assert driver.omega == pytest.approx(ROTATION_SLEW_PER_S * LOOP_PERIOD_S * MAX_ANGULAR_RATE)
+
+
+def test_stick_direction_is_not_slewed(driver, sticks):
+    sticks["left_y"] = -1.0
+    driver.update()
+    sticks["left_x"] = -1.0
+    sticks["left_y"] = 0.0
+    driver.update()
+    assert (driver.stick_x, driver.stick_y) == (0.0, pytest.approx(1.0))
+    assert driver.vy == pytest.approx(TRANSLATION_STEP * MAX_SPEED)  # Drive still ramps
+
+
+def test_slew_step_follows_measured_loop_time(driver, sticks, clock):
+    sticks["left_y"] = -1.0
+    driver.update()
+    clock["step"] = 2 * LOOP_PERIOD_S  # Skipped tick
+    driver.update()
+    assert driver.vx == pytest.approx(3 * TRANSLATION_STEP * MAX_SPEED)
+
+    clock["step"] = 1.0  # Long stall is clamped rather than jumping to full speed
+    driver.update()
+    expected = 3 * TRANSLATION_STEP + TRANSLATION_SLEW_PER_S * MAX_LOOP_DT_S
+    assert driver.vx == pytest.approx(expected * MAX_SPEED)
@@ -0,0 +1,188 @@
+import pytest
+
+from modules.feed_cadence import (
+    BOOST_LEAD_S,
+    BOOST_MAX_S,
+    BOOST_VOLTS_PER_RPM,
+    CURRENT_RISE_A,
+    DIP_RPM,
+    FEED_LEAD_S,
+    FEED_OUTPUT,
+    RECOVERY_TARGET_S,
+    DipBoost,
+    FeedCadence,
+)
+
+TARGET = 2500.0
+TOLERANCE = 75.0
+LOOP_S = 0.02
+
+
+@pytest.fixture
+def cadence():
+    c = FeedCadence(TOLERANCE)
+    for i in range(5):
+        c.update(TARGET, TARGET, 10.0, i * LOOP_S)  # settle the current baseline
+    return c
+
+
+def test_exit_needs_dip_and_current_rise(cadence):
+    cadence.update(TARGET, TARGET - DIP_RPM - 50, 10.0, 0.1)  # dip alone
+    assert cadence.shots_fired == 0
+    cadence.update(TARGET, TARGET, 10.0 + CURRENT_RISE_A + 5, 0.12)  # current alone
+    assert cadence.shots_fired == 0
+    cadence.update(TARGET, TARGET - DIP_RPM - 50, 10.0 + CURRENT_RISE_A + 5, 0.14)
+    assert cadence.shots_fired == 1
+    assert cadence.state == FeedCadence.RECOVERING
+
+
+def test_holds_feed_until_recovery_is_within_lead(cadence):
+    assert cadence.update(TARGET, TARGET - 600, 25.0, 0.1) == 0.0
+    # Feed resumes once the predicted time back to tolerance is within the lead
+    error_at_lead = TOLERANCE + cadence.recovery_rate * cadence.lead_s
+    assert cadence.update(TARGET, TARGET - error_at_lead - 20, 12.0, 0.12) == 0.0
+    assert cadence.update(TARGET, TARGET - error_at_lead + 20, 12.0, 0.14) == FEED_OUTPUT
+    assert cadence.update(TARGET, TARGET - 10, 11.0, 0.2) == FEED_OUTPUT
+    assert cadence.state == FeedCadence.ARMED
+
+
+def _simulate(cadence, balls, transit_s, dip_rpm=350.0, recovery_rpm_s=2500.0):
+    """Flywheel that dips per ball and recovers linearly; a ball exits transit_s of feeding after the last."""
+    rpm = TARGET
+    fed = 0.0
+    errors_at_exit = []
+    t = 0.0
+    output = FEED_OUTPUT
+    while len(errors_at_exit) < balls and t < 20.0:
+        amps = 10.0
+        fed += LOOP_S if output > 0 else 0.0
+        if fed >= transit_s:
+            fed = 0.0
+            errors_at_exit.append(TARGET - rpm)
+            rpm -= dip_rpm
+            amps = 30.0
+        else:
+            rpm = min(rpm + recovery_rpm_s * LOOP_S, TARGET)
+        output = cadence.update(TARGET, rpm, amps, t)
+        t += LOOP_S
+    return errors_at_exit, t
+
+
+def test_counts_shots_and_reports_interval():
+    cadence = FeedCadence(TOLERANCE)
+    errors, _ = _simulate(cadence, balls=8, transit_s=0.1)
+    assert cadence.shots_fired == len(errors) == 8
+    assert cadence.last_interval > 0.0
+
+
+def test_cadence_keeps_shots_in_tolerance_after_learning():
+    cadence = FeedCadence(TOLERANCE)
+    errors, paced_s = _simulate(cadence, balls=20, transit_s=0.1)
+    assert all(e <= TOLERANCE for e in errors[-10:])
+    assert cadence.lead_s <= FEED_LEAD_S + 20 * 0.005
+
+    # Constant feed: faster, but shots leave during the dips
+    class _Constant(FeedCadence):
+        def update(self, *args):
+            super().update(*args)
+            return FEED_OUTPUT
+
+    errors, constant_s = _simulate(_Constant(TOLERANCE), balls=20, transit_s=0.1)
+    assert sum(e > TOLERANCE for e in errors) > 10
+    assert paced_s < constant_s * 2.5
+
+
+def test_reset_keeps_learned_pacing(cadence):
+    cadence.lead_s = 0.05
+    cadence.shots_fired = 3
+    cadence.reset()
+    assert cadence.shots_fired == 0
+    assert cadence.lead_s == 0.05
+
+
+def test_boost_sized_from_dip_and_ends_in_tolerance():
+    boost = DipBoost(TOLERANCE)
+    assert boost.update(TARGET, TARGET - 300, 0.0) == 0.0  # not started
+    boost.start(0.0)
+    assert boost.update(TARGET, TARGET - 300, 0.0) == pytest.approx(300 * BOOST_VOLTS_PER_RPM)
+    assert boost.update(TARGET, TARGET - 200, 0.02) == pytest.approx(300 * BOOST_VOLTS_PER_RPM)
+    assert boost.update(TARGET, TARGET - 50, 0.06) == 0.0
+    assert not boost.active
+    assert boost.last_recovery_s == pytest.approx(0.06)
+    assert boost.expected_dip > 0.0
+
+    # Next shot: boost applied from the learned dip before the error develops
+    boost.start(1.0)
+    assert boost.update(TARGET, TARGET - 20, 1.0) == pytest.approx(boost.expected_dip * BOOST_VOLTS_PER_RPM)
+
+
+def test_boost_gain_learns_from_recovery_profile():
+    boost = DipBoost(TOLERANCE)
+    boost.start(0.0)
+    boost.update(TARGET, TARGET - 300, 0.0)
+    boost.update(TARGET, TARGET, RECOVERY_TARGET_S + 0.1)  # slow recovery
+    assert boost.volts_per_rpm > BOOST_VOLTS_PER_RPM
+
+    gain = boost.volts_per_rpm
+    boost.start(1.0)
+    boost.update(TARGET, TARGET - 300, 1.0)
+    boost.update(TARGET, TARGET, 1.04)  # fast recovery...
+    boost.update(TARGET, TARGET + 2 * TOLERANCE, 1.08)  # ...that overshoots
+    assert boost.volts_per_rpm < gain
+
+
+def test_boost_engages_on_feed_before_the_exit():
+    boost = DipBoost(TOLERANCE)
+    boost.expected_dip = 300.0
+    boost.feed(0.0, FEED_LEAD_S)
+    engage = FEED_LEAD_S - BOOST_LEAD_S
+    assert boost.update(TARGET, TARGET, engage - LOOP_S) == 0.0
+    assert boost.update(TARGET, TARGET, engage) == pytest.approx(300 * BOOST_VOLTS_PER_RPM)
+    assert boost.active
+
+    # The exit detector times the recovery and ends the boost back in tolerance
+    exit_time = FEED_LEAD_S
+    boost.exit_detected(exit_time)
+    assert boost.update(TARGET, TARGET - 250, exit_time) > 0.0
+    assert boost.update(TARGET, TARGET - 50, exit_time + 0.08) == 0.0
+    assert not boost.active
+    assert boost.last_recovery_s == pytest.approx(0.08)
+
+
+def test_boost_engages_at_exit_without_a_feed_command():
+    boost = DipBoost(TOLERANCE)
+    boost.exit_detected(0.0)
+    assert boost.active
+    assert boost.update(TARGET, TARGET - 300, 0.0) == pytest.approx(300 * BOOST_VOLTS_PER_RPM)
+
+
+def test_boost_dropped_when_the_fed_ball_never_arrives():
+    boost = DipBoost(TOLERANCE)
+    boost.expected_dip = 300.0
+    boost.feed(0.0, BOOST_LEAD_S)
+    assert boost.update(TARGET, TARGET, 0.0) > 0.0
+    assert boost.update(TARGET, TARGET, BOOST_MAX_S + LOOP_S) == 0.0
+    assert not boost.active
+    assert boost.expected_dip == 300.0
+    assert boost.volts_per_rpm == BOOST_VOLTS_PER_RPM
+
+
+def _recover(boost, rpm_s_per_volt, dip_rpm=350.0, base_rpm_s=1500.0):
+    """Seconds from a ball exit until the flywheel is back in tolerance."""
+    rpm = TARGET - dip_rpm
+    boost.start(0.0)
+    t = 0.0
+    while TARGET - rpm > TOLERANCE:
+        volts = boost.update(TARGET, rpm, t)
+        rpm += (base_rpm_s + rpm_s_per_volt * volts) * LOOP_S
+        t += LOOP_S
+    boost.update(TARGET, rpm, t)
+    return t
+
+
+def test_boost_shortens_recovery():
+    unboosted = _recover(DipBoost(TOLERANCE), rpm_s_per_volt=0.0)
+    boost = DipBoost(TOLERANCE)
+    times = [_recover(boost, rpm_s_per_volt=800.0) for _ in range(10)]
+    assert times[-1] < unboosted
+    assert times[-1] <= times[0]
@@ -0,0 +1,463 @@
+import math
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from wpilib.simulation import DriverStationSim
+from wpimath.geometry import Rotation2d
+
+from commands import hub_shot
+from commands.hub_shot import (
+    _SOLVER_TOLERANCE_S,
+    BLUE_HUB,
+    READY_CONFIRM_LOOPS,
+    READY_HEADING_TOLERANCE_RAD,
+    READY_RPM_TOLERANCE,
+    RED_HUB,
+    SHOOTER_MAX_RPM,
+    SOLVER_NEWTON,
+    BallisticsGrid,
+    HubShot,
+    ShotReadiness,
+    VirtualGoal,
+    _rpm_to_exit_velocity,
+    build_shot_zones,
+    compute_ballistics,
+    limit_shot,
+    load_shot_zones,
+    max_shot_distance,
+    shot_feasible_many,
+    solve_flight_time,
+    solve_virtual_goal_batch,
+)
+from modules.drive_motion import MotionEstimate
+from modules.feed_cadence import BOOST_LEAD_S
+
+SLIP = 0.5
+
+
+@pytest.fixture
+def grid():
+    grid = BallisticsGrid()
+    grid.refresh(SLIP)
+    return grid
+
+
+@pytest.fixture
+def restore_shot_map():
+    yield
+    hub_shot.SHOT_MAP.load(hub_shot.SHOT_TABLE)
+
+
+@pytest.mark.parametrize(
+    "distance, closing_speed, tangential_speed",
+    [(1.13, 0.0, 0.0), (2.62, 1.7, 0.3), (3.9, -2.3, -1.1), (5.05, 4.1, 2.6), (8.8, -4.9, 4.4)],
+)
+def test_grid_matches_converged_solve(grid, distance, closing_speed, tangential_speed):
+    """Interpolated grid flight time stays close to the converged Newton solution between nodes."""
+    t, *_ = solve_flight_time(distance, 0.0, closing_speed, tangential_speed, SLIP)
+    assert grid.flight_time(distance, 0.0, closing_speed, tangential_speed) == pytest.approx(t, rel=0.01)
+
+
+def test_grid_exact_on_nodes(grid):
+    t, *_ = solve_flight_time(2.0, 0.0, 1.0, 1.5, SLIP)
+    assert grid.flight_time(2.0, 0.0, 1.0, 1.5) == pytest.approx(t)
+
+
+def test_grid_rotation_invariant(grid):
+    """Only the velocity relative to the hub direction matters, and tangential speed either side."""
+    angle = 2.1
+    c, s = math.cos(angle), math.sin(angle)
+    expected = grid.flight_time(3.3, 0.0, 1.2, 0.8)
+    assert grid.flight_time(3.3 * c, 3.3 * s, 1.2 * c - 0.8 * s, 1.2 * s + 0.8 * c) == pytest.approx(expected)
+    assert grid.flight_time(3.3, 0.0, 1.2, -0.8) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "dx, vx, vy", [(0.2, 0.0, 0.0), (12.0, 0.0, 0.0), (3.0, 6.0, 0.0), (3.0, -6.0, 0.0), (3.0, 0.0, 6.0)]
+)
+def test_grid_out_of_range(grid, dx, vx, vy):
+    assert grid.flight_time(dx, 0.0, vx, vy) is None
+    assert grid.solve(dx, 0.0, vx, vy, SLIP) is None
+
+
+@pytest.mark.parametrize("dx, dy, vx, vy", [(3.0, 0.0, 0.0, 0.0), (2.5, 1.5, 1.8, -0.4), (1.2, -3.1, -2.0, -2.0)])
+def test_grid_solve_is_one_evaluation(grid, dx, dy, vx, vy):
+    """A grid hit costs one (resampled) ballistics lookup and is as shootable as the Newton solution."""
+    t, distance, rpm, hood, evaluations, residual = grid.solve(dx, dy, vx, vy, SLIP)
+    assert evaluations == 1
+    assert abs(residual) < hub_shot._GRID_TOLERANCE_S
+    assert residual == pytest.approx(_flight_time_residual(dx, dy, vx, vy, t), abs=1e-6)
+    newton_t, newton_distance, *_ = solve_flight_time(dx, dy, vx, vy, SLIP)
+    assert t == pytest.approx(newton_t, abs=hub_shot._GRID_TOLERANCE_S)
+    assert distance == pytest.approx(newton_distance, abs=0.01)
+    assert (rpm, hood) == pytest.approx(compute_ballistics(distance), rel=1e-4)
+
+
+def test_grid_solve_limits_far_shot(grid):
+    _, distance, rpm, hood, _, _ = grid.solve(8.0, 0.0, 0.0, 0.0, SLIP)
+    assert (distance, rpm, hood) == pytest.approx(limit_shot(8.0))
+
+
+def test_grid_solve_refines_past_tolerance(grid, monkeypatch):
+    """An interpolated flight time outside the tolerance is Newton-refined, not returned as is."""
+    monkeypatch.setattr(hub_shot, "_GRID_TOLERANCE_S", 0.0)
+    t, _, _, _, evaluations, residual = grid.solve(2.5, 1.5, 1.8, -0.4, SLIP)
+    assert evaluations > 1
+    assert abs(residual) < _SOLVER_TOLERANCE_S
+    assert t == pytest.approx(solve_flight_time(2.5, 1.5, 1.8, -0.4, SLIP)[0], abs=_SOLVER_TOLERANCE_S)
+
+
+def test_grid_stale_after_slip_change_until_refresh(grid):
+    slow = grid.flight_time(3.0, 0.0, 0.0, 0.0)
+    assert grid.solve(3.0, 0.0, 0.0, 0.0, SLIP * 2) is None
+    assert grid.refresh(SLIP * 2)
+    assert not grid.refresh(SLIP * 2)
+    assert grid.flight_time(3.0, 0.0, 0.0, 0.0) == pytest.approx(slow / 2, rel=0.01)
+
+
+def test_grid_stale_after_shot_map_change_until_refresh(grid, restore_shot_map):
+    before = grid.flight_time(3.0, 0.0, 0.0, 0.0)
+    hub_shot.SHOT_MAP.load([(d, h, r * 2) for d, h, r in hub_shot.SHOT_TABLE])
+    assert grid.solve(3.0, 0.0, 0.0, 0.0, SLIP) is None
+    grid.refresh(SLIP)
+    assert grid.flight_time(3.0, 0.0, 0.0, 0.0) == pytest.approx(before / 2, rel=0.01)
+
+
+def _flight_time_residual(dx, dy, vx, vy, t):
+    distance = math.hypot(dx - vx * t, dy - vy * t)
+    rpm, _ = compute_ballistics(distance)
+    return t - math.hypot(dx, dy) / _rpm_to_exit_velocity(rpm, SLIP)
+
+
+@pytest.mark.parametrize(
+    "dx, dy, vx, vy",
+    [(3.0, 0.0, 0.0, 0.0), (2.5, 1.5, 1.8, -0.4), (-4.0, 2.0, 0.3, 2.5), (1.2, -3.1, -2.0, -2.0)],
+)
+def test_newton_reaches_tolerance(dx, dy, vx, vy):
+    t, distance, rpm, hood, evaluations, residual = solve_flight_time(dx, dy, vx, vy, SLIP)
+    assert abs(residual) < _SOLVER_TOLERANCE_S
+    assert _flight_time_residual(dx, dy, vx, vy, t) == pytest.approx(residual)
+    assert distance == pytest.approx(math.hypot(dx - vx * t, dy - vy * t))
+    assert (rpm, hood) == pytest.approx(compute_ballistics(distance))
+    assert evaluations <= 5
+
+
+def test_newton_stationary_needs_no_correction():
+    _, distance, _, _, evaluations, residual = solve_flight_time(3.0, 0.0, 0.0, 0.0, SLIP)
+    assert distance == pytest.approx(3.0)
+    assert evaluations == 2  # seed + residual check
+    assert residual == pytest.approx(0.0)
+
+
+def test_newton_grid_seed_saves_evaluations(grid):
+    seed = grid.flight_time(3.0, 0.0, 2.0, 0.5)
+    *_, seeded, _ = solve_flight_time(3.0, 0.0, 2.0, 0.5, SLIP, seed)
+    *_, unseeded, _ = solve_flight_time(3.0, 0.0, 2.0, 0.5, SLIP)
+    assert seeded < unseeded
+
+
+def _fixed_point_flight_time(dx, dy, vx, vy, slip):
+    t = 0.0
+    for _ in range(hub_shot._ITERATIONS):
+        rpm, _ = compute_ballistics(math.hypot(dx - vx * t, dy - vy * t))
+        t = math.hypot(dx, dy) / _rpm_to_exit_velocity(rpm, slip)
+    return t
+
+
+def test_newton_falls_back_to_fixed_point_estimate():
+    """Far from the hub at the production slip the iteration wanders; keep the fixed-point lead."""
+    dx, dy, vx, vy = BLUE_HUB.X() - 14.7, BLUE_HUB.Y() - 3.6, -1.4, 0.1
+    t, distance, rpm, hood, evaluations, residual = solve_flight_time(dx, dy, vx, vy, hub_shot._SLIP_FACTOR)
+    assert abs(residual) >= _SOLVER_TOLERANCE_S
+    assert evaluations > hub_shot._SOLVER_MAX_EVALUATIONS
+    assert t == pytest.approx(_fixed_point_flight_time(dx, dy, vx, vy, hub_shot._SLIP_FACTOR))
+    assert t > 0.0
+    assert (distance, rpm, hood) == pytest.approx(limit_shot(math.hypot(dx - vx * t, dy - vy * t)))
+
+
+def test_virtual_goal_counts_solver_failures():
+    drivetrain = MagicMock()
+    vg = VirtualGoal(drivetrain)
+    drivetrain.get_motion.return_value = MotionEstimate(0.0, 14.7, 3.6, 0.0, -1.4, 0.1, 0.0, 0.0, 0.0)
+    vg._solve(SOLVER_NEWTON)
+    vg._solve(SOLVER_NEWTON)
+    assert not vg.last_converged
+    assert vg.solver_failures == 2
+    drivetrain.get_motion.return_value = MotionEstimate(0.0, BLUE_HUB.X() - 3.0, BLUE_HUB.Y(), 0.0, 1.0, 0.5, 0, 0, 0)
+    vg._solve(SOLVER_NEWTON)
+    assert vg.last_converged
+    assert vg.solver_failures == 2
+
+
+def test_newton_limits_at_production_slip():
+    """Random field positions and velocities up to 5 m/s: every solution is shootable."""
+    rng = np.random.default_rng(3996)
+    for _ in range(2000):
+        x, y = rng.uniform((0.0, 0.0), (hub_shot.FIELD_LENGTH_M, hub_shot.FIELD_WIDTH_M))
+        speed, heading = rng.uniform(0.0, 5.0), rng.uniform(-math.pi, math.pi)
+        dx, dy = BLUE_HUB.X() - x, BLUE_HUB.Y() - y
+        t, distance, rpm, _, _, residual = solve_flight_time(
+            dx, dy, speed * math.cos(heading), speed * math.sin(heading), hub_shot._SLIP_FACTOR
+        )
+        assert rpm <= SHOOTER_MAX_RPM
+        assert distance <= max_shot_distance()
+        assert abs(residual) < _SOLVER_TOLERANCE_S or t == pytest.approx(
+            _fixed_point_flight_time(
+                dx, dy, speed * math.cos(heading), speed * math.sin(heading), hub_shot._SLIP_FACTOR
+            )
+        )
+
+
+def test_limit_shot_clamps_to_shooter(restore_shot_map):
+    assert limit_shot(20.0)[0] == max_shot_distance()
+    hub_shot.SHOT_MAP.load([(d, h, r * 2) for d, h, r in hub_shot.SHOT_TABLE])
+    assert limit_shot(5.0)[1] == SHOOTER_MAX_RPM
+
+
+@pytest.fixture
+def virtual_goal():
+    vg = VirtualGoal(MagicMock())
+    vg._solve = MagicMock(side_effect=lambda solver: (Rotation2d(vg._solve.call_count), 0.0))
+    return vg
+
+
+@pytest.fixture
+def enabled():
+    DriverStationSim.setEnabled(True)
+    DriverStationSim.notifyNewData()
+    yield
+    DriverStationSim.setEnabled(False)
+    DriverStationSim.notifyNewData()
+
+
+def test_tuning_csv_is_opt_in(virtual_goal):
+    assert not virtual_goal._use_csv_sub.get()
+    assert hub_shot.SHOT_MAP.source == "table"
+
+
+def test_shot_zones_rebuild_waits_for_disable(virtual_goal, restore_shot_map, enabled):
+    hub_shot.SHOT_MAP.load([(d + 1.0, h, r) for d, h, r in hub_shot.SHOT_TABLE])
+    virtual_goal._refresh_shot_map()
+    assert virtual_goal._zones_version != hub_shot.SHOT_MAP.version  # enabled: keep the old zones
+
+    DriverStationSim.setEnabled(False)
+    DriverStationSim.notifyNewData()
+    virtual_goal._refresh_shot_map()
+    assert virtual_goal._zones_version == hub_shot.SHOT_MAP.version
+    assert virtual_goal._zones.signature == hub_shot.shot_zone_signature()
+
+
+def test_calculate_solves_once_per_tick(virtual_goal):
+    first = virtual_goal.calculate()
+    assert virtual_goal.calculate() is first
+    assert virtual_goal._solve.call_count == 1
+
+
+def _next_tick(virtual_goal):
+    virtual_goal._drivetrain.get_snapshot.return_value = object()
+
+
+def test_calculate_resolves_on_new_snapshot(virtual_goal):
+    first = virtual_goal.calculate()
+    _next_tick(virtual_goal)
+    second = virtual_goal.calculate()
+    assert virtual_goal._solve.call_count == 2
+    assert second is not first
+
+
+def test_calculate_operator_cached_per_tick(virtual_goal):
+    first = virtual_goal.calculate_operator()
+    assert virtual_goal.calculate_operator() is first
+    _next_tick(virtual_goal)
+    assert virtual_goal.calculate_operator() is not first
+    assert virtual_goal._solve.call_count == 2
+
+
+def test_stationary_shot_skips_solve(virtual_goal):
+    virtual_goal._drivetrain.get_snapshot.return_value = MagicMock(x=BLUE_HUB.X() - 3.0, y=BLUE_HUB.Y())
+    assert virtual_goal.stationary_shot() == (pytest.approx(compute_ballistics(3.0)[0]), True)
+    virtual_goal._drivetrain.get_snapshot.return_value = MagicMock(x=BLUE_HUB.X() - 9.0, y=BLUE_HUB.Y())
+    assert virtual_goal.stationary_shot() == (pytest.approx(limit_shot(9.0)[1]), False)
+    virtual_goal._solve.assert_not_called()
+
+
+# (x, y, field_vx, field_vy) — stationary, strafing, driving away, and inside the 0.5 m cutoff
+BATCH_STATES = [
+    (BLUE_HUB.X() - 3.0, BLUE_HUB.Y(), 0.0, 0.0),
+    (BLUE_HUB.X() - 2.2, BLUE_HUB.Y() + 1.4, 0.6, -1.9),
+    (BLUE_HUB.X() - 4.1, BLUE_HUB.Y() - 2.5, -2.0, 1.1),
+    (BLUE_HUB.X() + 1.0, BLUE_HUB.Y() + 0.5, 0.0, 0.0),
+    (BLUE_HUB.X() - 0.2, BLUE_HUB.Y() + 0.1, 1.0, 0.0),
+    (12.0, 4.0, 0.0, 0.0),  # past the shot map, clamped
+    (14.7, 3.6, -1.4, 0.1),  # not converged, fixed-point fallback
+]
+
+
+def test_batch_matches_scalar_solve():
+    """Each batch element equals VirtualGoal._solve() with the Newton solver for the same state."""
+    drivetrain = MagicMock()
+    vg = VirtualGoal(drivetrain)
+    vg._flight_time_pub = MagicMock()
+    slip = vg._slip_factor_sub.get()
+    xs, ys, vxs, vys = (np.array(column) for column in zip(*BATCH_STATES, strict=True))
+    batch = solve_virtual_goal_batch(xs, ys, vxs, vys, BLUE_HUB, slip)
+
+    for i, (x, y, vx, vy) in enumerate(BATCH_STATES):
+        drivetrain.get_motion.return_value = MotionEstimate(0.0, x, y, 0.0, vx, vy, 0.0, 0.0, 0.0)
+        aim, ff = vg._solve(SOLVER_NEWTON)
+        assert batch.aim[i] == pytest.approx(aim.radians(), abs=1e-9)
+        assert batch.angular_ff[i] == pytest.approx(ff, abs=1e-9)
+        assert vg.last_heading_error == pytest.approx(aim.radians())  # heading 0
+        assert batch.rpm[i] == pytest.approx(vg.last_rpm, rel=1e-9)
+        assert batch.hood_turns[i] == pytest.approx(vg.last_hood_turns, abs=1e-9)
+        assert batch.virtual_distance[i] == pytest.approx(vg.last_virtual_distance, rel=1e-9)
+        assert batch.flight_time[i] == pytest.approx(vg._flight_time_pub.set.call_args.args[0], rel=1e-9)
+
+
+def test_batch_broadcasts_over_field_grid():
+    xs, ys = np.meshgrid(np.linspace(1.0, 4.0, 7), np.linspace(1.0, 7.0, 5))
+    batch = solve_virtual_goal_batch(xs, ys, 1.5, 0.0)
+    assert batch.rpm.shape == xs.shape
+    assert np.all(batch.flight_time > 0.0)
+
+
+def test_shot_feasible_follows_calibrated_range():
+    first, last = hub_shot.SHOT_MAP.points[0][0], hub_shot.SHOT_MAP.points[-1][0]
+    feasible = shot_feasible_many([0.3, first, (first + last) / 2, last, last + 2.0])
+    assert feasible.tolist() == [False, True, True, True, False]
+
+
+def test_shot_feasible_respects_shooter_limit(restore_shot_map):
+    hub_shot.SHOT_MAP.load([(d, h, r * 2) for d, h, r in hub_shot.SHOT_TABLE])
+    distances = [d for d, _, _ in hub_shot.SHOT_TABLE]
+    assert not shot_feasible_many(distances)[-1]  # 5680 RPM > SHOOTER_MAX_RPM
+
+
+def test_shot_zones_mirror_between_alliances():
+    zones = build_shot_zones(0.25)
+    hub_distance = 3.0
+    assert zones.contains(BLUE_HUB.X() - hub_distance, BLUE_HUB.Y())
+    assert zones.contains(RED_HUB.X() + hub_distance, RED_HUB.Y(), red=True)
+    assert not zones.contains(RED_HUB.X() + hub_distance, RED_HUB.Y())
+    assert not zones.contains(BLUE_HUB.X(), BLUE_HUB.Y())
+    assert zones.fraction(red=True) == pytest.approx(zones.fraction(), rel=0.02)
+
+
+def test_load_shot_zones_rebuilds_stale_file(tmp_path, restore_shot_map):
+    path = tmp_path / "zones.bin"
+    build_shot_zones(0.5).write(path)
+    assert load_shot_zones(path).resolution == 0.5
+
+    hub_shot.SHOT_MAP.load([(d + 1.0, h, r) for d, h, r in hub_shot.SHOT_TABLE])
+    rebuilt = load_shot_zones(path)
+    assert rebuilt.signature == hub_shot.shot_zone_signature()
+    assert load_shot_zones(tmp_path / "missing.bin").signature == rebuilt.signature
+
+
+def test_readiness_confirms_after_consecutive_loops():
+    readiness = ShotReadiness(confirm_loops=3, timeout_s=2.0)
+    assert not readiness.update(True, 0.10)
+    assert not readiness.update(False, 0.12)  # dropout restarts the count
+    assert not readiness.update(True, 0.14)
+    assert not readiness.update(True, 0.16)
+    assert readiness.update(True, 0.18)
+    assert readiness.state == ShotReadiness.READY
+    assert readiness.time_to_ready == pytest.approx(0.18)
+
+
+def test_readiness_latches_while_feeding():
+    readiness = ShotReadiness(confirm_loops=1)
+    readiness.update(True, 0.5)
+    assert readiness.update(False, 0.52)  # ball leaving pulls RPM down — keep feeding
+    readiness.reset()
+    assert readiness.state == ShotReadiness.SPINNING_UP
+    assert not readiness.update(False, 0.0)
+
+
+def test_readiness_times_out():
+    readiness = ShotReadiness(confirm_loops=3, timeout_s=2.0)
+    assert not readiness.update(False, 1.98)
+    assert readiness.update(False, 2.0)
+    assert readiness.state == ShotReadiness.TIMED_OUT
+    assert readiness.time_to_ready == pytest.approx(2.0)
+
+
+@pytest.fixture
+def shot():
+    vg = MagicMock()
+    vg.last_rpm = 2500.0
+    vg.last_hood_turns = 1.0
+    vg.last_heading_error = 0.0
+    shooter, kicker, indexer, hood = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    shooter.get_current_speed.return_value = 2500.0
+    shooter.get_output_current.return_value = 10.0
+    kicker.get_current_speed.return_value = 4500.0
+    hood.get_current_position.return_value = 1.0
+    c = HubShot(shooter, kicker, indexer, hood, vg)
+    c._feed_timer = MagicMock()
+    c._feed_timer.get.return_value = 0.3
+    c.initialize()
+    return c
+
+
+def _run_loops(shot, n):
+    for _ in range(n):
+        shot.execute()
+    return shot.indexer.set_target_output.called
+
+
+def test_hub_shot_feeds_once_in_tolerance(shot):
+    assert not _run_loops(shot, READY_CONFIRM_LOOPS - 1)
+    assert _run_loops(shot, 1)
+    assert shot._readiness.state == ShotReadiness.READY
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [
+        ("shooter_rpm", 2500.0 - 2 * READY_RPM_TOLERANCE),
+        ("kicker_rpm", 1000.0),
+        ("hood_turns", 1.5),
+        ("heading_error", 2 * READY_HEADING_TOLERANCE_RAD),
+    ],
+)
+def test_hub_shot_waits_for_each_check(shot, attribute, value):
+    if attribute == "shooter_rpm":
+        shot.shooter.get_current_speed.return_value = value
+    elif attribute == "kicker_rpm":
+        shot.kicker.get_current_speed.return_value = value
+    elif attribute == "hood_turns":
+        shot.hood.get_current_position.return_value = value
+    else:
+        shot._virtual_goal.last_heading_error = value
+    assert not _run_loops(shot, READY_CONFIRM_LOOPS * 2)
+
+    shot._feed_timer.get.return_value = HubShot.FEED_TIMEOUT_S
+    assert _run_loops(shot, 1)
+    assert shot._readiness.state == ShotReadiness.TIMED_OUT
+
+
+def test_hub_shot_boosts_shooter_after_exit(shot):
+    _run_loops(shot, READY_CONFIRM_LOOPS + 2)
+    assert shot.shooter.set_target_speed.call_args.args == (2500.0, 0.0)
+
+    shot.shooter.get_current_speed.return_value = 2100.0  # ball leaving
+    shot.shooter.get_output_current.return_value = 30.0
+    shot.execute()
+    target, boost_volts = shot.shooter.set_target_speed.call_args.args
+    assert target == 2500.0
+    assert boost_volts > 0.0
+
+
+def test_hub_shot_boost_leads_the_ball_from_the_feed_command(shot):
+    shot._boost.expected_dip = 300.0  # learned on earlier shots
+    _run_loops(shot, READY_CONFIRM_LOOPS)  # first feed command at t=0.3
+    assert shot.indexer.set_target_output.called
+    engage = 0.3 + shot._cadence.lead_s - BOOST_LEAD_S
+    shot._feed_timer.get.return_value = engage - 0.02
+    shot.execute()
+    assert shot.shooter.set_target_speed.call_args.args[1] == 0.0
+    shot._feed_timer.get.return_value = engage
+    shot.execute()  # no dip yet — boost engaged on the feed timing alone
+    assert shot.shooter.set_target_speed.call_args.args[1] > 0.0
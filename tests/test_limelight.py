@@ -0,0 +1,83 @@
+import pytest
+from ntcore import NetworkTableInstance
+
+from modules.limelight import LimelightHelpers, RawDetection, RawFiducial
+
+CAMERA = "limelight-test"
+
+FIDUCIALS = [3, 1.5, -2.0, 0.04, 2.1, 2.3, 0.1, 7, -4.0, 1.0, 0.02, 3.5, 3.6, 0.3]
+
+
+@pytest.fixture
+def publish():
+    """Publish a double array on the test camera's table; publishers stay alive for the test."""
+    table = NetworkTableInstance.getDefault().getTable(CAMERA)
+    publishers = []
+
+    def _publish(name: str, value: list[float]) -> None:
+        pub = table.getDoubleArrayTopic(name).publish()
+        pub.set(value)
+        publishers.append(pub)
+
+    yield _publish
+    for pub in publishers:
+        pub.close()
+
+
+def test_entries_are_cached():
+    first = LimelightHelpers.get_limelight_double_entry(CAMERA, "tx")
+    assert LimelightHelpers.get_limelight_double_entry(CAMERA, "tx") is first
+    assert LimelightHelpers.get_limelight_NTTable(CAMERA) is LimelightHelpers.get_limelight_NTTable(CAMERA)
+
+
+def test_empty_name_uses_default_table():
+    assert LimelightHelpers.get_limelight_NTTable("").getPath() == "/limelight"
+
+
+def test_raw_fiducials_parse(publish):
+    publish("rawfiducials", FIDUCIALS)
+    assert LimelightHelpers.get_raw_fiducials(CAMERA) == [
+        RawFiducial(3, 1.5, -2.0, 0.04, 2.1, 2.3, 0.1),
+        RawFiducial(7, -4.0, 1.0, 0.02, 3.5, 3.6, 0.3),
+    ]
+
+
+def test_raw_fiducial_columns(publish):
+    publish("rawfiducials", FIDUCIALS)
+    ids, txnc, _, _, dist_to_camera, _, ambiguity = LimelightHelpers.get_raw_fiducial_columns(CAMERA)
+    assert ids == [3, 7]
+    assert txnc == [1.5, -4.0]
+    assert dist_to_camera == [2.1, 3.5]
+    assert ambiguity == [0.1, 0.3]
+
+
+def test_partial_fiducial_array_is_rejected(publish):
+    publish("rawfiducials", FIDUCIALS[:-1])
+    assert LimelightHelpers.get_raw_fiducials(CAMERA) == []
+    assert LimelightHelpers.get_raw_fiducial_columns(CAMERA) == ([],) * 7
+
+
+def test_raw_detections_parse(publish):
+    publish("rawdetections", [float(v) for v in range(24)])
+    detections = LimelightHelpers.get_raw_detections(CAMERA)
+    assert detections[0] == RawDetection(0, *[float(v) for v in range(1, 12)])
+    assert detections[1].class_id == 12
+    assert detections[1].corner3_y == 23.0
+
+
+def test_botpose_estimate_parses_header_and_fiducials(publish):
+    publish("botpose_orb_wpiblue", [1.0, 2.0, 0.0, 0.0, 0.0, 90.0, 30.0, 2, 0.8, 2.8, 0.03, *FIDUCIALS])
+    estimate = LimelightHelpers.get_botpose_estimate_wpiblue_megatag2(CAMERA)
+    assert (estimate.pose.X(), estimate.pose.Y()) == (1.0, 2.0)
+    assert estimate.pose.rotation().degrees() == pytest.approx(90.0)
+    assert (estimate.tag_count, estimate.tag_span, estimate.avg_tag_dist) == (2, 0.8, 2.8)
+    assert estimate.latency == 30.0
+    assert estimate.is_megatag_2
+    assert [f.id for f in estimate.raw_fiducials] == [3, 7]
+
+
+def test_setters_round_trip():
+    LimelightHelpers.set_pipeline_index(CAMERA, 2)
+    assert LimelightHelpers.get_limelight_NTDouble(CAMERA, "pipeline") == 2.0
+    LimelightHelpers.set_robot_orientation_no_flush(CAMERA, 45.0, 0, 0, 0, 0, 0)
+    assert LimelightHelpers.get_limelight_NTDoubleArray(CAMERA, "robot_orientation_set")[0] == 45.0
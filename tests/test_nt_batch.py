@@ -0,0 +1,109 @@
+import dataclasses
+
+import pytest
+from ntcore import NetworkTableInstance
+from wpiutil import wpistruct
+
+from modules.nt_batch import ON_CHANGE, SLOW, SLOW_PERIOD_LOOPS, BatchedPublisher
+
+TABLE = "BatchTest"
+
+
+@wpistruct.make_wpistruct(name="BatchTestState")
+@dataclasses.dataclass
+class _State:
+    position: float
+    amps: float
+
+
+@pytest.fixture
+def publisher():
+    inst = NetworkTableInstance.create()
+    yield BatchedPublisher(inst)
+    NetworkTableInstance.destroy(inst)
+
+
+def test_unchanged_values_not_republished(publisher):
+    values = {"x": 1.0}
+    publisher.add_double(TABLE, "X", lambda: values["x"])
+    publisher.flush()
+    assert publisher.published == 1
+    publisher.flush()
+    assert publisher.published == 0
+    values["x"] = 2.0
+    publisher.flush()
+    assert publisher.published == 1
+
+
+def test_deadband_suppresses_small_moves(publisher):
+    values = {"rpm": 3000.0}
+    publisher.add_double(TABLE, "RPM", lambda: values["rpm"], deadband=5.0)
+    publisher.flush()
+    values["rpm"] = 3004.0
+    publisher.flush()
+    assert publisher.published == 0
+    values["rpm"] = 3010.0
+    publisher.flush()
+    assert publisher.published == 1
+
+
+def test_slow_tier_polled_once_per_period(publisher):
+    calls = []
+    publisher.add_double(TABLE, "Temp", lambda: calls.append(1) or float(len(calls)), tier=SLOW)
+    for _ in range(3 * SLOW_PERIOD_LOOPS):
+        publisher.flush()
+    assert len(calls) == 3
+
+
+def test_slow_topics_spread_across_loops(publisher):
+    for i in range(SLOW_PERIOD_LOOPS):
+        publisher.add_integer(TABLE, f"Slow {i}", lambda i=i: i, tier=SLOW)
+    counts = []
+    for _ in range(SLOW_PERIOD_LOOPS):
+        publisher.flush()
+        counts.append(publisher.published)
+    assert counts == [1] * SLOW_PERIOD_LOOPS
+
+
+def test_on_change_ignores_deadband(publisher):
+    values = {"target": 0.0}
+    publisher.add_double(TABLE, "Target", lambda: values["target"], tier=ON_CHANGE, deadband=100.0)
+    publisher.flush()
+    values["target"] = 1.0
+    publisher.flush()
+    assert publisher.published == 1
+
+
+def test_struct_group_published_as_one_topic(publisher):
+    state = _State(1.0, 2.0)
+    publisher.add_struct(TABLE, "State", _State, lambda: state)
+    sub = publisher._inst.getTable(TABLE).getStructTopic("State", _State).subscribe(_State(0.0, 0.0))
+    publisher.flush()
+    assert publisher.published == 1
+    assert sub.get() == _State(1.0, 2.0)
+    publisher.flush()
+    assert publisher.published == 0
+
+
+def test_struct_field_deadbands(publisher):
+    values = {"state": _State(1.0, 2.0)}
+    publisher.add_struct(TABLE, "Noisy", _State, lambda: values["state"], deadbands={"position": 0.5})
+    publisher.flush()
+    values["state"] = _State(1.4, 2.0)  # inside position's deadband
+    publisher.flush()
+    assert publisher.published == 0
+    values["state"] = _State(1.4, 2.1)  # amps has none
+    publisher.flush()
+    assert publisher.published == 1
+
+
+def test_struct_deadband_for_unknown_field_rejected(publisher):
+    with pytest.raises(ValueError):
+        publisher.add_struct(TABLE, "Bad", _State, lambda: _State(0.0, 0.0), deadbands={"velocity": 1.0})
+
+
+def test_shared_instance_reset():
+    first = BatchedPublisher.instance()
+    assert BatchedPublisher.instance() is first
+    BatchedPublisher.reset_instance()
+    assert BatchedPublisher.instance() is not first
@@ -0,0 +1,85 @@
+import math
+
+import pytest
+from wpimath.geometry import Pose2d, Rotation2d
+from wpimath.kinematics import ChassisSpeeds, SwerveModuleState
+
+from modules.pose_history import PoseHistory
+
+DT = 0.02
+
+
+def _fill(history: PoseHistory, samples: int, start: float = 0.0) -> None:
+    """Robot driving +x at 1 m/s, turning at 1 rad/s; sample i is at x = t."""
+    for i in range(samples):
+        t = start + i * DT
+        states = [SwerveModuleState(t, Rotation2d(0.1 * m)) for m in range(4)]
+        history.add(t, Pose2d(t, 0.0, Rotation2d(t)), ChassisSpeeds(1.0, 0.0, t), states)
+
+
+def test_empty_history():
+    history = PoseHistory(8)
+    assert history.sample_at(1.0) is None
+    assert history.latest() is None
+    assert history.between(0.0, 1.0) == []
+    assert len(history) == 0
+
+
+def test_sample_at_interpolates_between_samples():
+    history = PoseHistory(16)
+    _fill(history, 10)
+    sample = history.sample_at(0.05)  # between 0.04 and 0.06
+    assert sample.timestamp == 0.05
+    assert sample.pose.X() == pytest.approx(0.05)
+    assert sample.pose.rotation().radians() == pytest.approx(0.05)
+    assert sample.speeds.omega == pytest.approx(0.05)
+    assert sample.module_states[0].speed == pytest.approx(0.05)
+    assert sample.module_states[3].angle.radians() == pytest.approx(0.3)
+
+
+def test_sample_at_clamps_outside_range():
+    history = PoseHistory(16)
+    _fill(history, 5, start=1.0)
+    assert history.sample_at(0.0).timestamp == 1.0
+    assert history.sample_at(9.0).timestamp == pytest.approx(1.08)
+
+
+def test_heading_interpolates_across_wrap():
+    history = PoseHistory(4)
+    history.add(0.0, Pose2d(0.0, 0.0, Rotation2d(math.pi - 0.1)), ChassisSpeeds(), [])
+    history.add(1.0, Pose2d(0.0, 0.0, Rotation2d(-math.pi + 0.1)), ChassisSpeeds(), [])
+    heading = history.sample_at(0.5).pose.rotation()
+    assert abs(heading.radians()) == pytest.approx(math.pi)
+
+
+def test_ring_buffer_keeps_newest_samples():
+    history = PoseHistory(8)
+    _fill(history, 20)
+    assert len(history) == 7  # oldest slot is left out of reads
+    assert history.latest().timestamp == pytest.approx(19 * DT)
+    assert history.sample_at(0.0).timestamp == pytest.approx(13 * DT)
+
+
+def test_between_is_inclusive_and_ordered():
+    history = PoseHistory(32)
+    _fill(history, 20)
+    samples = history.between(0.1, 0.2)
+    assert [s.timestamp for s in samples] == pytest.approx([i * DT for i in range(5, 11)])
+
+
+def test_out_of_order_and_duplicate_samples_dropped():
+    history = PoseHistory(8)
+    _fill(history, 3)
+    history.add(0.01, Pose2d(9.0, 9.0, Rotation2d()), ChassisSpeeds(), [])
+    history.add(2 * DT, Pose2d(9.0, 9.0, Rotation2d()), ChassisSpeeds(), [])
+    assert len(history) == 3
+    assert history.latest().pose.X() == pytest.approx(2 * DT)
+
+
+def test_clear():
+    history = PoseHistory(8)
+    _fill(history, 5)
+    history.clear()
+    assert history.latest() is None
+    _fill(history, 2, start=10.0)
+    assert [s.timestamp for s in history.between(0.0, 20.0)] == pytest.approx([10.0, 10.02])
@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from commands import pre_spin
+from commands.pre_spin import BUDGET_CUTOFF_VOLTS, BUDGET_FULL_VOLTS, IDLE_FRACTION, PreSpin
+
+
+@pytest.fixture
+def battery(monkeypatch):
+    controller = MagicMock()
+    controller.getBatteryVoltage.return_value = 12.5
+    monkeypatch.setattr(pre_spin, "RobotController", controller)
+    return controller
+
+
+@pytest.fixture
+def vg():
+    v = MagicMock()
+    v.stationary_shot.return_value = (2500.0, True)
+    return v
+
+
+@pytest.fixture
+def cmd(vg, battery):
+    c = PreSpin(MagicMock(), vg)
+    c.initialize()
+    return c
+
+
+def test_idles_at_fraction_of_predicted_rpm_in_zone(cmd, vg):
+    cmd.execute()
+    vg.calculate.assert_not_called()  # no moving-shot solve while idling
+    cmd.shooter.set_target_speed.assert_called_once_with(pytest.approx(2500.0 * IDLE_FRACTION))
+
+
+def test_coasts_outside_zone(cmd, vg):
+    vg.stationary_shot.return_value = (2500.0, False)
+    cmd._zone_debouncer = MagicMock(calculate=MagicMock(side_effect=lambda wanted: wanted))
+    cmd.execute()
+    cmd.shooter.set_target_speed.assert_not_called()
+    cmd.shooter.stop.assert_called_once()
+
+
+def test_game_piece_sensor_enables_idle(vg, battery):
+    vg.stationary_shot.return_value = (2500.0, False)
+    c = PreSpin(MagicMock(), vg, has_game_piece=lambda: True)
+    c.initialize()
+    c.execute()
+    c.shooter.set_target_speed.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "volts, budget",
+    [(12.5, 1.0), (BUDGET_FULL_VOLTS, 1.0), ((BUDGET_FULL_VOLTS + BUDGET_CUTOFF_VOLTS) / 2, 0.5), (9.0, 0.0)],
+)
+def test_battery_budget_scales_idle(vg, battery, volts, budget):
+    battery.getBatteryVoltage.return_value = volts
+    c = PreSpin(MagicMock(), vg)
+    c.initialize()
+    c.execute()
+    if budget == 0.0:
+        c.shooter.set_target_speed.assert_not_called()
+        c.shooter.stop.assert_called_once()
+    else:
+        c.shooter.set_target_speed.assert_called_once_with(pytest.approx(2500.0 * IDLE_FRACTION * budget))
+
+
+def test_budget_filters_voltage_dips(cmd, battery):
+    for _ in range(20):
+        cmd.execute()
+    battery.getBatteryVoltage.return_value = 8.0  # single-loop sag under drive current
+    cmd.execute()
+    assert cmd.shooter.set_target_speed.call_args.args[0] > 0.0
@@ -0,0 +1,95 @@
+import pytest
+from commands2 import CommandScheduler, RunCommand, Subsystem
+
+from modules.profiler import WINDOW, Profiler, _Samples
+
+
+@pytest.fixture
+def scheduler():
+    CommandScheduler.resetInstance()
+    yield CommandScheduler.getInstance()
+    CommandScheduler.resetInstance()
+
+
+class _Counter(Subsystem):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def periodic(self):
+        self.calls += 1
+
+
+def test_inactive_profiler_wraps_nothing():
+    profiler = Profiler(active=False)
+
+    def fn():
+        return 1
+
+    assert profiler.wrap("fn", fn) is fn
+    profiler.periodic()
+
+
+def test_wrapped_calls_are_timed():
+    profiler = Profiler(active=True)
+    timed = profiler.wrap("Sum", lambda a, b: a + b)
+    assert timed(2, 3) == 5
+    assert profiler._samples["Sum"].count == 1
+
+
+def test_disabled_tunable_skips_timing():
+    profiler = Profiler(active=True)
+    timed = profiler.wrap("Disabled", lambda: None)
+    profiler.enabled = False
+    timed()
+    assert profiler._samples["Disabled"].count == 0
+
+
+def test_samples_roll_over_window():
+    samples = _Samples()
+    for i in range(WINDOW + 10):
+        samples.add(i * 1e-3)
+    p50, p99, max_ms = samples.stats_ms()
+    assert samples.count == WINDOW
+    assert max_ms == pytest.approx(WINDOW + 9)
+    assert p50 < p99 < max_ms + 1e-9
+    assert min(samples.durations) == pytest.approx(10e-3)
+
+
+def test_subsystem_periodic_instrumented(scheduler):
+    subsystem = _Counter()
+    profiler = Profiler(active=True)
+    profiler.instrument_subsystems([subsystem])
+    scheduler.run()
+    assert subsystem.calls == 1
+    assert profiler._samples["_Counter.periodic"].count == 1
+
+
+def test_command_execute_instrumented(scheduler):
+    profiler = Profiler(active=True)
+    profiler.instrument_commands(scheduler)
+    command = RunCommand(lambda: None).ignoringDisable(True).withName("Loop")
+    scheduler.schedule(command)
+    scheduler.run()
+    scheduler.run()
+    assert profiler._samples["Loop.execute"].count == 2
+
+    scheduler.cancel(command)
+    scheduler.schedule(command)  # wrapped once, not again on re-initialize
+    scheduler.run()
+    assert profiler._samples["Loop.execute"].count == 3
+
+
+def test_commands_sharing_a_name_are_timed_apart(scheduler):
+    profiler = Profiler(active=True)
+    profiler.instrument_commands(scheduler)
+    first = RunCommand(lambda: None).ignoringDisable(True)
+    second = RunCommand(lambda: None).ignoringDisable(True)
+    assert first.getName() == second.getName()
+    scheduler.schedule(first)
+    scheduler.run()
+    scheduler.schedule(second)
+    scheduler.run()
+    name = first.getName()
+    assert profiler._samples[f"{name}.execute"].count == 2
+    assert profiler._samples[f"{name}#2.execute"].count == 1
@@ -0,0 +1,104 @@
+import os
+
+import numpy as np
+import pytest
+
+from modules.shot_map import LINEAR, MONOTONE, ShotMap
+
+TABLE = [
+    (1.5, 0.1, 2000),
+    (2.5, 0.1, 2150),
+    (3.5, 0.4, 2450),
+    (4.5, 1.0, 2900),
+    (5.5, 1.8, 3500),
+]
+
+
+@pytest.mark.parametrize("mode", [LINEAR, MONOTONE])
+def test_passes_through_points(mode):
+    shot_map = ShotMap(TABLE, mode)
+    for d, hood, rpm in TABLE[1:-1]:
+        assert shot_map.evaluate(d) == pytest.approx((rpm, hood))
+
+
+def test_linear_midpoint():
+    shot_map = ShotMap(TABLE, LINEAR)
+    assert shot_map.evaluate(3.0) == pytest.approx((2300, 0.25))
+
+
+def test_monotone_keeps_curvature_without_overshoot():
+    shot_map = ShotMap(TABLE, MONOTONE)
+    previous_rpm, previous_hood = shot_map.evaluate(1.5)
+    for i in range(1, 41):
+        rpm, hood = shot_map.evaluate(1.5 + i * 0.1)
+        assert rpm >= previous_rpm
+        assert hood >= previous_hood - 1e-12
+        previous_rpm, previous_hood = rpm, hood
+    # Flat hood segment stays flat (no dip below the calibrated value)
+    assert shot_map.evaluate(2.0)[1] == pytest.approx(0.1)
+    # Convex RPM curve sits below the chord
+    assert shot_map.evaluate(5.0)[0] < (2900 + 3500) / 2
+
+
+@pytest.mark.parametrize("mode", [LINEAR, MONOTONE])
+def test_extrapolates_linearly(mode):
+    shot_map = ShotMap(TABLE, mode)
+    slope = shot_map.rpm_slope(6.0)
+    assert shot_map.evaluate(6.5)[0] == pytest.approx(3500 + slope)
+    assert slope > 0
+
+
+def test_rpm_slope_matches_finite_difference():
+    shot_map = ShotMap(TABLE, MONOTONE)
+    for d in (1.8, 2.9, 4.1, 5.2):
+        numeric = (shot_map.evaluate(d + 1e-6)[0] - shot_map.evaluate(d - 1e-6)[0]) / 2e-6
+        assert shot_map.rpm_slope(d) == pytest.approx(numeric, rel=1e-4)
+
+
+@pytest.mark.parametrize("mode", [LINEAR, MONOTONE])
+def test_evaluate_many_matches_scalar(mode):
+    shot_map = ShotMap(TABLE, mode)
+    distances = np.array([0.3, 1.5, 1.9, 2.5, 3.14, 4.49, 5.5, 7.0])
+    rpm, hood = shot_map.evaluate_many(distances)
+    slope = shot_map.rpm_slope_many(distances)
+    for i, d in enumerate(distances):
+        assert (rpm[i], hood[i]) == pytest.approx(shot_map.evaluate(d), rel=1e-12)
+        assert slope[i] == pytest.approx(shot_map.rpm_slope(d), rel=1e-12)
+
+
+def test_merges_duplicate_distances():
+    shot_map = ShotMap([(2.0, 0.1, 2000), (2.01, 0.3, 2100), (3.0, 0.5, 2500)])
+    assert shot_map.points == [pytest.approx((2.005, 0.2, 2050)), (3.0, 0.5, 2500)]
+
+
+def test_reload_from_csv(tmp_path):
+    path = tmp_path / "shot_tuning.csv"
+    shot_map = ShotMap(TABLE, LINEAR, path)
+    assert not shot_map.reload()
+    assert shot_map.source == "table"
+
+    path.write_text("distance_m,hood_turns,shooter_rpm\n2.00,0.5,2000\n4.00,1.5,3000\n")
+    version = shot_map.version
+    assert shot_map.reload()
+    assert shot_map.source == "csv"
+    assert shot_map.version > version
+    assert shot_map.evaluate(3.0) == pytest.approx((2500, 1.0))
+    assert not shot_map.reload()  # unchanged file
+
+    with open(path, "a") as f:
+        f.write("6.00,2.5,4000\n6.0")  # last row half-written
+    os.utime(path, (0, path.stat().st_mtime + 1))
+    assert shot_map.reload()
+    assert len(shot_map.points) == 3
+
+    path.unlink()
+    assert shot_map.reload()
+    assert shot_map.source == "table"
+
+
+def test_csv_with_single_point_keeps_table(tmp_path):
+    path = tmp_path / "shot_tuning.csv"
+    path.write_text("distance_m,hood_turns,shooter_rpm\n2.00,0.5,2000\n")
+    shot_map = ShotMap(TABLE, LINEAR, path)
+    assert not shot_map.reload()
+    assert shot_map.source == "table"
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from modules.shot_zone import ShotZoneMap
+
+
+@pytest.fixture
+def zones():
+    blue = np.zeros((4, 6), dtype=bool)
+    blue[1, 2] = True
+    red = np.zeros((4, 6), dtype=bool)
+    red[3, 5] = True
+    return ShotZoneMap(blue, red, 0.5, 0xBEEF)
+
+
+def test_contains_indexes_cells(zones):
+    assert zones.contains(1.2, 0.7)
+    assert not zones.contains(1.2, 0.7, red=True)
+    assert zones.contains(2.9, 1.9, red=True)
+    assert not zones.contains(0.1, 0.1)
+
+
+@pytest.mark.parametrize("x, y", [(-0.1, 0.7), (1.2, -0.01), (3.0, 1.0), (1.0, 2.0)])
+def test_outside_field_is_not_shootable(zones, x, y):
+    assert not zones.contains(x, y)
+    assert not zones.contains(x, y, red=True)
+
+
+def test_file_round_trip(zones, tmp_path):
+    path = tmp_path / "zones.bin"
+    zones.write(path)
+    loaded = ShotZoneMap.read(path)
+    assert (loaded.rows, loaded.cols, loaded.resolution, loaded.signature) == (4, 6, 0.5, 0xBEEF)
+    assert np.array_equal(loaded.blue, zones.blue)
+    assert np.array_equal(loaded.red, zones.red)
+
+
+def test_malformed_file_raises(zones, tmp_path):
+    path = tmp_path / "zones.bin"
+    zones.write(path)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        ShotZoneMap.read(path)
+    path.write_bytes(b"PNG!" + bytes(40))
+    with pytest.raises(ValueError):
+        ShotZoneMap.read(path)
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+from ntcore import NetworkTableInstance, PubSubOptions
+from wpimath.geometry import Pose2d, Rotation2d
+from wpimath.kinematics import ChassisSpeeds, SwerveModulePosition, SwerveModuleState
+
+from telemetry import NT_PERIOD_S, Telemetry
+
+ODOMETRY_PERIOD_S = 0.004  # 250 Hz
+
+
+def _state(timestamp: float, x: float = 0.0) -> SimpleNamespace:
+    modules = [SwerveModuleState(1.0, Rotation2d.fromDegrees(30.0))] * 4
+    return SimpleNamespace(
+        pose=Pose2d(x, 1.0, 0.0),
+        speeds=ChassisSpeeds(),
+        module_states=modules,
+        module_targets=modules,
+        module_positions=[SwerveModulePosition()] * 4,
+        timestamp=timestamp,
+        odometry_period=ODOMETRY_PERIOD_S,
+    )
+
+
+@pytest.fixture
+def pose_queue():
+    sub = (
+        NetworkTableInstance.getDefault()
+        .getTable("DriveState")
+        .getStructTopic("Pose", Pose2d)
+        .subscribe(Pose2d(), PubSubOptions(pollStorage=200))
+    )
+    yield sub
+    sub.close()
+
+
+def test_nt_decimated_to_period(pose_queue):
+    telemetry = Telemetry(4.0)
+    for i in range(250):  # one second of odometry
+        telemetry.telemeterize(_state(100.0 + i * ODOMETRY_PERIOD_S, x=i * 0.001))
+    assert len(pose_queue.readQueue()) == pytest.approx(1.0 / NT_PERIOD_S, abs=1)
+
+
+def test_nt_keeps_every_robot_loop_update(pose_queue):
+    """DriveState reaches NT (and so the wpilog replay_vision reads) once per 20 ms robot loop."""
+    telemetry = Telemetry(4.0)
+    for i in range(50):
+        telemetry.telemeterize(_state(200.0 + i * 0.02, x=float(i)))
+    published = [p.value.X() for p in pose_queue.readQueue()]
+    assert published == pytest.approx([float(i) for i in range(50)])
+
+
+def test_nt_skips_odometry_updates_between_periods(pose_queue):
+    """At 250 Hz odometry, only one update in NT_PERIOD_S / ODOMETRY_PERIOD_S reaches NT."""
+    telemetry = Telemetry(4.0)
+    for i in range(50):
+        telemetry.telemeterize(_state(300.0 + i * ODOMETRY_PERIOD_S, x=float(i)))
+    published = [p.value.X() for p in pose_queue.readQueue()]
+    stride = round(NT_PERIOD_S / ODOMETRY_PERIOD_S)
+    assert stride > 1
+    assert published == pytest.approx([float(i) for i in range(0, 50, stride)])
+
+
+def test_nt_schedule_restarts_after_a_gap(pose_queue):
+    telemetry = Telemetry(4.0)
+    telemetry.telemeterize(_state(10.0))
+    telemetry.telemeterize(_state(15.0, x=1.0))
+    telemetry.telemeterize(_state(15.004, x=2.0))
+    assert [p.value.X() for p in pose_queue.readQueue()] == [0.0, 1.0]
+
+
+def test_mechanisms_watched_when_any_module_subscribed(monkeypatch):
+    telemetry = Telemetry(4.0)
+    monkeypatch.setattr(
+        "telemetry.ntcore.meta.decodeTopicSubscribers", lambda raw: [SimpleNamespace(client="dashboard")]
+    )
+    telemetry._mechanism_subscribers = [SimpleNamespace(get=lambda: b"")] * 4
+    assert not telemetry._dashboard_subscribed()
+    telemetry._mechanism_subscribers[3] = SimpleNamespace(get=lambda: b"\x91")
+    assert telemetry._dashboard_subscribed()
+
+
+def test_mechanisms_skipped_without_a_dashboard():
+    telemetry = Telemetry(4.0)
+    telemetry.telemeterize(_state(20.0))
+    assert not telemetry._mechanisms_watched
+    assert telemetry._module_speeds[0].getAngle() == 0.0
+
+
+def test_callback_cpu_published():
+    telemetry = Telemetry(4.0)
+    cpu = NetworkTableInstance.getDefault().getTable("DriveState").getDoubleTopic("TelemetryCpuMs").subscribe(-1.0)
+    for i in range(50):  # past the second NT update
+        telemetry.telemeterize(_state(30.0 + i * ODOMETRY_PERIOD_S))
+    assert cpu.get() >= 0.0
+    cpu.close()
@@ -0,0 +1,396 @@
+import time
+from unittest.mock import MagicMock
+
+import ntcore
+import pytest
+from ntcore import NetworkTableInstance, PubSubOptions
+from wpilib import DriverStation
+from wpimath.geometry import Pose2d, Translation2d
+from wpimath.kinematics import ChassisSpeeds
+
+from modules.limelight import LimelightHelpers
+from modules.vision_tags import BLUE_HUB_TAGS, BLUE_TAGS
+from modules.vision_throttle import DISABLED_THROTTLE, SUPPORT_THROTTLE
+from subsystems.command_swerve_drivetrain import DriveSnapshot
+from subsystems.vision import (
+    MT1_TOPIC,
+    MT2_TOPIC,
+    VISION_MAX_REJECT_STREAK,
+    VISION_TAG_FILTER_BLIND_LOOPS,
+    VISION_TAG_FILTER_REJECT_STREAK,
+    VisionSubsystem,
+)
+
+CAMERA = "limelight-vision-test"
+OTHER_CAMERA = "limelight-vision-test-2"
+
+
+def _frame(x: float, latency: float = 20.0, tags: int = 1, dist: float = 2.0, ambiguity: float = 0.1) -> list[float]:
+    header = [x, 4.0, 0.0, 0.0, 0.0, 0.0, latency, float(tags), 0.0, dist, 0.05]
+    return header + [7, 0.0, 0.0, 0.05, dist, dist, ambiguity] * tags
+
+
+@pytest.fixture
+def swerve():
+    swerve = MagicMock()
+    swerve.pigeon2.get_angular_velocity_z_world.return_value.value = 0.0
+    swerve.get_snapshot.return_value = DriveSnapshot.from_state(Pose2d(), ChassisSpeeds())
+    swerve.sample_pose_at.return_value = None
+    return swerve
+
+
+@pytest.fixture
+def vision(swerve):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA])
+    vision.periodic()  # create the queue subscribers before anything is published
+    return vision
+
+
+@pytest.fixture
+def publish():
+    publishers = {}
+
+    def _publish(topic: str, value: list[float], camera: str = CAMERA) -> None:
+        key = (camera, topic)
+        if key not in publishers:
+            table = NetworkTableInstance.getDefault().getTable(camera)
+            publishers[key] = table.getDoubleArrayTopic(topic).publish(PubSubOptions(keepDuplicates=True))
+        publishers[key].set(value)
+
+    yield _publish
+    for pub in publishers.values():
+        pub.close()
+
+
+def test_every_queued_frame_fused_once(vision, swerve, publish):
+    publish(MT1_TOPIC, _frame(1.0))
+    publish(MT1_TOPIC, _frame(1.1))
+    vision.periodic()
+    assert swerve.add_vision_measurement.call_count == 2
+    assert [c.args[0].X() for c in swerve.add_vision_measurement.call_args_list] == [1.0, 1.1]
+
+    swerve.add_vision_measurement.reset_mock()
+    vision.periodic()  # nothing new
+    swerve.add_vision_measurement.assert_not_called()
+
+
+def test_duplicate_frames_dropped(vision, swerve, publish):
+    publish(MT1_TOPIC, _frame(1.0))
+    publish(MT1_TOPIC, _frame(1.0))
+    vision.periodic()
+    assert swerve.add_vision_measurement.call_count == 1
+    assert vision._stats[CAMERA].duplicates == 1
+
+
+def test_frames_keep_their_own_timestamps(vision, swerve, publish):
+    publish(MT1_TOPIC, _frame(1.0, latency=10.0))
+    publish(MT1_TOPIC, _frame(1.1, latency=40.0))
+    vision.periodic()
+    first, second = (c.args[1] for c in swerve.add_vision_measurement.call_args_list)
+    assert abs(first - second) == pytest.approx(0.03, abs=1e-3)
+
+
+def test_inactive_topic_is_drained(vision, swerve, publish):
+    publish(MT2_TOPIC, _frame(2.0))
+    vision.periodic()  # MT1 mode — MT2 frame discarded
+    vision._use_megatag2 = True
+    vision.periodic()
+    swerve.add_vision_measurement.assert_not_called()
+
+
+def test_fast_rotation_drains_without_fusing(vision, swerve, publish):
+    swerve.pigeon2.get_angular_velocity_z_world.return_value.value = 1000.0
+    publish(MT1_TOPIC, _frame(1.0))
+    vision.periodic()
+    swerve.pigeon2.get_angular_velocity_z_world.return_value.value = 0.0
+    vision.periodic()
+    swerve.add_vision_measurement.assert_not_called()
+    assert vision._stats[CAMERA].frames == 1
+
+
+def test_frames_from_a_clock_running_ahead_are_moved_back(vision, swerve):
+    pub = NetworkTableInstance.getDefault().getTable(CAMERA).getDoubleArrayTopic(MT1_TOPIC).publish()
+    pub.set(_frame(1.0, latency=20.0), ntcore._now() + 50_000)  # 50 ms in the future
+    deadline = time.monotonic() + 2.0
+    while vision._stats[CAMERA].clock.min_delay_us is None and time.monotonic() < deadline:
+        time.sleep(0.001)  # receive time comes from the NT listener thread
+    vision.periodic()
+    timestamp = swerve.add_vision_measurement.call_args.args[1]
+    assert timestamp <= ntcore._now() * 1e-6 - 0.02
+    assert vision._stats[CAMERA].clock.correction_us < -40_000
+    assert vision._stats[CAMERA].age_ms.total == 1
+    pub.close()
+
+
+def test_clock_offset_ignores_queueing_delay(vision, publish):
+    publish(MT1_TOPIC, _frame(1.0))
+    time.sleep(0.03)  # frame waits in the queue for a loop
+    vision.periodic()
+    assert vision._stats[CAMERA].frames == 1
+    assert vision._stats[CAMERA].clock.min_delay_us < 20_000
+
+
+def test_latency_histograms_are_windowed(vision, publish):
+    stats = vision._stats[CAMERA]
+    publish(MT1_TOPIC, _frame(1.0))
+    vision.periodic()
+    assert stats.age_ms.total == 1
+    stats.publish(ntcore._now() + 2_000_000)
+    assert stats.age_ms.total == 0
+    assert stats.capture_ms.total == 0
+
+
+def test_far_tags_rejected(vision, swerve, publish):
+    publish(MT1_TOPIC, _frame(1.0, dist=6.0))
+    vision.periodic()
+    swerve.add_vision_measurement.assert_not_called()
+
+
+def test_last_measurement_handed_to_main_loop(vision, publish):
+    publish(MT1_TOPIC, _frame(1.5))
+    vision.periodic()
+    pose, _ = vision.last_measurement()
+    assert pose.X() == 1.5
+
+
+def test_fusion_thread_fuses_off_main_loop(swerve, publish):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA], fusion_thread=True)
+    try:
+        assert vision.fusion_thread_running
+        time.sleep(0.05)  # let the worker subscribe
+        publish(MT1_TOPIC, _frame(2.5))
+        deadline = time.monotonic() + 2.0
+        while not swerve.add_vision_measurement.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert swerve.add_vision_measurement.call_count == 1
+
+        vision.periodic()  # main loop only reads the handoff
+        assert swerve.add_vision_measurement.call_count == 1
+        assert vision.last_measurement()[0].X() == 2.5
+    finally:
+        vision.stop_fusion_thread()
+    assert not vision.fusion_thread_running
+
+
+def test_stop_fusion_thread_is_idempotent(swerve):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA], fusion_thread=True)
+    vision.stop_fusion_thread()
+    vision.stop_fusion_thread()
+    assert not vision.fusion_thread_running
+
+
+@pytest.mark.parametrize("fusion_thread", [True, False])
+def test_fusion_thread_runs_only_while_enabled(swerve, fusion_thread):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA], fusion_thread=fusion_thread)
+    try:
+        vision.set_enabled(False)
+        assert not vision.fusion_thread_running
+        assert not vision._use_megatag2
+        vision.set_enabled(True)
+        assert vision.fusion_thread_running == fusion_thread
+        assert vision._use_megatag2
+    finally:
+        vision.stop_fusion_thread()
+
+
+# ── Fusion ─────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def two_cameras(swerve):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA, OTHER_CAMERA])
+    vision.periodic()
+    return vision
+
+
+def test_simultaneous_cameras_fused_as_one_update(two_cameras, swerve, publish):
+    publish(MT1_TOPIC, _frame(1.0))
+    publish(MT1_TOPIC, _frame(1.2), camera=OTHER_CAMERA)
+    two_cameras.periodic()
+    swerve.add_vision_measurement.assert_called_once()
+    pose, _, std_devs = swerve.add_vision_measurement.call_args.args
+    assert pose.X() == pytest.approx(1.1)
+    single_std = VisionSubsystem._get_dynamic_std_devs(LimelightHelpers.pose_estimate_from_array(_frame(1.0), 0, False))
+    assert std_devs[0] == pytest.approx(single_std[0] / 2**0.5)
+
+
+def test_ambiguous_single_tag_rejected(vision, swerve, publish):
+    publish(MT1_TOPIC, _frame(1.0, ambiguity=0.8))
+    vision.periodic()
+    swerve.add_vision_measurement.assert_not_called()
+
+
+def test_ambiguity_ignored_for_multi_tag(vision, swerve, publish):
+    publish(MT1_TOPIC, _frame(1.0, tags=2, ambiguity=0.8))
+    vision.periodic()
+    swerve.add_vision_measurement.assert_called_once()
+
+
+def test_odometry_outlier_rejected_in_megatag2(vision, swerve, publish):
+    vision._use_megatag2 = True
+    swerve.sample_pose_at.return_value = Pose2d(5.0, 4.0, 0.0)
+    publish(MT2_TOPIC, _frame(1.0))
+    vision.periodic()
+    swerve.add_vision_measurement.assert_not_called()
+
+    publish(MT2_TOPIC, _frame(5.1))
+    vision.periodic()
+    swerve.add_vision_measurement.assert_called_once()
+
+
+def test_odometry_gate_not_applied_in_megatag1(vision, swerve, publish):
+    swerve.sample_pose_at.return_value = Pose2d(5.0, 4.0, 0.0)
+    publish(MT1_TOPIC, _frame(1.0))
+    vision.periodic()
+    swerve.add_vision_measurement.assert_called_once()
+
+
+def test_reject_streak_lets_vision_correct_odometry(vision, swerve, publish):
+    vision._use_megatag2 = True
+    swerve.sample_pose_at.return_value = Pose2d(5.0, 4.0, 0.0)
+    for i in range(VISION_MAX_REJECT_STREAK):
+        publish(MT2_TOPIC, _frame(1.0 + 0.001 * i))
+        vision.periodic()
+    swerve.add_vision_measurement.assert_called_once()
+
+
+# ── Throttle policy ────────────────────────────────────────────
+
+
+@pytest.fixture
+def throttle_writes(monkeypatch):
+    writes = []
+    monkeypatch.setattr(LimelightHelpers, "set_throttle", lambda cam, throttle: writes.append((cam, throttle)))
+    monkeypatch.setattr(LimelightHelpers, "set_fiducial_downscaling_override", lambda cam, downscale: None)
+    return writes
+
+
+def test_throttle_written_only_on_change(swerve, throttle_writes):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA])
+    vision._localized = True
+    for _ in range(20):
+        vision.periodic()
+    assert throttle_writes == [(CAMERA, DISABLED_THROTTLE)]  # pyfrc starts disabled
+
+
+def test_disabled_throttle_waits_for_first_mt1_pose(swerve, throttle_writes, publish):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA])
+    for _ in range(10):
+        vision.periodic()
+    assert throttle_writes == [(CAMERA, 0)]
+    publish(MT1_TOPIC, _frame(1.0))
+    for _ in range(5):
+        vision.periodic()
+    assert throttle_writes == [(CAMERA, 0), (CAMERA, DISABLED_THROTTLE)]
+
+
+def test_shot_prioritizes_camera_facing_hub(swerve, throttle_writes, monkeypatch):
+    monkeypatch.setattr("subsystems.vision.DriverStation.isEnabled", lambda: True)
+    front, back = "limelight-front", "limelight-back"
+    vision = VisionSubsystem(
+        swerve=swerve, cameras=[front, back], hub=lambda: Translation2d(5.0, 0.0), shot_active=lambda: True
+    )
+    vision.periodic()
+    assert dict(throttle_writes) == {front: 0, back: SUPPORT_THROTTLE}
+
+
+# ── Tag filters ────────────────────────────────────────────────
+
+
+@pytest.fixture
+def filter_writes(monkeypatch):
+    writes = []
+    monkeypatch.setattr(
+        LimelightHelpers, "set_fiducial_id_filters_override", lambda cam, ids: writes.append((cam, tuple(ids)))
+    )
+    monkeypatch.setattr("subsystems.vision.DriverStation.isEnabled", lambda: True)
+    monkeypatch.setattr("subsystems.vision.DriverStation.getAlliance", lambda: DriverStation.Alliance.kBlue)
+    return writes
+
+
+def test_tag_filter_written_only_on_change(swerve, filter_writes):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA], shot_active=lambda: False)
+    vision._localized = True
+    for _ in range(20):
+        vision.periodic()
+    assert filter_writes == [(CAMERA, tuple(range(17, 33)))]  # blue origin, own zone
+
+
+def test_aiming_filters_to_hub_tags(swerve, filter_writes):
+    front = "limelight-front"
+    vision = VisionSubsystem(
+        swerve=swerve, cameras=[front], hub=lambda: Translation2d(4.6, 0.0), shot_active=lambda: True
+    )
+    vision._localized = True
+    vision.periodic()
+    assert filter_writes == [(front, BLUE_HUB_TAGS)]
+
+
+def test_filter_frame_rate_gain(swerve, filter_writes, publish):
+    shot = [False]
+    vision = VisionSubsystem(
+        swerve=swerve, cameras=[CAMERA], hub=lambda: Translation2d(4.6, 0.0), shot_active=lambda: shot[0]
+    )
+    vision._localized = True
+    table = NetworkTableInstance.getDefault().getTable(CAMERA)
+    latency_pub = table.getDoubleTopic("tl").publish()
+    gain = NetworkTableInstance.getDefault().getTable("Vision").getDoubleTopic(f"{CAMERA}/TagFilterFrameRateGain")
+    gain_sub = gain.subscribe(0.0)
+
+    # Neutral zone — unfiltered
+    swerve.get_snapshot.return_value = DriveSnapshot.from_state(Pose2d(8.0, 4.0, 0.0), ChassisSpeeds())
+    latency_pub.set(20.0)
+    for _ in range(10):
+        vision.periodic()
+    shot[0] = True
+    # Facing the hub
+    swerve.get_snapshot.return_value = DriveSnapshot.from_state(Pose2d(2.0, 0.0, 0.0), ChassisSpeeds())
+    latency_pub.set(10.0)
+    for _ in range(10):
+        vision.periodic()
+    assert gain_sub.get() == pytest.approx(2.0, rel=0.1)
+    latency_pub.close()
+
+
+def test_tag_filter_waits_for_first_mt1_pose(swerve, filter_writes, publish):
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA], shot_active=lambda: False)
+    for _ in range(10):
+        vision.periodic()
+    assert filter_writes == [(CAMERA, ())]
+    publish(MT1_TOPIC, _frame(1.0))
+    for _ in range(5):
+        vision.periodic()
+    assert filter_writes == [(CAMERA, ()), (CAMERA, BLUE_TAGS)]
+
+
+def test_tag_filter_dropped_while_vision_is_blind(swerve, filter_writes, publish):
+    """A pose with no fused frame for a while may have drifted: every tag until vision fuses again."""
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA], shot_active=lambda: False)
+    vision._localized = True
+    vision.periodic()
+    assert filter_writes == [(CAMERA, BLUE_TAGS)]
+    for _ in range(VISION_TAG_FILTER_BLIND_LOOPS + 5):
+        vision.periodic()
+    assert filter_writes[-1] == (CAMERA, ())
+    publish(MT1_TOPIC, _frame(1.0))
+    for _ in range(5):
+        vision.periodic()
+    assert filter_writes[-1] == (CAMERA, BLUE_TAGS)
+
+
+def test_tag_filter_dropped_while_odometry_gate_rejects(swerve, filter_writes, publish):
+    """Odometry disagreeing with every frame: stop filtering tags by the zone it reports."""
+    vision = VisionSubsystem(swerve=swerve, cameras=[CAMERA], shot_active=lambda: False)
+    vision.periodic()
+    vision._localized = True
+    vision._use_megatag2 = True
+    swerve.sample_pose_at.return_value = Pose2d(5.0, 4.0, 0.0)
+    for i in range(VISION_TAG_FILTER_REJECT_STREAK + 5):
+        publish(MT2_TOPIC, _frame(1.0 + 0.001 * i))
+        vision.periodic()
+    assert filter_writes[-1] == (CAMERA, ())
+    swerve.sample_pose_at.return_value = None  # agrees again
+    for i in range(5):
+        publish(MT2_TOPIC, _frame(1.1 + 0.001 * i))
+        vision.periodic()
+    assert filter_writes[-1] == (CAMERA, BLUE_TAGS)
@@ -0,0 +1,48 @@
+import math
+
+import pytest
+from wpimath.geometry import Pose2d
+
+from modules.vision_fusion import MAX_MAHALANOBIS, VisionMeasurement, combine, group_by_time, mahalanobis
+
+
+def _m(camera: str, x: float, t: float, std: float = 0.5, heading: float = 0.0, heading_std: float = 0.5):
+    return VisionMeasurement(camera, Pose2d(x, 2.0, heading), t, (std, std, heading_std))
+
+
+def test_mahalanobis_scales_with_std_devs():
+    reference = Pose2d(1.0, 2.0, 0.0)
+    assert mahalanobis(_m("a", 1.0, 0.0), reference) == pytest.approx(0.0)
+    tight = mahalanobis(_m("a", 2.0, 0.0, std=0.2), reference)
+    loose = mahalanobis(_m("a", 2.0, 0.0, std=1.0), reference)
+    assert tight > MAX_MAHALANOBIS > loose
+
+
+def test_mahalanobis_ignores_untrusted_heading():
+    reference = Pose2d(1.0, 2.0, 0.0)
+    assert mahalanobis(_m("a", 1.0, 0.0, heading=2.0, heading_std=math.inf), reference) == 0.0
+    assert mahalanobis(_m("a", 1.0, 0.0, heading=2.0), reference) > MAX_MAHALANOBIS
+
+
+def test_group_by_time_merges_cameras_not_frames():
+    groups = group_by_time([_m("front", 1.0, 0.00), _m("back", 1.0, 0.01), _m("front", 1.0, 0.02)])
+    assert [[m.camera for m in g] for g in groups] == [["front", "back"], ["front"]]
+
+
+def test_group_by_time_splits_on_window():
+    groups = group_by_time([_m("front", 1.0, 0.0), _m("back", 1.0, 0.1)], window_s=0.03)
+    assert len(groups) == 2
+
+
+def test_combine_weights_by_inverse_variance():
+    fused = combine([_m("a", 1.0, 0.0, std=0.5), _m("b", 2.0, 0.02, std=1.0)])
+    assert fused.pose.X() == pytest.approx((1.0 / 0.25 + 2.0 / 1.0) / (1 / 0.25 + 1.0))
+    assert fused.std_devs[0] < 0.5
+    assert fused.timestamp == pytest.approx(0.02 * 1.0 / 5.0)
+
+
+def test_combine_heading_wraps_and_skips_infinite():
+    fused = combine([_m("a", 1.0, 0.0, heading=math.pi - 0.1), _m("b", 1.0, 0.0, heading=-math.pi + 0.1)])
+    assert abs(fused.pose.rotation().radians()) == pytest.approx(math.pi)
+    mt2 = combine([_m("a", 1.0, 0.0, heading=0.3, heading_std=math.inf), _m("b", 1.0, 0.0, heading_std=math.inf)])
+    assert mt2.std_devs[2] == math.inf
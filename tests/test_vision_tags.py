@@ -0,0 +1,55 @@
+import pytest
+
+from modules.vision_tags import (
+    ALL_TAGS,
+    BLUE_HUB_TAGS,
+    BLUE_TAGS,
+    FIELD_LENGTH_M,
+    RED_HUB_TAGS,
+    RED_TAGS,
+    field_zone,
+    select_tag_filter,
+)
+
+
+@pytest.mark.parametrize(
+    "x, red, expected",
+    [
+        (1.0, False, "own"),
+        (1.0, True, "opponent"),
+        (FIELD_LENGTH_M / 2, True, "neutral"),
+        (FIELD_LENGTH_M - 1.0, True, "own"),
+        (FIELD_LENGTH_M - 1.0, False, "opponent"),
+    ],
+)
+def test_field_zone(x, red, expected):
+    assert field_zone(x, red) == expected
+
+
+def test_alliance_tag_sets_partition_the_field():
+    assert set(RED_TAGS).isdisjoint(BLUE_TAGS)
+    assert set(RED_TAGS) | set(BLUE_TAGS) == set(range(1, 33))
+    assert set(RED_HUB_TAGS) <= set(RED_TAGS)
+    assert set(BLUE_HUB_TAGS) <= set(BLUE_TAGS)
+
+
+def test_disabled_or_unknown_alliance_uses_every_tag():
+    assert select_tag_filter(False, True, "own", True, True) == ALL_TAGS
+    assert select_tag_filter(True, None, "own", True, True) == ALL_TAGS
+
+
+def test_aiming_uses_own_hub_tags_on_the_facing_camera():
+    assert select_tag_filter(True, True, "own", True, True).ids == RED_HUB_TAGS
+    assert select_tag_filter(True, False, "own", True, True).ids == BLUE_HUB_TAGS
+    assert select_tag_filter(True, False, "own", True, False).ids == BLUE_TAGS
+
+
+def test_zone_filters():
+    assert select_tag_filter(True, False, "own", False, True).ids == BLUE_TAGS
+    assert select_tag_filter(True, False, "opponent", False, True).ids == RED_TAGS
+    assert select_tag_filter(True, False, "neutral", False, True) == ALL_TAGS
+
+
+def test_untrusted_pose_uses_every_tag():
+    assert select_tag_filter(True, False, "own", False, True, pose_trusted=False) == ALL_TAGS
+    assert select_tag_filter(True, False, "own", True, True, pose_trusted=False) == ALL_TAGS
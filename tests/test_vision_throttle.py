@@ -0,0 +1,49 @@
+import math
+
+import pytest
+from wpimath.geometry import Pose2d, Translation2d
+
+from modules.vision_throttle import (
+    DISABLED_THROTTLE,
+    FAST_SPEED_MPS,
+    FULL_RATE,
+    IDLE_THROTTLE,
+    MIN_USEFUL_FPS,
+    SUPPORT_THROTTLE,
+    CameraSettings,
+    faces_hub,
+    select_settings,
+)
+
+HUB = Translation2d(5.0, 4.0)
+
+
+@pytest.mark.parametrize(
+    "heading, camera_yaw, expected",
+    [(0.0, 0.0, True), (0.0, 180.0, False), (math.pi, 180.0, True), (math.radians(50), 0.0, True)],
+)
+def test_faces_hub(heading, camera_yaw, expected):
+    assert faces_hub(camera_yaw, Pose2d(2.0, 4.0, heading), HUB) is expected
+
+
+def test_disabled_throttles_everything():
+    assert select_settings(False, True, True, 0.0, 30.0).throttle == DISABLED_THROTTLE
+
+
+def test_disabled_runs_full_rate_until_localized():
+    assert select_settings(False, False, False, 0.0, 0.0, localized=False) == FULL_RATE
+
+
+def test_shot_splits_cameras():
+    assert select_settings(True, True, True, 0.0, 0.0) == CameraSettings(0, 1.0)
+    assert select_settings(True, True, False, 0.0, 30.0).throttle == SUPPORT_THROTTLE
+
+
+def test_fast_driving_runs_full_rate_downscaled():
+    assert select_settings(True, False, False, FAST_SPEED_MPS, 0.0) == CameraSettings(0, 2.0)
+
+
+def test_idle_camera_without_tags_throttled():
+    assert select_settings(True, False, False, 0.5, MIN_USEFUL_FPS / 2).throttle == IDLE_THROTTLE
+    assert select_settings(True, False, False, 0.5, MIN_USEFUL_FPS * 2) == FULL_RATE
+    assert select_settings(True, False, True, 0.5, 0.0) == FULL_RATE
@@ -0,0 +1,58 @@
+import pytest
+
+from modules.vision_timing import (
+    LATENCY_BIN_MS,
+    LATENCY_BINS,
+    ClockOffsetEstimator,
+    LatencyHistogram,
+    capture_time_s,
+)
+
+
+def test_histogram_bins_and_overflow():
+    histogram = LatencyHistogram()
+    for latency_ms in (1.0, 4.9, 12.0, 1000.0, -3.0):
+        histogram.add(latency_ms)
+    assert histogram.counts[0] == 3
+    assert histogram.counts[2] == 1
+    assert histogram.counts[-1] == 1
+    assert histogram.total == 5
+
+
+def test_histogram_percentile():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) == 0.0
+    for latency_ms in [12.0] * 9 + [42.0]:
+        histogram.add(latency_ms)
+    assert histogram.percentile(0.5) == 3 * LATENCY_BIN_MS
+    assert histogram.percentile(1.0) == 9 * LATENCY_BIN_MS
+    histogram.clear()
+    assert histogram.counts == [0] * LATENCY_BINS
+
+
+def test_synced_clock_needs_no_correction():
+    clock = ClockOffsetEstimator()
+    assert clock.correction_us == 0
+    clock.observe(1_000, 3_000)
+    assert clock.min_delay_us == 2_000
+    assert clock.correction_us == 0
+
+
+def test_camera_clock_ahead_is_corrected():
+    clock = ClockOffsetEstimator()
+    for i in range(10):
+        clock.observe(i * 20_000 + 4_000, i * 20_000 + 1_000 + (i % 3) * 1_000)
+    assert clock.correction_us == -3_000
+
+
+def test_offset_window_forgets_old_frames():
+    clock = ClockOffsetEstimator(window=5)
+    clock.observe(10_000, 0)
+    for i in range(5):
+        clock.observe(0, 1_000 + i)
+    assert clock.min_delay_us == 1_000
+
+
+def test_capture_time():
+    assert capture_time_s(2_000_000, 30.0) == pytest.approx(1.97)
+    assert capture_time_s(2_000_000, 30.0, -5_000) == pytest.approx(1.965)
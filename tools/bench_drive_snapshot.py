@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the drivetrain snapshot — per-tick cost of the pose consumers
+(VirtualGoal, vision throttle, tag filters, MegaTag2 heading, tune-shot distance)
+each calling get_state(), against one refresh_snapshot() per tick shared by all of
+them through get_snapshot(). Builds the simulated CTRE drivetrain (without the
+PathPlanner setup, which needs the robot's deploy directory), no hardware.
+
+Usage:
+    python tools/bench_drive_snapshot.py
+    python tools/bench_drive_snapshot.py 50000
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generated.tuner_constants import TunerConstants, TunerSwerveDrivetrain
+from subsystems.command_swerve_drivetrain import DriveSnapshot
+
+TICKS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+CONSUMERS = 5
+REPEATS = 5  # best-of, to filter scheduler noise
+
+
+def _best_of(fn) -> float:
+    """Return best mean microseconds per fn() call over REPEATS runs."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            fn()
+        best = min(best, (time.perf_counter() - start) / TICKS * 1e6)
+    return best
+
+
+drivetrain = TunerSwerveDrivetrain(
+    TunerConstants.drivetrain_constants,
+    50.0,
+    [TunerConstants.front_left, TunerConstants.front_right, TunerConstants.back_left, TunerConstants.back_right],
+)
+
+
+def per_consumer_state() -> None:
+    for _ in range(CONSUMERS):
+        state = drivetrain.get_state()
+        heading = state.pose.rotation()
+        math.hypot(state.speeds.vx * heading.cos(), state.speeds.vy * heading.sin())
+
+
+def shared_snapshot() -> None:
+    state = drivetrain.get_state()  # CommandSwerveDrivetrain.refresh_snapshot()
+    snapshot = DriveSnapshot.from_state(state.pose, state.speeds, state.timestamp)
+    for _ in range(CONSUMERS):
+        math.hypot(snapshot.vx, snapshot.vy)
+
+
+before = _best_of(per_consumer_state)
+after = _best_of(shared_snapshot)
+print(f"{CONSUMERS} consumers, {TICKS} ticks, best of {REPEATS}")
+print(f"  get_state() per consumer   {before:8.2f} µs/tick  ({CONSUMERS} pybind state copies)")
+print(f"  shared snapshot            {after:8.2f} µs/tick  (1 pybind state copy)")
+print(f"  saved                      {before - after:8.2f} µs/tick  ({before / max(after, 1e-9):.1f}x)")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for LimelightHelpers — per-camera, per-loop cost of what
+VisionSubsystem does each tick (MegaTag2 orientation write, botpose estimate,
+raw fiducials) with 0, 4 and 16 tags in view, against the previous
+uncached getTable()/getEntry() + per-field parsing path.
+Publishes synthetic Limelight data on the local NT instance, no camera needed.
+
+Usage:
+    python tools/bench_limelight.py
+    python tools/bench_limelight.py 50000
+"""
+
+import sys
+import time
+from math import radians
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ntcore import NetworkTableInstance
+from wpimath.geometry import Pose2d, Rotation2d, Translation2d
+
+from modules.limelight import LimelightHelpers, PoseEstimate, RawFiducial
+
+CAMERA = "limelight-bench"
+LOOPS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+TAG_COUNTS = (0, 4, 16)
+REPEATS = 5  # best-of, to filter scheduler noise
+
+
+def _fiducials(tags: int) -> list[float]:
+    data: list[float] = []
+    for i in range(tags):
+        data += [float(i + 1), 1.5 * i, -0.5 * i, 0.02, 2.0 + 0.1 * i, 2.2 + 0.1 * i, 0.05]
+    return data
+
+
+def _botpose(tags: int) -> list[float]:
+    header = [3.2, 4.1, 0.0, 0.0, 0.0, 45.0, 28.0, float(tags), 1.2, 2.6, 0.04]
+    return header + _fiducials(tags)
+
+
+# ── Previous implementation, kept here for comparison ─────────────
+
+
+def _legacy_entry(name: str, entry: str):
+    return NetworkTableInstance.getDefault().getTable(name).getEntry(entry)
+
+
+def _legacy_extract(data: list[float], position: int) -> float:
+    if len(data) < position + 1:
+        return 0
+    return data[position]
+
+
+def _legacy_raw_fiducials(name: str) -> list[RawFiducial]:
+    data = _legacy_entry(name, "rawfiducials").getDoubleArray([])
+    if len(data) % 7 != 0:
+        return []
+    fiducials = []
+    for i in range(len(data) // 7):
+        base = i * 7
+        fiducials.append(
+            RawFiducial(int(_legacy_extract(data, base)), *(_legacy_extract(data, base + k) for k in range(1, 7)))
+        )
+    return fiducials
+
+
+def _legacy_botpose_estimate(name: str) -> PoseEstimate:
+    entry = NetworkTableInstance.getDefault().getTable(name).getDoubleArrayTopic("botpose_orb_wpiblue").getEntry([])
+    atomic = entry.getAtomic()
+    data = atomic.value
+    if not data:
+        return PoseEstimate()
+    tag_count = int(data[7])
+    fiducials = [RawFiducial(int(data[i]), *data[i + 1 : i + 7]) for i in range(11, 11 + tag_count * 7, 7)]
+    pose = Pose2d(Translation2d(data[0], data[1]), Rotation2d(radians(data[5])))
+    return PoseEstimate(pose, atomic.time * 1e-6 - data[6] * 1e-3, data[6], tag_count, *data[8:11], fiducials, True)
+
+
+def _legacy_loop() -> None:
+    _legacy_entry(CAMERA, "robot_orientation_set").setDoubleArray([45.0, 0, 0, 0, 0, 0])
+    _legacy_botpose_estimate(CAMERA)
+    _legacy_raw_fiducials(CAMERA)
+
+
+def _cached_loop() -> None:
+    LimelightHelpers.set_robot_orientation_no_flush(CAMERA, 45.0, 0, 0, 0, 0, 0)
+    LimelightHelpers.get_botpose_estimate_wpiblue_megatag2(CAMERA)
+    LimelightHelpers.get_raw_fiducials(CAMERA)
+
+
+def _best_us(loop) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(LOOPS):
+            loop()
+        best = min(best, time.perf_counter() - start)
+    return best / LOOPS * 1e6
+
+
+def main() -> None:
+    table = NetworkTableInstance.getDefault().getTable(CAMERA)
+    botpose_pub = table.getDoubleArrayTopic("botpose_orb_wpiblue").publish()
+    fiducials_pub = table.getDoubleArrayTopic("rawfiducials").publish()
+
+    print(f"{LOOPS} loops, best of {REPEATS} — microseconds per camera per loop")
+    print(f"{'tags':>4}  {'uncached':>9}  {'cached':>9}  {'speedup':>7}")
+    for tags in TAG_COUNTS:
+        botpose_pub.set(_botpose(tags))
+        fiducials_pub.set(_fiducials(tags))
+        assert LimelightHelpers.get_raw_fiducials(CAMERA) == _legacy_raw_fiducials(CAMERA)
+
+        legacy = _best_us(_legacy_loop)
+        cached = _best_us(_cached_loop)
+        print(f"{tags:>4}  {legacy:>9.1f}  {cached:>9.1f}  {legacy / cached:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
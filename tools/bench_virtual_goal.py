@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for VirtualGoal.calculate() — per-call cost against the legacy
+fixed-point solver, ballistics evaluations and flight-time residual for each solver
+(fixed-point, Newton, grid lookup), plus per-point cost of the NumPy batch solver.
+Runs on a laptop or the roboRIO, no hardware.
+
+Usage:
+    python tools/bench_virtual_goal.py
+    python tools/bench_virtual_goal.py 50000
+"""
+
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from commands.hub_shot import (
+    BLUE_HUB,
+    SOLVER_FIXED,
+    SOLVER_GRID,
+    SOLVER_NEWTON,
+    VirtualGoal,
+    _rpm_to_exit_velocity,
+    compute_ballistics,
+    solve_flight_time,
+    solve_virtual_goal_batch,
+)
+from modules.drive_motion import MotionEstimate
+
+CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+SAMPLES = 256
+REPEATS = 5  # best-of, to filter scheduler noise
+
+
+class _FakeDrivetrain:
+    """Cycles through random shooting-zone motion estimates in place of get_motion()."""
+
+    def __init__(self, seed: int = 3996):
+        rng = random.Random(seed)
+        self._states = [
+            MotionEstimate(
+                0.0,
+                BLUE_HUB.X() - rng.uniform(1.0, 4.5),
+                BLUE_HUB.Y() + rng.uniform(-3.0, 3.0),
+                rng.uniform(-3.14, 3.14),
+                rng.uniform(-2.0, 2.0),
+                rng.uniform(-2.0, 2.0),
+                0.0,
+                rng.uniform(-4.0, 4.0),
+                rng.uniform(-4.0, 4.0),
+            )
+            for _ in range(SAMPLES)
+        ]
+        self._i = 0
+
+    def get_snapshot(self):
+        return self  # Never changes, so calculate() stays cached
+
+    def get_motion(self):
+        self._i = (self._i + 1) % SAMPLES
+        return self._states[self._i]
+
+
+def _best_of(fn) -> float:
+    """Return best mean microseconds per fn() call over REPEATS runs."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            fn()
+        best = min(best, (time.perf_counter() - start) / CALLS * 1e6)
+    return best
+
+
+def _best_of_each(fns: dict) -> dict:
+    """Like _best_of() for several fns, interleaving their runs so clock drift hits them alike."""
+    best = dict.fromkeys(fns, float("inf"))
+    for _ in range(REPEATS):
+        for name, fn in fns.items():
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                fn()
+            best[name] = min(best[name], (time.perf_counter() - start) / CALLS * 1e6)
+    return best
+
+
+vg = VirtualGoal(_FakeDrivetrain())
+for _ in range(SAMPLES):  # warm up
+    vg._solve(SOLVER_GRID)
+
+# _solve() bypasses the per-tick cache so every call does the full work
+solver_us = _best_of_each(
+    {solver: lambda s=solver: vg._solve(s) for solver in (SOLVER_FIXED, SOLVER_NEWTON, SOLVER_GRID)}
+)
+cached_us = _best_of(vg.calculate)  # same snapshot between calls → same tick
+
+
+def _accuracy(solver: str) -> tuple[float, float]:
+    """Mean ballistics evaluations and max |residual| (ms) over the sample states."""
+    evaluations = 0
+    worst = 0.0
+    for state in vg._drivetrain._states:
+        vx, vy = state.vx, state.vy
+        dx = BLUE_HUB.X() - state.x
+        dy = BLUE_HUB.Y() - state.y
+        if solver == SOLVER_FIXED:
+            t = 0.0
+            for _ in range(2):
+                distance = math.hypot(dx - vx * t, dy - vy * t)
+                t = math.hypot(dx, dy) / _rpm_to_exit_velocity(compute_ballistics(distance)[0], slip)
+            n = 2
+        elif solver == SOLVER_GRID:
+            t, _, _, _, n, _ = grid.solve(dx, dy, vx, vy, slip) or solve_flight_time(dx, dy, vx, vy, slip)
+        else:
+            t, _, _, _, n, _ = solve_flight_time(dx, dy, vx, vy, slip)
+        distance = math.hypot(dx - vx * t, dy - vy * t)
+        exact = math.hypot(dx, dy) / _rpm_to_exit_velocity(compute_ballistics(distance)[0], slip)
+        evaluations += n
+        worst = max(worst, abs(t - exact) * 1e3)
+    return evaluations / SAMPLES, worst
+
+
+# Solve step alone, at equal (converged) accuracy
+grid = vg._grid
+slip = vg._slip_factor_sub.get()
+newton_solve_us = _best_of(lambda: solve_flight_time(2.5, 0.4, -1.2, 0.8, slip))
+grid_solve_us = _best_of(lambda: grid.solve(2.5, 0.4, -1.2, 0.8, slip))
+
+# Batch API over a 10 cm field grid around the blue hub, with a strafing velocity
+field_x = [i * 0.1 for i in range(90) for _ in range(81)]
+field_y = [j * 0.1 for _ in range(90) for j in range(81)]
+batch_start = time.perf_counter()
+solve_virtual_goal_batch(field_x, field_y, 1.0, -1.5, BLUE_HUB, slip)
+batch_us = (time.perf_counter() - batch_start) / len(field_x) * 1e6
+
+grid._slip = None  # Force a full rebuild
+build_start = time.perf_counter()
+grid.refresh(slip)
+build_ms = (time.perf_counter() - build_start) * 1e3
+
+print(f"calculate() x {CALLS}, best of {REPEATS}, slip {slip}")
+for solver, us in solver_us.items():
+    evaluations, worst_ms = _accuracy(solver)
+    gain = solver_us[SOLVER_FIXED] / us
+    print(
+        f"  {solver:<7} {us:8.2f} us/call  {gain:5.2f}x vs fixed  {evaluations:5.2f} evals"
+        f"  max residual {worst_ms:8.4f} ms"
+    )
+print(f"  cached (same tick): {cached_us:8.2f} us/call")
+print("solve step only")
+print(f"  solve_flight_time(), no seed: {newton_solve_us:8.2f} us/call")
+print(f"  grid solve():                  {grid_solve_us:8.2f} us/call")
+print(f"  solve_virtual_goal_batch():    {batch_us:8.2f} us/point ({len(field_x)} poses)")
+print(f"grid rebuild:                   {build_ms:8.2f} ms")
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Replay recorded Limelight frames and drivetrain odometry from a WPILog through
+VisionSubsystem — no robot, faster than real time — and report the fused pose
+trajectory and error statistics, so fusion settings can be compared offline.
+
+Frames are republished on the local NT instance with their recorded timestamps and
+drained by VisionSubsystem.periodic() every 20 ms of log time. A WPILib
+SwerveDrive4PoseEstimator stands in for the CTRE one, fed with the recorded module
+positions and heading.
+
+Reads these entries (DataLogManager records NetworkTables by default):
+    NT:/limelight-*/botpose_wpiblue, botpose_orb_wpiblue   Limelight frames
+    NT:/DriveState/Pose, ModulePositions, Speeds           Telemetry (heading, odometry, gyro rate)
+    DS:enabled                                             optional — MT1 while disabled, MT2 while enabled
+
+Usage:
+    python tools/replay_vision.py FRC_20260314_153012.wpilog
+    python tools/replay_vision.py match.wpilog --csv fused.csv --max-tag-distance 5 --mahalanobis 2.5
+"""
+
+import argparse
+import csv
+import math
+import sys
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ntcore
+from wpimath.estimator import SwerveDrive4PoseEstimator
+from wpimath.geometry import Pose2d, Translation2d
+from wpimath.kinematics import ChassisSpeeds, SwerveDrive4Kinematics, SwerveModulePosition
+from wpiutil import wpistruct
+from wpiutil.log import DataLogReader
+
+import subsystems.vision as vision_module
+from generated.tuner_constants import TunerConstants
+from subsystems.command_swerve_drivetrain import DriveSnapshot
+from subsystems.vision import MT1_TOPIC, MT2_TOPIC, VisionSubsystem
+
+TICK_US = 20_000  # Robot loop period
+
+
+@dataclass
+class _OdometrySample:
+    time_us: int
+    pose: Pose2d
+    positions: tuple[SwerveModulePosition, ...]
+    speeds: ChassisSpeeds
+
+
+@dataclass
+class _Recording:
+    frames: list[tuple[int, str, str, list[float]]] = field(default_factory=list)  # (time, camera, topic, value)
+    odometry: list[_OdometrySample] = field(default_factory=list)
+    enabled: list[tuple[int, bool]] = field(default_factory=list)
+
+
+def _read_log(path: Path) -> _Recording:
+    reader = DataLogReader(str(path))
+    if not reader.isValid():
+        raise SystemExit(f"{path}: not a WPILog file")
+
+    entries: dict[int, str] = {}
+    recording = _Recording()
+    poses: dict[int, Pose2d] = {}
+    positions: dict[int, tuple[SwerveModulePosition, ...]] = {}
+    speeds: dict[int, ChassisSpeeds] = {}
+    for record in reader:
+        if record.isStart():
+            start = record.getStartData()
+            entries[start.entry] = start.name
+            continue
+        if record.isControl():
+            continue
+        name = entries.get(record.getEntry())
+        if name is None:
+            continue
+        t = record.getTimestamp()
+        parts = name.split("/")
+        if name.startswith("NT:/limelight") and len(parts) == 3 and parts[2] in (MT1_TOPIC, MT2_TOPIC):
+            recording.frames.append((t, parts[1], parts[2], list(record.getDoubleArray())))
+        elif name == "NT:/DriveState/Pose":
+            poses[t] = wpistruct.unpack(Pose2d, record.getRaw())
+        elif name == "NT:/DriveState/ModulePositions":
+            positions[t] = tuple(wpistruct.unpackArray(SwerveModulePosition, record.getRaw()))
+        elif name == "NT:/DriveState/Speeds":
+            speeds[t] = wpistruct.unpack(ChassisSpeeds, record.getRaw())
+        elif name == "DS:enabled":
+            recording.enabled.append((t, record.getBoolean()))
+
+    # Telemetry publishes pose, speeds and module positions together from one drive state
+    recording.odometry = [
+        _OdometrySample(t, poses[t], positions[t], speeds.get(t, ChassisSpeeds()))
+        for t in sorted(poses.keys() & positions.keys())
+    ]
+    return recording
+
+
+class _ReplayDrivetrain:
+    """The part of CommandSwerveDrivetrain that VisionSubsystem uses, backed by a WPILib estimator."""
+
+    def __init__(self, first: _OdometrySample):
+        kinematics = SwerveDrive4Kinematics(
+            *(
+                Translation2d(module.location_x, module.location_y)
+                for module in (
+                    TunerConstants.front_left,
+                    TunerConstants.front_right,
+                    TunerConstants.back_left,
+                    TunerConstants.back_right,
+                )
+            )
+        )
+        self._estimator = SwerveDrive4PoseEstimator(kinematics, first.pose.rotation(), first.positions, first.pose)
+        self._omega_deg_s = 0.0
+        self._speeds = ChassisSpeeds()
+        self.pigeon2 = SimpleNamespace(get_angular_velocity_z_world=lambda: SimpleNamespace(value=self._omega_deg_s))
+        self.residuals: list[float] = []  # Vision pose vs estimator pose at the frame's timestamp (m)
+        self.corrections: list[float] = []  # Estimated pose change caused by each update (m)
+
+    def update(self, sample: _OdometrySample) -> None:
+        self._speeds = sample.speeds
+        self._omega_deg_s = math.degrees(sample.speeds.omega)
+        self._estimator.updateWithTime(sample.time_us * 1e-6, sample.pose.rotation(), sample.positions)
+
+    @property
+    def pose(self) -> Pose2d:
+        return self._estimator.getEstimatedPosition()
+
+    def get_snapshot(self) -> DriveSnapshot:
+        return DriveSnapshot.from_state(self.pose, self._speeds)
+
+    def sample_pose_at(self, timestamp: float) -> Pose2d | None:
+        return self._estimator.sampleAt(timestamp)
+
+    def add_vision_measurement(self, pose: Pose2d, timestamp: float, std_devs: tuple[float, float, float]) -> None:
+        sampled = self._estimator.sampleAt(timestamp)
+        if sampled is not None:
+            self.residuals.append(sampled.translation().distance(pose.translation()))
+        before = self.pose
+        self._estimator.addVisionMeasurement(pose, timestamp, std_devs)
+        self.corrections.append(before.translation().distance(self.pose.translation()))
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _rms(values: list[float]) -> float:
+    return math.sqrt(sum(v * v for v in values) / len(values)) if values else math.nan
+
+
+def replay(recording: _Recording, csv_path: Path | None) -> None:
+    if not recording.odometry:
+        raise SystemExit("No DriveState/Pose + ModulePositions samples in the log")
+    cameras = sorted({cam for _, cam, _, _ in recording.frames})
+    if not cameras:
+        raise SystemExit("No limelight-*/botpose_* frames in the log")
+
+    drivetrain = _ReplayDrivetrain(recording.odometry[0])
+    vision = VisionSubsystem(swerve=drivetrain, cameras=cameras)  # type: ignore[arg-type]
+    vision.periodic()  # create the queue subscribers before the first frame is published
+
+    inst = ntcore.NetworkTableInstance.getDefault()
+    publishers = {
+        (cam, topic): inst.getTable(cam).getDoubleArrayTopic(topic).publish(ntcore.PubSubOptions(keepDuplicates=True))
+        for cam, topic in {(cam, topic) for _, cam, topic, _ in recording.frames}
+    }
+    enabled_times = [t for t, _ in recording.enabled]
+
+    # Merge frames and odometry by time; odometry first on ties so frames see the latest pose
+    events = [(s.time_us, 0, s) for s in recording.odometry] + [(f[0], 1, f) for f in recording.frames]
+    events.sort(key=lambda e: (e[0], e[1]))
+    recorded_times = [s.time_us for s in recording.odometry]
+
+    rows = []
+    differences = []
+    next_tick = events[0][0] + TICK_US
+    wall_start = time.perf_counter()
+
+    def tick(now_us: int) -> None:
+        ntcore._setNow(now_us)
+        i = bisect_right(enabled_times, now_us) - 1
+        vision._use_megatag2 = recording.enabled[i][1] if i >= 0 else True
+        vision.periodic()
+        pose = drivetrain.pose
+        recorded = recording.odometry[max(bisect_right(recorded_times, now_us) - 1, 0)].pose
+        differences.append(pose.translation().distance(recorded.translation()))
+        rows.append(
+            (
+                now_us * 1e-6,
+                pose.X(),
+                pose.Y(),
+                pose.rotation().degrees(),
+                recorded.X(),
+                recorded.Y(),
+                recorded.rotation().degrees(),
+            )
+        )
+
+    for t, kind, payload in events:
+        while t >= next_tick:
+            tick(next_tick)
+            next_tick += TICK_US
+        if kind == 0:
+            drivetrain.update(payload)
+        else:
+            _, cam, topic, value = payload
+            publishers[(cam, topic)].set(value, t)
+    tick(next_tick)
+    wall_s = time.perf_counter() - wall_start
+
+    log_s = (events[-1][0] - events[0][0]) * 1e-6
+    frames = sum(stats.frames for stats in vision._stats.values())
+    print(f"Replayed {log_s:.1f} s of log in {wall_s:.2f} s ({log_s / max(wall_s, 1e-9):.0f}x real time)")
+    print(f"Cameras: {', '.join(cameras)}")
+    print(
+        f"Frames: {len(recording.frames)} recorded, {frames} ingested, "
+        f"{sum(s.duplicates for s in vision._stats.values())} duplicates"
+    )
+    print(f"Rejected: {sum(vision._ambiguous.values())} ambiguous, {sum(vision._outliers.values())} odometry outliers")
+    print(f"Pose estimator updates: {len(drivetrain.corrections)}")
+    print(
+        f"Vision residual (m): mean {sum(drivetrain.residuals) / max(len(drivetrain.residuals), 1):.3f}, "
+        f"p95 {_percentile(drivetrain.residuals, 0.95):.3f}, max {max(drivetrain.residuals, default=math.nan):.3f}"
+    )
+    print(
+        f"Correction per update (m): p95 {_percentile(drivetrain.corrections, 0.95):.3f}, "
+        f"max {max(drivetrain.corrections, default=math.nan):.3f}"
+    )
+    print(f"Replayed vs recorded pose (m): RMS {_rms(differences):.3f}, max {max(differences):.3f}")
+
+    if csv_path is not None:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["time_s", "x", "y", "heading_deg", "recorded_x", "recorded_y", "recorded_heading_deg"])
+            writer.writerows(rows)
+        print(f"Wrote {csv_path} ({len(rows)} rows)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("log", type=Path, help="WPILog recorded on the robot")
+    parser.add_argument("--csv", type=Path, help="write the fused trajectory")
+    parser.add_argument("--max-tag-distance", type=float, help="override VISION_MAX_TAG_DISTANCE (m)")
+    parser.add_argument("--max-angular-velocity", type=float, help="override VISION_MAX_ANGULAR_VELOCITY (deg/s)")
+    parser.add_argument("--max-ambiguity", type=float, help="override VISION_MAX_AMBIGUITY")
+    parser.add_argument("--mahalanobis", type=float, help="override the odometry gate (std devs)")
+    args = parser.parse_args()
+
+    overrides = {
+        "VISION_MAX_TAG_DISTANCE": args.max_tag_distance,
+        "VISION_MAX_ANGULAR_VELOCITY": args.max_angular_velocity,
+        "VISION_MAX_AMBIGUITY": args.max_ambiguity,
+        "MAX_MAHALANOBIS": args.mahalanobis,
+    }
+    for name, value in overrides.items():
+        if value is not None:
+            setattr(vision_module, name, value)
+            print(f"{name} = {value}")
+
+    replay(_read_log(args.log), args.csv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Generate the shot-zone map: rasterize the field and mark every cell a stationary
+shot at each alliance hub can be made from (shot map range, shooter RPM and hood
+limits — see shot_feasible_many() in commands/hub_shot.py).
+
+Writes deploy/shot_zones.bin, which the robot loads at startup. Re-run after
+changing SHOT_TABLE or the limits; a stale file is detected and rebuilt in memory.
+
+Usage:
+    python tools/shot_heatmap.py
+    python tools/shot_heatmap.py --resolution 0.05 --png shot_zones.png
+"""
+
+import argparse
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from commands.hub_shot import (
+    BLUE_HUB,
+    RED_HUB,
+    SHOT_MAP,
+    SHOT_ZONE_PATH,
+    SHOT_ZONE_RESOLUTION_M,
+    build_shot_zones,
+)
+from modules.shot_zone import ShotZoneMap
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# PNG colors (R, G, B)
+_EMPTY = (40, 40, 40)
+_BLUE = (40, 90, 230)
+_RED = (220, 50, 50)
+_BOTH = (180, 60, 200)
+_HUB = (255, 255, 255)
+
+
+def _write_png(zones: ShotZoneMap, path: Path, scale: int) -> None:
+    """Blue/red/purple = shootable for blue/red/both hubs, +y up, one cell = scale pixels."""
+    hub_cells = {(int(hub.Y() / zones.resolution), int(hub.X() / zones.resolution)) for hub in (BLUE_HUB, RED_HUB)}
+    raw = bytearray()
+    for row in reversed(range(zones.rows)):
+        line = bytearray([0])  # filter: none
+        for col in range(zones.cols):
+            if (row, col) in hub_cells:
+                color = _HUB
+            else:
+                color = (_EMPTY, _BLUE, _RED, _BOTH)[zones.blue[row, col] + 2 * zones.red[row, col]]
+            line += bytes(color) * scale
+        raw += bytes(line) * scale
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    header = struct.pack(">IIBBBBB", zones.cols * scale, zones.rows * scale, 8, 2, 0, 0, 0)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", header))
+        f.write(chunk(b"IDAT", zlib.compress(bytes(raw), 9)))
+        f.write(chunk(b"IEND", b""))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--resolution", type=float, default=SHOT_ZONE_RESOLUTION_M, help="cell size (m)")
+    # getDeployDirectory() is relative to the running script off-robot — point at the repo's deploy/
+    parser.add_argument("--out", type=Path, default=REPO_ROOT / "deploy" / SHOT_ZONE_PATH.name, help="robot map")
+    parser.add_argument("--png", type=Path, help="also write a PNG preview")
+    parser.add_argument("--scale", type=int, default=4, help="PNG pixels per cell")
+    args = parser.parse_args()
+
+    zones = build_shot_zones(args.resolution)
+    zones.write(args.out)
+    print(f"Shot map: {len(SHOT_MAP.points)} points ({SHOT_MAP.source}), signature {zones.signature:08x}")
+    print(f"Grid: {zones.cols} x {zones.rows} cells at {zones.resolution:.3f} m")
+    print(f"Shootable: blue {zones.fraction():.1%}, red {zones.fraction(red=True):.1%} of the field")
+    print(f"Wrote {args.out} ({args.out.stat().st_size} bytes)")
+    if args.png:
+        _write_png(zones, args.png, args.scale)
+        print(f"Wrote {args.png}")
+
+
+if __name__ == "__main__":
+    main()